@@ -24,22 +24,34 @@ Example:
 from .instruction import (
     BinaryInstruction,
     BinaryNumber,
+    BinaryNumberArray,
     OperationEnum,
     OperationType)
-from .calculator import ArithmeticCalculator
-from .converter import BinaryConverter
+from .calculator import (
+    ArithmeticCalculator,
+    ConstantMultiplier,
+    PreparedDivisor)
+from .converter import BinaryConverter, RadixPowerCache
 from .normalizer import BinaryNormalizer
 from .comparator import BinaryComparator
 from .executor import InstructionExecutor
+from .limbs import BinaryPacker, LimbArithmetic, MontgomeryContext
 
 __all__ = [
     'BinaryInstruction',
     'BinaryNumber',
+    'BinaryNumberArray',
     'ArithmeticCalculator',
+    'ConstantMultiplier',
+    'PreparedDivisor',
     'InstructionExecutor',
     'BinaryConverter',
+    'RadixPowerCache',
     'BinaryNormalizer',
     'BinaryComparator',
+    'BinaryPacker',
+    'LimbArithmetic',
+    'MontgomeryContext',
     'OperationEnum',
     'OperationType']
 __version__ = '1.0.0'
@@ -1,6 +1,8 @@
 """Binary calculator module."""
 
 from .arithmetic_calculator import ArithmeticCalculator
+from .constant_multiplier import ConstantMultiplier
+from .prepared_divisor import PreparedDivisor
 
-__all__ = ['ArithmeticCalculator']
+__all__ = ['ArithmeticCalculator', 'ConstantMultiplier', 'PreparedDivisor']
 
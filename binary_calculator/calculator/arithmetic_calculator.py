@@ -1,8 +1,17 @@
 """Arithmetic calculator class for binary arithmetic operations."""
 
+import typing as p_typ
 from ..normalizer import BinaryNormalizer
 from ..comparator import BinaryComparator
 from ..instruction import BinaryNumber
+from ..limbs import (
+    BinaryPacker,
+    LimbArithmetic,
+    MontgomeryContext,
+    NumberTheoreticTransform,
+    LIMB_BITS)
+from .constant_multiplier import ConstantMultiplier
+from .prepared_divisor import PreparedDivisor
 
 
 class ArithmeticCalculator:
@@ -11,42 +20,208 @@ class ArithmeticCalculator:
     This calculator performs pure binary arithmetic directly on binary strings
     without converting to decimal, following the patterns of 0 and 1.
     
+    Addition and subtraction run in one of two modes:
+        - 'chunked' (default): The normalized operands are processed in
+          CHUNK_BITS-wide slices with carry/borrow propagation between
+          slices, so the loop runs once per chunk instead of once per bit
+        - 'reference': The original bit-by-bit algorithms, kept for
+          verification and teaching purposes
+    
     Operations:
-        - Addition: Bit-by-bit with carry propagation
-        - Subtraction: Bit-by-bit with borrow handling
-        - Multiplication: Shift-and-add algorithm
-        - Division: Binary long division
+        - Addition: Bit-by-bit with carry propagation; carry-save
+          accumulation for many operands via sum_many()
+        - Subtraction: Bit-by-bit with borrow handling (negative results
+          detected from the final borrow in 'chunked' mode)
+        - Multiplication: Shift-and-add algorithm, Karatsuba, Toom-3 and
+          NTT for large operands; fused multiply-add via multiply_add(),
+          product trees for many factors via product_many()
+        - Division: Binary long division, Burnikel-Ziegler recursive
+          division for large divisors, Newton-Raphson reciprocal for huge
+          divisors (quotient and remainder from one pass via divmod())
+        - Exponentiation: Left-to-right sliding-window exponentiation
+        - Modular exponentiation: Montgomery multiplication for odd moduli
+          (see MontgomeryContext), plain reduction for even moduli
+        - GCD: Stein's binary GCD for small operands, Lehmer's algorithm
+          for large ones; lcm() and extended_gcd() build on it
+        - Roots and logarithms: Precision-doubling Newton iteration for
+          isqrt(), floor_log2()/ceil_log2() read off the bit length
+    
+    When either operand uses the packed storage backend, the same
+    algorithms run on 64-bit limbs (see LimbArithmetic) and the result is
+    returned packed as well.
     """
     
-    def __init__(self) -> None:
-        """Initialize the arithmetic calculator with helper objects."""
+    MODES = ('chunked', 'reference')
+    CHUNK_BITS = 60
+    MULTIPLY_ALGORITHMS = (
+        'shift_add', 'schoolbook', 'karatsuba', 'toom3', 'ntt')
+    KARATSUBA_THRESHOLD = 2048
+    TOOM3_THRESHOLD = 8192
+    NTT_THRESHOLD = 65536
+    DIVIDE_ALGORITHMS = ('long', 'schoolbook', 'burnikel_ziegler', 'newton')
+    NEWTON_THRESHOLD = 4194304
+    LEHMER_THRESHOLD = 128
+    
+    def __init__(
+            self,
+            *,
+            mode: str = 'chunked',
+            karatsuba_threshold: int = KARATSUBA_THRESHOLD,
+            toom3_threshold: int = TOOM3_THRESHOLD,
+            ntt_threshold: int = NTT_THRESHOLD,
+            newton_threshold: int = NEWTON_THRESHOLD,
+            lehmer_threshold: int = LEHMER_THRESHOLD) -> None:
+        """Initialize the arithmetic calculator with helper objects.
+        
+        Args:
+            mode: Default mode for addition and subtraction
+                ('chunked' or 'reference')
+            karatsuba_threshold: Bit length of the smaller factor from
+                which multiply() switches to Karatsuba, and of the divisor
+                from which divide() switches to Burnikel-Ziegler
+            toom3_threshold: Bit length of the smaller factor from which
+                multiply() switches to Toom-Cook 3-way
+            ntt_threshold: Bit length of the smaller factor from which
+                multiply() switches to the number-theoretic transform
+            newton_threshold: Bit length of the divisor from which
+                divide() switches to Newton-Raphson reciprocal division
+            lehmer_threshold: Bit length of the smaller operand from which
+                gcd() switches from Stein's binary GCD to Lehmer's
+                algorithm
+            
+        Raises:
+            ValueError: If mode is not supported or a threshold is not
+                positive
+        """
         self._normalizer = BinaryNormalizer()
         self._comparator = BinaryComparator()
+        self._mode = self._resolve_mode(mode=mode)
+        self._karatsuba_threshold = self._validate_threshold(
+            name='karatsuba_threshold',
+            threshold=karatsuba_threshold)
+        self._toom3_threshold = self._validate_threshold(
+            name='toom3_threshold',
+            threshold=toom3_threshold)
+        self._ntt_threshold = self._validate_threshold(
+            name='ntt_threshold',
+            threshold=ntt_threshold)
+        self._newton_threshold = self._validate_threshold(
+            name='newton_threshold',
+            threshold=newton_threshold)
+        self._lehmer_threshold = self._validate_threshold(
+            name='lehmer_threshold',
+            threshold=lehmer_threshold)
+        self._karatsuba_limbs = -(-karatsuba_threshold // LIMB_BITS)
+        self._toom3_limbs = -(-toom3_threshold // LIMB_BITS)
+    
+    @property
+    def mode(self) -> str:
+        """Get the default mode for addition and subtraction.
+        
+        Returns:
+            'chunked' or 'reference'
+        """
+        return self._mode
     
     def add(
             self,
             *,
             operand_1: BinaryNumber,
-            operand_2: BinaryNumber) -> BinaryNumber:
+            operand_2: BinaryNumber,
+            mode: p_typ.Optional[str] = None) -> BinaryNumber:
         """Add two binary numbers using binary addition algorithm.
         
-        Performs bit-by-bit addition with carry, following the rules:
+        Performs addition with carry, following the rules:
         - 0 + 0 = 0 (carry 0)
         - 0 + 1 = 1 (carry 0)
         - 1 + 0 = 1 (carry 0)
         - 1 + 1 = 0 (carry 1)
         
+        In 'chunked' mode the rules are applied to CHUNK_BITS bits at a
+        time and only the carry out of each chunk is propagated. In
+        'reference' mode every bit is processed individually.
+        
         Args:
             operand_1: First binary number as BinaryNumber object
             operand_2: Second binary number as BinaryNumber object
+            mode: Addition mode, defaults to the calculator mode
             
         Returns:
             Sum as BinaryNumber object
+            
+        Raises:
+            ValueError: If mode is not supported
+        """
+        mode = self._resolve_mode(mode=mode)
+        if self._is_packed(operand_1=operand_1, operand_2=operand_2):
+            return BinaryNumber.from_limbs(limbs=LimbArithmetic.add(
+                limbs_1=operand_1.limbs,
+                limbs_2=operand_2.limbs))
+        
+        if mode == 'reference':
+            result_binary = self._add_reference(
+                binary_1=operand_1.value,
+                binary_2=operand_2.value)
+        else:
+            result_binary = self._add_chunked(
+                binary_1=operand_1.value,
+                binary_2=operand_2.value)
+        return BinaryNumber(binary_str=result_binary)
+    
+    def sum_many(
+            self,
+            *,
+            operands: p_typ.Iterable[BinaryNumber]) -> BinaryNumber:
+        """Add any number of binary numbers.
+        
+        Instead of K - 1 chained add() calls, each of which creates and
+        validates an intermediate BinaryNumber, the operands are accumulated
+        in carry-save form with a single carry-propagating pass at the end
+        (see LimbArithmetic.add_many). operands may be a generator; it is
+        consumed one number at a time, so the memory use does not depend on
+        the number of operands.
+        
+        Args:
+            operands: Iterable of BinaryNumber objects
+            
+        Returns:
+            Sum as BinaryNumber object (packed if any operand is packed,
+            zero for no operands)
+            
+        Example:
+            >>> calculator = ArithmeticCalculator()
+            >>> calculator.sum_many(operands=(
+            ...     BinaryNumber.from_int(decimal_num=size)
+            ...     for size in [4096, 512, 100])).to_int()
+            4708
+        """
+        packed = False
+        
+        def limbs_of(
+                numbers: p_typ.Iterable[BinaryNumber]
+                ) -> p_typ.Iterator[p_typ.Sequence[int]]:
+            nonlocal packed
+            for number in numbers:
+                packed = packed or number.is_packed
+                yield number.limbs
+        
+        limbs = LimbArithmetic.add_many(numbers=limbs_of(operands))
+        return self._from_limbs(limbs=limbs, packed=packed)
+    
+    def _add_reference(self, *, binary_1: str, binary_2: str) -> str:
+        """Add two binary strings bit by bit.
+        
+        Args:
+            binary_1: First binary string
+            binary_2: Second binary string
+            
+        Returns:
+            Sum as binary string without leading zeros
         """
         # Normalize lengths
         bin_1, bin_2 = self._normalizer.normalize_length(
-            binary_1=operand_1.value,
-            binary_2=operand_2.value)
+            binary_1=binary_1,
+            binary_2=binary_2)
         
         result = []
         carry = 0
@@ -69,45 +244,129 @@ class ArithmeticCalculator:
         
         # Reverse to get correct order and remove leading zeros
         result_str = ''.join(reversed(result))
-        result_binary = self._normalizer.remove_leading_zeros(
-            binary_str=result_str)
-        return BinaryNumber(binary_str=result_binary)
+        return self._normalizer.remove_leading_zeros(binary_str=result_str)
+    
+    def _add_chunked(self, *, binary_1: str, binary_2: str) -> str:
+        """Add two binary strings chunk by chunk.
+        
+        Each CHUNK_BITS-wide slice of both operands is added as one word;
+        the bits above the slice width form the carry into the next slice.
+        
+        Args:
+            binary_1: First binary string
+            binary_2: Second binary string
+            
+        Returns:
+            Sum as binary string without leading zeros
+        """
+        # Normalize lengths
+        bin_1, bin_2 = self._normalizer.normalize_length(
+            binary_1=binary_1,
+            binary_2=binary_2)
+        
+        chunk_bits = self.CHUNK_BITS
+        chunk_mask = (1 << chunk_bits) - 1
+        chunk_format = f'0{chunk_bits}b'
+        chunks = []
+        carry = 0
+        
+        # Process full chunks from right to left
+        end = len(bin_1)
+        while end >= chunk_bits:
+            start = end - chunk_bits
+            total = int(bin_1[start:end], 2) + int(bin_2[start:end], 2) + carry
+            chunks.append(format(total & chunk_mask, chunk_format))
+            carry = total >> chunk_bits
+            end = start
+        
+        # Most significant partial chunk (if any) absorbs the final carry
+        if end:
+            total = int(bin_1[:end], 2) + int(bin_2[:end], 2) + carry
+            chunks.append(format(total, f'0{end}b'))
+        elif carry:
+            chunks.append('1')
+        
+        result_str = ''.join(reversed(chunks))
+        return self._normalizer.remove_leading_zeros(binary_str=result_str)
     
     def subtract(
             self,
             *,
             operand_1: BinaryNumber,
-            operand_2: BinaryNumber) -> BinaryNumber:
+            operand_2: BinaryNumber,
+            mode: p_typ.Optional[str] = None) -> BinaryNumber:
         """Subtract second binary number from first using binary subtraction.
         
-        Performs bit-by-bit subtraction with borrow, following the rules:
+        Performs subtraction with borrow, following the rules:
         - 0 - 0 = 0 (borrow 0)
         - 1 - 0 = 1 (borrow 0)
         - 1 - 1 = 0 (borrow 0)
         - 0 - 1 = 1 (borrow 1, from next higher bit)
         
+        In 'chunked' mode the rules are applied to CHUNK_BITS bits at a
+        time and a negative result is detected from the borrow left over
+        after the most significant chunk, so no comparison pass is needed.
+        In 'reference' mode the operands are compared first and every bit
+        is processed individually.
+        
         Args:
             operand_1: First binary number as BinaryNumber object (minuend)
             operand_2: Second binary number as BinaryNumber object (subtrahend)
+            mode: Subtraction mode, defaults to the calculator mode
             
         Returns:
             Difference as BinaryNumber object
             
         Raises:
             ValueError: If result would be negative (operand_1 < operand_2)
+                or if mode is not supported
         """
-        # Check if result will be negative
-        if self._comparator.smaller(
+        mode = self._resolve_mode(mode=mode)
+        if self._is_packed(operand_1=operand_1, operand_2=operand_2):
+            result, borrow = LimbArithmetic.subtract_with_borrow(
+                limbs_1=operand_1.limbs,
+                limbs_2=operand_2.limbs)
+            if borrow:
+                raise ValueError(
+                    f"Cannot subtract: result would be negative "
+                    f"({operand_1.value} - {operand_2.value})")
+            return BinaryNumber.from_limbs(limbs=result)
+        
+        if mode == 'reference':
+            # Check if result will be negative
+            if self._comparator.smaller(
+                    binary_1=operand_1.value,
+                    binary_2=operand_2.value):
+                raise ValueError(
+                    f"Cannot subtract: result would be negative "
+                    f"({operand_1.value} - {operand_2.value})")
+            result_binary = self._subtract_reference(
                 binary_1=operand_1.value,
-                binary_2=operand_2.value):
-            raise ValueError(
-                f"Cannot subtract: result would be negative "
-                f"({operand_1.value} - {operand_2.value})")
+                binary_2=operand_2.value)
+        else:
+            result_binary, borrow = self._subtract_chunked(
+                binary_1=operand_1.value,
+                binary_2=operand_2.value)
+            if borrow:
+                raise ValueError(
+                    f"Cannot subtract: result would be negative "
+                    f"({operand_1.value} - {operand_2.value})")
+        return BinaryNumber(binary_str=result_binary)
+    
+    def _subtract_reference(self, *, binary_1: str, binary_2: str) -> str:
+        """Subtract two binary strings bit by bit.
         
+        Args:
+            binary_1: Minuend binary string (must be >= binary_2)
+            binary_2: Subtrahend binary string
+            
+        Returns:
+            Difference as binary string without leading zeros
+        """
         # Normalize lengths
         bin_1, bin_2 = self._normalizer.normalize_length(
-            binary_1=operand_1.value,
-            binary_2=operand_2.value)
+            binary_1=binary_1,
+            binary_2=binary_2)
         
         result = []
         borrow = 0
@@ -130,18 +389,88 @@ class ArithmeticCalculator:
         
         # Reverse and remove leading zeros
         result_str = ''.join(reversed(result))
-        result_binary = self._normalizer.remove_leading_zeros(
-            binary_str=result_str)
-        return BinaryNumber(binary_str=result_binary)
+        return self._normalizer.remove_leading_zeros(binary_str=result_str)
+    
+    def _subtract_chunked(
+            self,
+            *,
+            binary_1: str,
+            binary_2: str) -> p_typ.Tuple[str, int]:
+        """Subtract two binary strings chunk by chunk.
+        
+        Each CHUNK_BITS-wide slice of the subtrahend (plus the incoming
+        borrow) is subtracted from the matching slice of the minuend as one
+        word; a negative word borrows from the next slice.
+        
+        Args:
+            binary_1: Minuend binary string
+            binary_2: Subtrahend binary string
+            
+        Returns:
+            Tuple of (difference without leading zeros, final borrow). A
+            final borrow of 1 means binary_1 < binary_2.
+        """
+        # Normalize lengths
+        bin_1, bin_2 = self._normalizer.normalize_length(
+            binary_1=binary_1,
+            binary_2=binary_2)
+        
+        chunk_bits = self.CHUNK_BITS
+        chunk_base = 1 << chunk_bits
+        chunk_format = f'0{chunk_bits}b'
+        chunks = []
+        borrow = 0
+        
+        # Process full chunks from right to left
+        end = len(bin_1)
+        while end >= chunk_bits:
+            start = end - chunk_bits
+            diff = int(bin_1[start:end], 2) - int(bin_2[start:end], 2) - borrow
+            if diff < 0:
+                diff += chunk_base
+                borrow = 1
+            else:
+                borrow = 0
+            chunks.append(format(diff, chunk_format))
+            end = start
+        
+        # Most significant partial chunk (if any)
+        if end:
+            diff = int(bin_1[:end], 2) - int(bin_2[:end], 2) - borrow
+            if diff < 0:
+                diff += 1 << end
+                borrow = 1
+            else:
+                borrow = 0
+            chunks.append(format(diff, f'0{end}b'))
+        
+        result_str = ''.join(reversed(chunks))
+        return (
+            self._normalizer.remove_leading_zeros(binary_str=result_str),
+            borrow)
     
     def multiply(
             self,
             *,
             operand_1: BinaryNumber,
-            operand_2: BinaryNumber) -> BinaryNumber:
-        """Multiply two binary numbers using shift-and-add algorithm.
+            operand_2: BinaryNumber,
+            algorithm: p_typ.Optional[str] = None) -> BinaryNumber:
+        """Multiply two binary numbers.
         
-        Performs binary multiplication by:
+        The algorithm is chosen from the size of the smaller operand:
+        - Below karatsuba_threshold bits: shift-and-add for string operands
+          ('shift_add'), limb schoolbook for packed operands ('schoolbook')
+        - From karatsuba_threshold bits: Karatsuba ('karatsuba'), which
+          replaces four half-size products by three
+        - From toom3_threshold bits: Toom-Cook 3-way ('toom3'), which
+          replaces nine third-size products by five
+        - From ntt_threshold bits: multi-prime number-theoretic transform
+          ('ntt'), which computes the product in O(n log n)
+        
+        If both operands are the same object or equal, the product is
+        computed by square() with the selected tier (except 'shift_add').
+        
+        Shift-and-add works as follows:
         1. For each bit in operand_2 (from right to left):
         2. If bit is 1, add operand_1 (shifted appropriately) to result
         3. Shift operand_1 left for next iteration
@@ -149,15 +478,269 @@ class ArithmeticCalculator:
         Args:
             operand_1: First binary number as BinaryNumber (multiplicand)
             operand_2: Second binary number as BinaryNumber (multiplier)
+            algorithm: Force one of MULTIPLY_ALGORITHMS (e.g., for
+                benchmarking) instead of selecting by size
             
         Returns:
             Product as BinaryNumber object
+            
+        Raises:
+            ValueError: If algorithm is not supported
+        """
+        packed = self._is_packed(operand_1=operand_1, operand_2=operand_2)
+        algorithm = self._select_multiply_algorithm(
+            size=min(operand_1.bit_length(), operand_2.bit_length()),
+            packed=packed,
+            algorithm=algorithm)
+        
+        # x * x only needs about half the partial products
+        if algorithm != 'shift_add' and (
+                operand_1 is operand_2 or operand_1 == operand_2):
+            return self.square(operand=operand_1, algorithm=algorithm)
+        
+        if algorithm == 'shift_add':
+            result = self._multiply_shift_add(
+                operand_1=operand_1,
+                operand_2=operand_2)
+            return result.to_packed() if packed else result
+        
+        if algorithm == 'ntt':
+            limbs = NumberTheoreticTransform.multiply(
+                limbs_1=operand_1.limbs,
+                limbs_2=operand_2.limbs)
+        elif algorithm == 'toom3':
+            limbs = LimbArithmetic.multiply_toom3(
+                limbs_1=operand_1.limbs,
+                limbs_2=operand_2.limbs,
+                karatsuba_threshold=self._karatsuba_limbs,
+                toom3_threshold=self._toom3_limbs)
+        elif algorithm == 'karatsuba':
+            limbs = LimbArithmetic.multiply_karatsuba(
+                limbs_1=operand_1.limbs,
+                limbs_2=operand_2.limbs,
+                threshold=self._karatsuba_limbs)
+        else:
+            limbs = LimbArithmetic.multiply(
+                limbs_1=operand_1.limbs,
+                limbs_2=operand_2.limbs)
+        return self._from_limbs(limbs=limbs, packed=packed)
+    
+    def product_many(
+            self,
+            *,
+            operands: p_typ.Iterable[BinaryNumber]) -> BinaryNumber:
+        """Multiply any number of binary numbers with a product tree.
+        
+        A left fold multiplies an ever-growing product by small factors,
+        which keeps every step in the schoolbook tier and costs O(n^2)
+        overall. Here the factors are combined like a binary counter:
+        every new factor is merged with the pending product of the same
+        level, so each product is formed from two halves of similar size
+        and the Karatsuba, Toom-3 and NTT tiers do the large merges.
+        operands may be a generator; only one pending product per level is
+        kept.
+        
+        Args:
+            operands: Iterable of BinaryNumber objects
+            
+        Returns:
+            Product as BinaryNumber object (packed if any operand is packed,
+            one for no operands)
+            
+        Example:
+            >>> calculator = ArithmeticCalculator()
+            >>> calculator.product_many(operands=(
+            ...     BinaryNumber.from_int(decimal_num=factor)
+            ...     for factor in range(1, 11))).to_int()
+            3628800
+        """
+        packed = False
+        is_zero = False
+        stack: p_typ.List[p_typ.Tuple[int, p_typ.List[int]]] = []
+        for operand in operands:
+            packed = packed or operand.is_packed
+            limbs = list(operand.limbs)
+            if is_zero or not limbs:
+                # Keep consuming to settle the storage backend of the result
+                is_zero = True
+                continue
+            level = 0
+            while stack and stack[-1][0] == level:
+                _, pending = stack.pop()
+                limbs = self._multiply_limbs(limbs_1=pending, limbs_2=limbs)
+                level += 1
+            stack.append((level, limbs))
+        
+        if is_zero:
+            return self._from_limbs(limbs=[], packed=packed)
+        
+        # Fold the remaining levels from the smallest product upwards
+        result = [1]
+        while stack:
+            _, pending = stack.pop()
+            result = self._multiply_limbs(limbs_1=pending, limbs_2=result)
+        return self._from_limbs(limbs=result, packed=packed)
+    
+    def multiply_add(
+            self,
+            *,
+            operand_1: BinaryNumber,
+            operand_2: BinaryNumber,
+            operand_3: BinaryNumber) -> BinaryNumber:
+        """Compute operand_1 * operand_2 + operand_3 (fused multiply-add).
+        
+        Below karatsuba_threshold the addend seeds the accumulator of a
+        limb schoolbook product (see LimbArithmetic.multiply_add), so it is
+        absorbed by the partial-product carry chains instead of a second
+        addition pass. Larger factors use the multiplication tiers and add
+        operand_3 to the product limbs. Either way no intermediate
+        BinaryNumber is created, and string operands are processed on limbs
+        rather than by shift-and-add.
+        
+        Args:
+            operand_1: First factor as BinaryNumber (e.g., an index)
+            operand_2: Second factor as BinaryNumber (e.g., a stride)
+            operand_3: Addend as BinaryNumber (e.g., a base address)
+            
+        Returns:
+            operand_1 * operand_2 + operand_3 as BinaryNumber object (packed
+            if any operand is packed)
+            
+        Example:
+            >>> calculator = ArithmeticCalculator()
+            >>> calculator.multiply_add(
+            ...     operand_1=BinaryNumber(binary_str='11'),
+            ...     operand_2=BinaryNumber(binary_str='100'),
+            ...     operand_3=BinaryNumber(binary_str='1000')).value
+            '10100'
+        """
+        packed = (
+            self._is_packed(operand_1=operand_1, operand_2=operand_2)
+            or operand_3.is_packed)
+        limbs_1 = operand_1.limbs
+        limbs_2 = operand_2.limbs
+        size = min(len(limbs_1), len(limbs_2)) * LIMB_BITS
+        if size < self._karatsuba_threshold:
+            limbs = LimbArithmetic.multiply_add(
+                limbs_1=limbs_1,
+                limbs_2=limbs_2,
+                limbs_3=operand_3.limbs)
+        else:
+            limbs = LimbArithmetic.add(
+                limbs_1=self._multiply_limbs(
+                    limbs_1=limbs_1,
+                    limbs_2=limbs_2),
+                limbs_2=operand_3.limbs)
+        return self._from_limbs(limbs=limbs, packed=packed)
+    
+    def square(
+            self,
+            *,
+            operand: BinaryNumber,
+            algorithm: p_typ.Optional[str] = None) -> BinaryNumber:
+        """Square a binary number.
+        
+        Every tier exploits the symmetry of x * x: schoolbook computes each
+        cross product once and doubles it, Karatsuba and Toom-3 recurse into
+        squares of a single evaluated operand, and the NTT transforms the
+        operand only once. The tier is chosen from the bit length of operand
+        with the same thresholds as multiply(); below karatsuba_threshold
+        schoolbook squaring is used for both storage backends.
+        
+        Args:
+            operand: Binary number to square
+            algorithm: Force one of MULTIPLY_ALGORITHMS instead of selecting
+                by size ('shift_add' multiplies without squaring)
+            
+        Returns:
+            Square as BinaryNumber object
+            
+        Raises:
+            ValueError: If algorithm is not supported
+            
+        Example:
+            >>> calculator = ArithmeticCalculator()
+            >>> calculator.square(operand=BinaryNumber(binary_str='101')).value
+            '11001'
+        """
+        packed = operand.is_packed
+        algorithm = self._select_multiply_algorithm(
+            size=operand.bit_length(),
+            packed=True,
+            algorithm=algorithm)
+        
+        if algorithm == 'shift_add':
+            result = self._multiply_shift_add(
+                operand_1=operand,
+                operand_2=operand)
+            return result.to_packed() if packed else result
+        
+        limbs = operand.limbs
+        if algorithm == 'ntt':
+            limbs = NumberTheoreticTransform.square(limbs=limbs)
+        elif algorithm == 'toom3':
+            limbs = LimbArithmetic.square_toom3(
+                limbs=limbs,
+                karatsuba_threshold=self._karatsuba_limbs,
+                toom3_threshold=self._toom3_limbs)
+        elif algorithm == 'karatsuba':
+            limbs = LimbArithmetic.square_karatsuba(
+                limbs=limbs,
+                threshold=self._karatsuba_limbs)
+        else:
+            limbs = LimbArithmetic.square(limbs=limbs)
+        return self._from_limbs(limbs=limbs, packed=packed)
+    
+    def compile_multiplier(
+            self,
+            *,
+            multiplier: BinaryNumber) -> ConstantMultiplier:
+        """Compile a constant factor for repeated multiplication.
+        
+        The returned ConstantMultiplier recodes the constant once into
+        canonical signed digits (non-adjacent form) and multiplies by a
+        shift/add/subtract chain if the constant is sparse (see
+        ConstantMultiplier.uses_chain()), or by this calculator's
+        multiplication tiers otherwise. It is callable with a
+        single BinaryNumber.
+        
+        Args:
+            multiplier: Constant factor as BinaryNumber
+            
+        Returns:
+            ConstantMultiplier for multiplier
+            
+        Example:
+            >>> calculator = ArithmeticCalculator()
+            >>> times_255 = calculator.compile_multiplier(
+            ...     multiplier=BinaryNumber(binary_str='11111111'))
+            >>> times_255(BinaryNumber(binary_str='11')).value
+            '1011111101'
+        """
+        return ConstantMultiplier(
+            multiplier=multiplier,
+            multiply=self._multiply_limbs)
+    
+    def _multiply_shift_add(
+            self,
+            *,
+            operand_1: BinaryNumber,
+            operand_2: BinaryNumber) -> BinaryNumber:
+        """Multiply two binary strings using the shift-and-add algorithm.
+        
+        Args:
+            operand_1: Multiplicand
+            operand_2: Multiplier
+            
+        Returns:
+            Product as string-backed BinaryNumber object
         """
         # Handle zero cases
         if operand_1.value == '0' or operand_2.value == '0':
             return BinaryNumber(binary_str='0')
         
         result = BinaryNumber(binary_str='0')
+        operand_1_val = operand_1.value
         operand_2_val = operand_2.value
         
         # Process multiplier from right to left
@@ -165,7 +748,7 @@ class ArithmeticCalculator:
             if operand_2_val[i] == '1':
                 # Shift operand_1 left by (len - 1 - i) positions
                 shift_amount = len(operand_2_val) - 1 - i
-                shifted = operand_1.value + ('0' * shift_amount)
+                shifted = operand_1_val + ('0' * shift_amount)
                 
                 # Add to result
                 result = self.add(
@@ -174,25 +757,233 @@ class ArithmeticCalculator:
         
         return result
     
+    def _select_multiply_algorithm(
+            self,
+            *,
+            size: int,
+            packed: bool,
+            algorithm: p_typ.Optional[str]) -> str:
+        """Select the multiplication algorithm for an operand size.
+        
+        Args:
+            size: Bit length of the smaller factor
+            packed: True if the result stays on the packed backend
+            algorithm: Explicitly requested algorithm, or None
+            
+        Returns:
+            Name of the algorithm to use
+            
+        Raises:
+            ValueError: If algorithm is not supported
+        """
+        if algorithm is not None:
+            if algorithm not in self.MULTIPLY_ALGORITHMS:
+                raise ValueError(
+                    f"Invalid multiplication algorithm: '{algorithm}'. "
+                    f"Must be one of {list(self.MULTIPLY_ALGORITHMS)}")
+            return algorithm
+        
+        if size >= self._ntt_threshold:
+            return 'ntt'
+        if size >= self._toom3_threshold:
+            return 'toom3'
+        if size >= self._karatsuba_threshold:
+            return 'karatsuba'
+        if packed:
+            return 'schoolbook'
+        return 'shift_add'
+    
     def divide(
             self,
             *,
             operand_1: BinaryNumber,
-            operand_2: BinaryNumber) -> BinaryNumber:
-        """Divide first binary number by second using long division algorithm.
+            operand_2: BinaryNumber,
+            algorithm: p_typ.Optional[str] = None) -> BinaryNumber:
+        """Divide first binary number by second.
+        
+        See divmod() for the division algorithms.
+        
+        Args:
+            operand_1: First binary number as BinaryNumber (dividend)
+            operand_2: Second binary number as BinaryNumber (divisor)
+            algorithm: Force one of DIVIDE_ALGORITHMS (e.g., for
+                benchmarking) instead of selecting by size
+            
+        Returns:
+            Quotient as BinaryNumber object (integer division)
+            
+        Raises:
+            ZeroDivisionError: If operand_2 is zero
+            ValueError: If algorithm is not supported
+        """
+        quotient, _ = self.divmod(
+            operand_1=operand_1,
+            operand_2=operand_2,
+            algorithm=algorithm)
+        return quotient
+    
+    def modulo(
+            self,
+            *,
+            operand_1: BinaryNumber,
+            operand_2: BinaryNumber,
+            algorithm: p_typ.Optional[str] = None) -> BinaryNumber:
+        """Get the remainder of dividing first binary number by second.
+        
+        See divmod() for the division algorithms.
+        
+        Args:
+            operand_1: First binary number as BinaryNumber (dividend)
+            operand_2: Second binary number as BinaryNumber (divisor)
+            algorithm: Force one of DIVIDE_ALGORITHMS (e.g., for
+                benchmarking) instead of selecting by size
+            
+        Returns:
+            Remainder as BinaryNumber object
+            
+        Raises:
+            ZeroDivisionError: If operand_2 is zero
+            ValueError: If algorithm is not supported
+        """
+        _, remainder = self.divmod(
+            operand_1=operand_1,
+            operand_2=operand_2,
+            algorithm=algorithm)
+        return remainder
+    
+    def divmod(
+            self,
+            *,
+            operand_1: BinaryNumber,
+            operand_2: BinaryNumber,
+            algorithm: p_typ.Optional[str] = None) -> p_typ.Tuple[
+                BinaryNumber, BinaryNumber]:
+        """Divide first binary number by second, keeping the remainder.
+        
+        Quotient and remainder come out of the same division pass, so
+        divmod() costs one division instead of divide(), multiply() and
+        subtract().
         
-        Performs binary long division:
+        The algorithm is chosen from the bit length of the divisor:
+        - Below karatsuba_threshold bits: binary long division for string
+          operands ('long'), limb-wise long division for packed operands
+          ('schoolbook')
+        - From karatsuba_threshold bits: Burnikel-Ziegler recursive
+          division ('burnikel_ziegler'), which splits the divisor in
+          halves down to karatsuba_threshold and spends its time in the
+          multiplication tiers
+        - From newton_threshold bits: division by a Newton-Raphson
+          reciprocal ('newton'), which reduces division to a few
+          multiplications using the fast multiplication tiers
+        
+        Binary long division works as follows:
         1. Start with most significant bit of dividend
         2. If current value >= divisor, subtract and add '1' to quotient
         3. Otherwise add '0' to quotient
-        4. Bring down next bit and repeat
+        4. Bring down next bit and repeat; the final value is the remainder
         
         Args:
             operand_1: First binary number as BinaryNumber (dividend)
             operand_2: Second binary number as BinaryNumber (divisor)
+            algorithm: Force one of DIVIDE_ALGORITHMS (e.g., for
+                benchmarking) instead of selecting by size
             
         Returns:
-            Quotient as BinaryNumber object (integer division)
+            Tuple of (quotient, remainder) as BinaryNumber objects
+            
+        Raises:
+            ZeroDivisionError: If operand_2 is zero
+            ValueError: If algorithm is not supported
+            
+        Example:
+            >>> calculator = ArithmeticCalculator()
+            >>> quotient, remainder = calculator.divmod(
+            ...     operand_1=BinaryNumber(binary_str='1011'),
+            ...     operand_2=BinaryNumber(binary_str='11'))
+            >>> quotient.value, remainder.value
+            ('11', '10')
+        """
+        packed = self._is_packed(operand_1=operand_1, operand_2=operand_2)
+        algorithm = self._select_divide_algorithm(
+            size=operand_2.bit_length(),
+            packed=packed,
+            algorithm=algorithm)
+        
+        if algorithm == 'long':
+            quotient, remainder = self._divide_long(
+                operand_1=operand_1,
+                operand_2=operand_2)
+            if packed:
+                return quotient.to_packed(), remainder.to_packed()
+            return quotient, remainder
+        
+        if algorithm == 'newton':
+            quotient_limbs, remainder_limbs = LimbArithmetic.divide_newton(
+                limbs_1=operand_1.limbs,
+                limbs_2=operand_2.limbs,
+                multiply=self._multiply_limbs,
+                base_limbs=self._karatsuba_limbs)
+        elif algorithm == 'burnikel_ziegler':
+            quotient_limbs, remainder_limbs = (
+                LimbArithmetic.divide_burnikel_ziegler(
+                    limbs_1=operand_1.limbs,
+                    limbs_2=operand_2.limbs,
+                    multiply=self._multiply_limbs,
+                    threshold=self._karatsuba_limbs))
+        else:
+            quotient_limbs, remainder_limbs = LimbArithmetic.divide(
+                limbs_1=operand_1.limbs,
+                limbs_2=operand_2.limbs)
+        return (
+            self._from_limbs(limbs=quotient_limbs, packed=packed),
+            self._from_limbs(limbs=remainder_limbs, packed=packed))
+    
+    def prepare_divisor(self, *, divisor: BinaryNumber) -> PreparedDivisor:
+        """Prepare a divisor for repeated division.
+        
+        The returned PreparedDivisor precomputes a Barrett reciprocal once
+        and then divides any dividend with two (truncated) multiplications
+        and a short correction, using this calculator's multiplication
+        tiers for large divisors. It also works on string operands, which
+        divmod() would otherwise divide bit by bit.
+        
+        Args:
+            divisor: Divisor as BinaryNumber
+            
+        Returns:
+            PreparedDivisor for divisor
+            
+        Raises:
+            ZeroDivisionError: If divisor is zero
+            
+        Example:
+            >>> calculator = ArithmeticCalculator()
+            >>> packet_size = calculator.prepare_divisor(
+            ...     divisor=BinaryNumber.from_int(decimal_num=8192))
+            >>> packet_size.divide(
+            ...     dividend=BinaryNumber.from_int(decimal_num=1048576)).value
+            '10000000'
+        """
+        return PreparedDivisor(
+            divisor=divisor,
+            multiply=self._multiply_limbs,
+            threshold=self._karatsuba_limbs)
+    
+    def _divide_long(
+            self,
+            *,
+            operand_1: BinaryNumber,
+            operand_2: BinaryNumber) -> p_typ.Tuple[
+                BinaryNumber, BinaryNumber]:
+        """Divide two binary strings using binary long division.
+        
+        Args:
+            operand_1: Dividend
+            operand_2: Divisor
+            
+        Returns:
+            Tuple of (quotient, remainder) as string-backed BinaryNumber
+            objects
             
         Raises:
             ZeroDivisionError: If operand_2 is zero
@@ -206,16 +997,20 @@ class ArithmeticCalculator:
         if self._comparator.smaller(
                 binary_1=operand_1.value,
                 binary_2=operand_2.value):
-            return BinaryNumber(binary_str='0')
+            return (
+                BinaryNumber(binary_str='0'),
+                BinaryNumber(binary_str=self._normalizer.remove_leading_zeros(
+                    binary_str=operand_1.value)))
         
         # If equal, result is 1
         if self._comparator.equal(
                 binary_1=operand_1.value,
                 binary_2=operand_2.value):
-            return BinaryNumber(binary_str='1')
+            return BinaryNumber(binary_str='1'), BinaryNumber(binary_str='0')
         
         quotient = []
         remainder = BinaryNumber(binary_str='0')
+        divisor = BinaryNumber(binary_str=operand_2.value)
         
         # Process each bit of dividend from left to right
         for bit in operand_1.value:
@@ -227,11 +1022,11 @@ class ArithmeticCalculator:
             # Check if remainder >= divisor
             if self._comparator.larger_equal(
                     binary_1=remainder.value,
-                    binary_2=operand_2.value):
+                    binary_2=divisor.value):
                 # Subtract divisor from remainder
                 remainder = self.subtract(
                     operand_1=remainder,
-                    operand_2=operand_2)
+                    operand_2=divisor)
                 quotient.append('1')
             else:
                 quotient.append('0')
@@ -239,5 +1034,570 @@ class ArithmeticCalculator:
         result = ''.join(quotient)
         result_binary = self._normalizer.remove_leading_zeros(
             binary_str=result)
-        return BinaryNumber(binary_str=result_binary)
-
+        return BinaryNumber(binary_str=result_binary), remainder
+    
+    def power(
+            self,
+            *,
+            operand_1: BinaryNumber,
+            operand_2: BinaryNumber) -> BinaryNumber:
+        """Raise first binary number to the power of the second.
+        
+        Uses left-to-right sliding-window exponentiation over the bits of
+        the exponent (see LimbArithmetic.power), so an e-bit exponent costs
+        about e squarings and e / (k + 1) multiplications for window size
+        k, all running through the size-selected multiplication tiers.
+        
+        Args:
+            operand_1: Base as BinaryNumber
+            operand_2: Exponent as BinaryNumber
+            
+        Returns:
+            operand_1 ** operand_2 as BinaryNumber object (0 ** 0 is 1)
+            
+        Example:
+            >>> calculator = ArithmeticCalculator()
+            >>> result = calculator.power(
+            ...     operand_1=BinaryNumber(binary_str='10'),
+            ...     operand_2=BinaryNumber(binary_str='10100'))
+            >>> print(result.to_int())
+            1048576
+        """
+        packed = self._is_packed(operand_1=operand_1, operand_2=operand_2)
+        limbs = LimbArithmetic.power(
+            base=list(operand_1.limbs),
+            exponent=operand_2.limbs,
+            one=[1],
+            multiply=lambda limbs_1, limbs_2: self._multiply_limbs(
+                limbs_1=limbs_1, limbs_2=limbs_2),
+            square=lambda limbs: self._multiply_limbs(
+                limbs_1=limbs, limbs_2=limbs))
+        return self._from_limbs(limbs=limbs, packed=packed)
+    
+    def pow_mod(
+            self,
+            *,
+            base: BinaryNumber,
+            exponent: BinaryNumber,
+            modulus: BinaryNumber,
+            context: p_typ.Optional[MontgomeryContext] = None
+            ) -> BinaryNumber:
+        """Raise base to exponent modulo modulus.
+        
+        Odd moduli use Montgomery multiplication (see MontgomeryContext),
+        so no step of the exponentiation divides by the modulus. Even
+        moduli fall back to sliding-window exponentiation with a division
+        after every product. Pass a prebuilt context to reuse its
+        precomputed constants across many exponentiations against the same
+        modulus.
+        
+        Args:
+            base: Base as BinaryNumber
+            exponent: Exponent as BinaryNumber
+            modulus: Modulus as BinaryNumber
+            context: Optional MontgomeryContext built for modulus
+            
+        Returns:
+            base ** exponent mod modulus as BinaryNumber object (packed if
+            any operand is packed)
+            
+        Raises:
+            ZeroDivisionError: If modulus is zero
+            ValueError: If context was built for a different modulus
+            
+        Example:
+            >>> calculator = ArithmeticCalculator()
+            >>> result = calculator.pow_mod(
+            ...     base=BinaryNumber(binary_str='101'),
+            ...     exponent=BinaryNumber(binary_str='11'),
+            ...     modulus=BinaryNumber(binary_str='10111'))
+            >>> print(result.value)
+            1010
+        """
+        packed = (
+            base.is_packed or exponent.is_packed or modulus.is_packed)
+        modulus_limbs = list(modulus.limbs)
+        if not modulus_limbs:
+            raise ZeroDivisionError("Cannot reduce modulo zero")
+        
+        if context is not None:
+            if context.modulus != modulus_limbs:
+                raise ValueError(
+                    "MontgomeryContext was built for a different modulus")
+            limbs = context.pow(base=base.limbs, exponent=exponent.limbs)
+        elif modulus_limbs == [1]:
+            limbs = []
+        elif modulus_limbs[0] & 1:
+            limbs = MontgomeryContext(modulus=modulus_limbs).pow(
+                base=base.limbs,
+                exponent=exponent.limbs)
+        else:
+            limbs = self._pow_mod_plain(
+                base=base.limbs,
+                exponent=exponent.limbs,
+                modulus=modulus_limbs)
+        return self._from_limbs(limbs=limbs, packed=packed)
+    
+    def _pow_mod_plain(
+            self,
+            *,
+            base: p_typ.Sequence[int],
+            exponent: p_typ.Sequence[int],
+            modulus: p_typ.List[int]) -> p_typ.List[int]:
+        """Raise base to exponent modulo any modulus by plain reduction.
+        
+        Args:
+            base: Base as limbs
+            exponent: Exponent as limbs
+            modulus: Non-zero modulus as trimmed limbs
+            
+        Returns:
+            Result as trimmed limb list
+        """
+        def reduce(limbs: p_typ.Sequence[int]) -> p_typ.List[int]:
+            _, remainder = LimbArithmetic.divide_burnikel_ziegler(
+                limbs_1=limbs,
+                limbs_2=modulus,
+                multiply=self._multiply_limbs,
+                threshold=self._karatsuba_limbs)
+            return remainder
+        
+        return LimbArithmetic.power(
+            base=reduce(base),
+            exponent=exponent,
+            one=reduce([1]),
+            multiply=lambda limbs_1, limbs_2: reduce(self._multiply_limbs(
+                limbs_1=limbs_1, limbs_2=limbs_2)),
+            square=lambda limbs: reduce(self._multiply_limbs(
+                limbs_1=limbs, limbs_2=limbs)))
+    
+    def gcd(
+            self,
+            *,
+            operand_1: BinaryNumber,
+            operand_2: BinaryNumber) -> BinaryNumber:
+        """Compute the greatest common divisor of two binary numbers.
+        
+        Below lehmer_threshold bits (of the smaller operand) Stein's binary
+        GCD runs on shifts and subtractions only. Larger operands use
+        Lehmer's algorithm, which advances Euclid's algorithm a whole
+        machine word of quotients per pass over the numbers.
+        
+        Args:
+            operand_1: First binary number as BinaryNumber
+            operand_2: Second binary number as BinaryNumber
+            
+        Returns:
+            gcd(operand_1, operand_2) as BinaryNumber object (gcd(0, 0) is
+            0)
+            
+        Example:
+            >>> calculator = ArithmeticCalculator()
+            >>> result = calculator.gcd(
+            ...     operand_1=BinaryNumber(binary_str='11000'),
+            ...     operand_2=BinaryNumber(binary_str='10010'))
+            >>> print(result.value)
+            110
+        """
+        packed = self._is_packed(operand_1=operand_1, operand_2=operand_2)
+        return self._from_limbs(
+            limbs=self._gcd_limbs(
+                limbs_1=operand_1.limbs,
+                limbs_2=operand_2.limbs),
+            packed=packed)
+    
+    def lcm(
+            self,
+            *,
+            operand_1: BinaryNumber,
+            operand_2: BinaryNumber) -> BinaryNumber:
+        """Compute the least common multiple of two binary numbers.
+        
+        Computed as operand_1 / gcd * operand_2, so the division only sees
+        the first operand and the product never exceeds the result.
+        
+        Args:
+            operand_1: First binary number as BinaryNumber
+            operand_2: Second binary number as BinaryNumber
+            
+        Returns:
+            lcm(operand_1, operand_2) as BinaryNumber object (0 if either
+            operand is 0)
+            
+        Example:
+            >>> calculator = ArithmeticCalculator()
+            >>> result = calculator.lcm(
+            ...     operand_1=BinaryNumber.from_int(decimal_num=4096),
+            ...     operand_2=BinaryNumber.from_int(decimal_num=1500))
+            >>> print(result.to_int())
+            1536000
+        """
+        packed = self._is_packed(operand_1=operand_1, operand_2=operand_2)
+        if not operand_1.limbs or not operand_2.limbs:
+            return self._from_limbs(limbs=[], packed=packed)
+        
+        divisor = self._gcd_limbs(
+            limbs_1=operand_1.limbs,
+            limbs_2=operand_2.limbs)
+        quotient, _ = LimbArithmetic.divide_burnikel_ziegler(
+            limbs_1=operand_1.limbs,
+            limbs_2=divisor,
+            multiply=self._multiply_limbs,
+            threshold=self._karatsuba_limbs)
+        return self._from_limbs(
+            limbs=self._multiply_limbs(
+                limbs_1=quotient,
+                limbs_2=operand_2.limbs),
+            packed=packed)
+    
+    def extended_gcd(
+            self,
+            *,
+            operand_1: BinaryNumber,
+            operand_2: BinaryNumber) -> p_typ.Tuple[
+                BinaryNumber, BinaryNumber, BinaryNumber]:
+        """Compute the GCD together with Bezout coefficients.
+        
+        BinaryNumber is unsigned, so the coefficients are returned in the
+        form operand_1 * x - operand_2 * y = gcd with 1 <= x <=
+        operand_2 / gcd and y >= 0. In particular x is the inverse of
+        operand_1 modulo operand_2 when the gcd is 1. The coefficients come
+        from Lehmer's algorithm (see LimbArithmetic.extended_gcd).
+        
+        Args:
+            operand_1: First binary number as BinaryNumber (non-zero unless
+                operand_2 is zero)
+            operand_2: Second binary number as BinaryNumber
+            
+        Returns:
+            Tuple of (gcd, x, y) as BinaryNumber objects
+            
+        Raises:
+            ValueError: If operand_1 is zero and operand_2 is not (then
+                no coefficients with y >= 0 exist)
+            
+        Example:
+            >>> calculator = ArithmeticCalculator()
+            >>> gcd, x, y = calculator.extended_gcd(
+            ...     operand_1=BinaryNumber.from_int(decimal_num=240),
+            ...     operand_2=BinaryNumber.from_int(decimal_num=46))
+            >>> gcd.to_int(), x.to_int(), y.to_int()
+            (2, 14, 73)
+        """
+        packed = self._is_packed(operand_1=operand_1, operand_2=operand_2)
+        limbs_1 = operand_1.limbs
+        limbs_2 = operand_2.limbs
+        if not limbs_2:
+            return (
+                self._from_limbs(limbs=limbs_1, packed=packed),
+                self._from_limbs(limbs=[1], packed=packed),
+                self._from_limbs(limbs=[], packed=packed))
+        if not limbs_1:
+            raise ValueError(
+                "extended_gcd requires a non-zero operand_1 when operand_2 "
+                "is non-zero")
+        
+        divisor, (sign, coefficient), _ = LimbArithmetic.extended_gcd(
+            limbs_1=limbs_1,
+            limbs_2=limbs_2)
+        
+        # Move x into [1, operand_2 / gcd]
+        period, _ = LimbArithmetic.divide(limbs_1=limbs_2, limbs_2=divisor)
+        _, coefficient = LimbArithmetic.divide(
+            limbs_1=coefficient,
+            limbs_2=period)
+        if sign < 0 and coefficient:
+            coefficient = LimbArithmetic.subtract(
+                limbs_1=period,
+                limbs_2=coefficient)
+        if not coefficient:
+            coefficient = period
+        
+        # y = (operand_1 * x - gcd) / operand_2, an exact division
+        cofactor, _ = LimbArithmetic.divide_burnikel_ziegler(
+            limbs_1=LimbArithmetic.subtract(
+                limbs_1=self._multiply_limbs(
+                    limbs_1=limbs_1,
+                    limbs_2=coefficient),
+                limbs_2=divisor),
+            limbs_2=limbs_2,
+            multiply=self._multiply_limbs,
+            threshold=self._karatsuba_limbs)
+        return (
+            self._from_limbs(limbs=divisor, packed=packed),
+            self._from_limbs(limbs=coefficient, packed=packed),
+            self._from_limbs(limbs=cofactor, packed=packed))
+    
+    def isqrt(self, *, operand: BinaryNumber) -> BinaryNumber:
+        """Compute the integer square root of a binary number.
+        
+        Newton's iteration doubles its precision every step and divides
+        correspondingly truncated operands, so the whole root costs about
+        two full-size divisions through the fast division tiers (see
+        LimbArithmetic.isqrt).
+        
+        Args:
+            operand: Binary number as BinaryNumber
+            
+        Returns:
+            floor(sqrt(operand)) as BinaryNumber object
+            
+        Example:
+            >>> calculator = ArithmeticCalculator()
+            >>> result = calculator.isqrt(
+            ...     operand=BinaryNumber.from_int(decimal_num=1000000))
+            >>> print(result.to_int())
+            1000
+        """
+        return self._from_limbs(
+            limbs=LimbArithmetic.isqrt(
+                limbs=operand.limbs,
+                multiply=self._multiply_limbs,
+                threshold=self._karatsuba_limbs),
+            packed=operand.is_packed)
+    
+    def floor_log2(self, *, operand: BinaryNumber) -> BinaryNumber:
+        """Compute floor(log2(operand)) from the bit length.
+        
+        Args:
+            operand: Positive binary number as BinaryNumber
+            
+        Returns:
+            Position of the highest set bit as BinaryNumber object
+            
+        Raises:
+            ValueError: If operand is zero
+            
+        Example:
+            >>> calculator = ArithmeticCalculator()
+            >>> result = calculator.floor_log2(
+            ...     operand=BinaryNumber(binary_str='1100'))
+            >>> print(result.to_int())
+            3
+        """
+        bits = self._log2_bit_length(operand=operand)
+        return BinaryNumber.from_int(
+            decimal_num=bits - 1,
+            packed=operand.is_packed)
+    
+    def ceil_log2(self, *, operand: BinaryNumber) -> BinaryNumber:
+        """Compute ceil(log2(operand)) from the bit length.
+        
+        This is the number of levels (or address bits) needed to cover
+        operand items: the bit length, minus one if operand is a power of
+        two.
+        
+        Args:
+            operand: Positive binary number as BinaryNumber
+            
+        Returns:
+            Smallest k with 2 ** k >= operand as BinaryNumber object
+            
+        Raises:
+            ValueError: If operand is zero
+            
+        Example:
+            >>> calculator = ArithmeticCalculator()
+            >>> result = calculator.ceil_log2(
+            ...     operand=BinaryNumber(binary_str='1100'))
+            >>> print(result.to_int())
+            4
+        """
+        bits = self._log2_bit_length(operand=operand)
+        if operand.is_packed:
+            limbs = operand.limbs
+            power_of_two = (
+                not limbs[-1] & (limbs[-1] - 1) and not any(limbs[:-1]))
+        else:
+            power_of_two = '1' not in operand.value.lstrip('0')[1:]
+        return BinaryNumber.from_int(
+            decimal_num=bits - 1 if power_of_two else bits,
+            packed=operand.is_packed)
+    
+    @staticmethod
+    def _log2_bit_length(*, operand: BinaryNumber) -> int:
+        """Get the bit length of a logarithm operand.
+        
+        Args:
+            operand: Binary number as BinaryNumber
+            
+        Returns:
+            Bit length of operand
+            
+        Raises:
+            ValueError: If operand is zero
+        """
+        bits = operand.bit_length()
+        if not bits:
+            raise ValueError("Cannot take the logarithm of zero")
+        return bits
+    
+    def _gcd_limbs(
+            self,
+            *,
+            limbs_1: p_typ.Sequence[int],
+            limbs_2: p_typ.Sequence[int]) -> p_typ.List[int]:
+        """Compute a GCD with the algorithm matching the operand size.
+        
+        Args:
+            limbs_1: First number
+            limbs_2: Second number
+            
+        Returns:
+            GCD as trimmed limb list
+        """
+        size = min(
+            BinaryPacker.bit_length(limbs=limbs_1),
+            BinaryPacker.bit_length(limbs=limbs_2))
+        if size < self._lehmer_threshold:
+            return LimbArithmetic.gcd_binary(
+                limbs_1=limbs_1,
+                limbs_2=limbs_2)
+        return LimbArithmetic.gcd_lehmer(
+            limbs_1=limbs_1,
+            limbs_2=limbs_2,
+            threshold=-(-self._lehmer_threshold // LIMB_BITS))
+    
+    def _select_divide_algorithm(
+            self,
+            *,
+            size: int,
+            packed: bool,
+            algorithm: p_typ.Optional[str]) -> str:
+        """Select the division algorithm for a divisor size.
+        
+        Args:
+            size: Bit length of the divisor
+            packed: True if the result stays on the packed backend
+            algorithm: Explicitly requested algorithm, or None
+            
+        Returns:
+            Name of the algorithm to use
+            
+        Raises:
+            ValueError: If algorithm is not supported
+        """
+        if algorithm is not None:
+            if algorithm not in self.DIVIDE_ALGORITHMS:
+                raise ValueError(
+                    f"Invalid division algorithm: '{algorithm}'. "
+                    f"Must be one of {list(self.DIVIDE_ALGORITHMS)}")
+            return algorithm
+        
+        if size >= self._newton_threshold:
+            return 'newton'
+        if size >= self._karatsuba_threshold:
+            return 'burnikel_ziegler'
+        if packed:
+            return 'schoolbook'
+        return 'long'
+    
+    def _multiply_limbs(
+            self,
+            *,
+            limbs_1: p_typ.Sequence[int],
+            limbs_2: p_typ.Sequence[int]) -> p_typ.List[int]:
+        """Multiply two limb lists with the tier matching their size.
+        
+        This is the multiplication kernel handed to the division engines.
+        Identical arguments are squared.
+        
+        Args:
+            limbs_1: Multiplicand
+            limbs_2: Multiplier
+            
+        Returns:
+            Product as trimmed limb list
+        """
+        if limbs_1 is limbs_2:
+            size = len(limbs_1) * LIMB_BITS
+            if size >= self._ntt_threshold:
+                return NumberTheoreticTransform.square(limbs=limbs_1)
+            return LimbArithmetic.square_toom3(
+                limbs=limbs_1,
+                karatsuba_threshold=self._karatsuba_limbs,
+                toom3_threshold=self._toom3_limbs)
+        
+        size = min(len(limbs_1), len(limbs_2)) * LIMB_BITS
+        if size >= self._ntt_threshold:
+            return NumberTheoreticTransform.multiply(
+                limbs_1=limbs_1,
+                limbs_2=limbs_2)
+        return LimbArithmetic.multiply_toom3(
+            limbs_1=limbs_1,
+            limbs_2=limbs_2,
+            karatsuba_threshold=self._karatsuba_limbs,
+            toom3_threshold=self._toom3_limbs)
+    
+    def _resolve_mode(self, *, mode: p_typ.Optional[str]) -> str:
+        """Resolve and validate an addition/subtraction mode.
+        
+        Args:
+            mode: Requested mode, or None for the calculator default
+            
+        Returns:
+            Validated mode name
+            
+        Raises:
+            ValueError: If mode is not supported
+        """
+        if mode is None:
+            return self._mode
+        if mode not in self.MODES:
+            raise ValueError(
+                f"Invalid mode: '{mode}'. Must be one of {list(self.MODES)}")
+        return mode
+    
+    @staticmethod
+    def _validate_threshold(*, name: str, threshold: int) -> int:
+        """Validate an algorithm threshold.
+        
+        Args:
+            name: Parameter name used in the error message
+            threshold: Threshold in bits
+            
+        Returns:
+            The validated threshold
+            
+        Raises:
+            ValueError: If threshold is not a positive integer
+        """
+        if not isinstance(threshold, int) or threshold < 1:
+            raise ValueError(
+                f"{name} must be a positive number of bits, got {threshold}")
+        return threshold
+    
+    @staticmethod
+    def _from_limbs(
+            *,
+            limbs: p_typ.Sequence[int],
+            packed: bool) -> BinaryNumber:
+        """Wrap a limb kernel result in a BinaryNumber.
+        
+        Args:
+            limbs: Result limbs, least significant limb first
+            packed: If True, keep the packed backend, otherwise render the
+                result as a binary string
+            
+        Returns:
+            Result as BinaryNumber object
+        """
+        if packed:
+            return BinaryNumber.from_limbs(limbs=limbs)
+        return BinaryNumber(binary_str=BinaryPacker.unpack(limbs=limbs))
+    
+    @staticmethod
+    def _is_packed(
+            *,
+            operand_1: BinaryNumber,
+            operand_2: BinaryNumber) -> bool:
+        """Check if an operation should run on the packed limb backend.
+        
+        Args:
+            operand_1: First operand
+            operand_2: Second operand
+            
+        Returns:
+            True if either operand uses the packed storage backend
+        """
+        return operand_1.is_packed or operand_2.is_packed
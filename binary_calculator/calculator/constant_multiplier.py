@@ -0,0 +1,229 @@
+"""Constant multiplier class for repeated multiplication by a fixed factor."""
+
+import typing as p_typ
+from ..comparator import BinaryComparator
+from ..instruction import BinaryNumber
+from ..limbs import BinaryPacker, LimbArithmetic, LIMB_BITS
+
+MultiplyFunc = p_typ.Callable[..., p_typ.List[int]]
+
+
+class ConstantMultiplier:
+    """Multiplier compiled into a shift/add/subtract chain.
+    
+    The constant is recoded into its non-adjacent form (NAF), the canonical
+    signed-digit representation with digits -1, 0 and 1 and no two adjacent
+    non-zero digits. It has the fewest non-zero digits of any signed-digit
+    representation (about a third of the bits on average, against half for
+    plain binary), e.g. 0b111100 = 2 ** 6 - 2 ** 2. The product is then
+    evaluated from the top digit down (Horner's scheme):
+        acc = x
+        for every further digit: acc = (acc << gap) + digit * x
+        acc = acc << lowest digit position
+    Every partial sum is a positive multiple of x, so unsigned limb
+    additions and subtractions suffice.
+    
+    In pure Python a chain step (one shift and one addition) costs about
+    as much as one schoolbook row, i.e. one pass over the operand limbs
+    per limb of the constant. A constant is compiled into a chain when it
+    has at most one more non-zero digit than limbs (see is_chain), which
+    covers power-of-two strides and 2 ** k +- 1 for every k, e.g. 129,
+    2 ** 20 + 1 or 2 ** 40 - 1; denser constants such as 1000 (three
+    digits) always use the multiply kernel. A chain with that one extra
+    digit only pays off once its setup is amortized, so it is taken for
+    multiplicands of at least CHAIN_LIMBS limbs and smaller ones use the
+    kernel (see uses_chain()). Either way string operands are multiplied
+    on limbs instead of by bit-serial shift-and-add.
+    
+    Instances are callable, so they can be passed wherever a one-argument
+    function is expected.
+    
+    Example:
+        >>> times_1000 = ConstantMultiplier(
+        ...     multiplier=BinaryNumber.from_int(decimal_num=1000))
+        >>> times_1000.digits
+        ((10, 1), (5, -1), (3, 1))
+        >>> times_1000(BinaryNumber.from_int(decimal_num=7)).to_int()
+        7000
+    """
+    
+    CHAIN_LIMBS = 512
+    
+    def __init__(
+            self,
+            *,
+            multiplier: BinaryNumber,
+            multiply: MultiplyFunc = LimbArithmetic.multiply) -> None:
+        """Initialize the constant multiplier and compile its chain.
+        
+        Args:
+            multiplier: Constant factor as BinaryNumber
+            multiply: Multiplication kernel for dense constants, called as
+                multiply(limbs_1=..., limbs_2=...)
+        """
+        self._multiplier = multiplier
+        self._limbs = list(multiplier.limbs)
+        self._multiply = multiply
+        self._digits = self._recode(limbs=self._limbs)
+        self._is_chain = len(self._digits) <= len(self._limbs) + 1
+    
+    @property
+    def multiplier(self) -> BinaryNumber:
+        """Get the constant factor.
+        
+        Returns:
+            Constant factor as BinaryNumber object
+        """
+        return self._multiplier
+    
+    @property
+    def digits(self) -> p_typ.Tuple[p_typ.Tuple[int, int], ...]:
+        """Get the non-zero NAF digits of the constant.
+        
+        Returns:
+            Tuple of (bit position, sign) pairs, most significant first,
+            with sign 1 or -1
+        """
+        return tuple(self._digits)
+    
+    @property
+    def is_chain(self) -> bool:
+        """Check if products are evaluated by the shift/add/subtract chain.
+        
+        Returns:
+            True if the constant is sparse enough for the chain, False if
+            the multiply kernel is always used
+        """
+        return self._is_chain
+    
+    def uses_chain(self, *, size: int) -> bool:
+        """Check if a multiplicand of a given size takes the chain.
+        
+        Args:
+            size: Number of limbs of the multiplicand
+            
+        Returns:
+            True if multiply_limbs() evaluates the chain, False if it calls
+            the multiply kernel
+        """
+        return self._is_chain and (
+            len(self._digits) <= len(self._limbs)
+            or size >= self.CHAIN_LIMBS)
+    
+    def matches(self, *, operand: BinaryNumber) -> bool:
+        """Check if a number equals the constant factor.
+        
+        Args:
+            operand: Binary number to check
+            
+        Returns:
+            True if operand has the same value as the constant
+        """
+        return BinaryComparator.compare_limbs(
+            limbs_1=operand.limbs,
+            limbs_2=self._limbs) == 0
+    
+    def multiply(self, *, operand: BinaryNumber) -> BinaryNumber:
+        """Multiply a binary number by the constant.
+        
+        Args:
+            operand: Multiplicand as BinaryNumber
+            
+        Returns:
+            Product as BinaryNumber object (packed if operand or constant is
+            packed)
+        """
+        limbs = self.multiply_limbs(limbs=operand.limbs)
+        if operand.is_packed or self._multiplier.is_packed:
+            return BinaryNumber.from_limbs(limbs=limbs)
+        return BinaryNumber(binary_str=BinaryPacker.unpack(limbs=limbs))
+    
+    def multiply_limbs(self, *, limbs: p_typ.Sequence[int]) -> p_typ.List[int]:
+        """Multiply a limb list by the constant.
+        
+        Args:
+            limbs: Multiplicand, least significant limb first
+            
+        Returns:
+            Product as trimmed limb list
+        """
+        if not self.uses_chain(size=len(limbs)):
+            return self._multiply(limbs_1=limbs, limbs_2=self._limbs)
+        if not self._digits or not any(limbs):
+            return []
+        
+        limbs = list(limbs)
+        result = limbs
+        position = self._digits[0][0]
+        for next_position, sign in self._digits[1:]:
+            result = LimbArithmetic.shift_left(
+                limbs=result,
+                bits=position - next_position)
+            if sign > 0:
+                result = LimbArithmetic.add(limbs_1=result, limbs_2=limbs)
+            else:
+                result = LimbArithmetic.subtract(
+                    limbs_1=result,
+                    limbs_2=limbs)
+            position = next_position
+        return LimbArithmetic.shift_left(limbs=result, bits=position)
+    
+    def __call__(self, operand: BinaryNumber) -> BinaryNumber:
+        """Multiply a binary number by the constant (see multiply()).
+        
+        Args:
+            operand: Multiplicand as BinaryNumber
+            
+        Returns:
+            Product as BinaryNumber object
+        """
+        return self.multiply(operand=operand)
+    
+    def __repr__(self) -> str:
+        """Return the compiled chain as a signed sum of powers of two.
+        
+        Returns:
+            String such as "ConstantMultiplier(x<<10 - x<<5 + x<<3)"
+        """
+        terms = ''.join(
+            f"{' - ' if sign < 0 else ' + '}x<<{position}"
+            for position, sign in self._digits)
+        return f"ConstantMultiplier({terms[3:] or '0'})"
+    
+    @staticmethod
+    def _recode(
+            *,
+            limbs: p_typ.Sequence[int]) -> p_typ.List[p_typ.Tuple[int, int]]:
+        """Recode a number into its non-adjacent form.
+        
+        Scanning from the least significant bit with a carry, a digit is
+        non-zero only where bit + carry is odd: it is 1 if the next bit is
+        clear and -1 (carrying one upwards) if the next bit is set, which
+        turns every run of ones into 2 ** top - 2 ** bottom.
+        
+        Args:
+            limbs: Number to recode, least significant limb first
+            
+        Returns:
+            List of (bit position, sign) pairs, most significant first
+        """
+        digits = []
+        carry = 0
+        for index, limb in enumerate(limbs):
+            next_limb = limbs[index + 1] if index + 1 < len(limbs) else 0
+            window = limb | ((next_limb & 1) << LIMB_BITS)
+            for bit in range(LIMB_BITS):
+                value = ((window >> bit) & 1) + carry
+                if value == 1:
+                    if (window >> (bit + 1)) & 1:
+                        digits.append((index * LIMB_BITS + bit, -1))
+                        carry = 1
+                    else:
+                        digits.append((index * LIMB_BITS + bit, 1))
+                        carry = 0
+                elif value == 0:
+                    carry = 0
+        if carry:
+            digits.append((len(limbs) * LIMB_BITS, 1))
+        digits.reverse()
+        return digits
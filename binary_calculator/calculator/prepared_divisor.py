@@ -0,0 +1,253 @@
+"""Prepared divisor class for repeated division by a constant divisor."""
+
+import typing as p_typ
+from ..comparator import BinaryComparator
+from ..instruction import BinaryNumber
+from ..limbs import BinaryPacker, LimbArithmetic
+
+MultiplyFunc = p_typ.Callable[..., p_typ.List[int]]
+
+
+class PreparedDivisor:
+    """Divisor with a precomputed Barrett reciprocal.
+    
+    For a divisor d with n limbs and limb base b = 2 ** 64, the reciprocal
+    mu = floor(b ** (2n) / d) is computed once. A dividend x below
+    b ** (2n) is then divided with two multiplications and at most three
+    correction subtractions (Barrett reduction):
+        q = ((x >> 64 (n - 1)) * mu) >> 64 (n + 1)
+        r = x - q * d, then while r >= d: r -= d, q += 1
+    Longer dividends are processed in n-limb blocks from the top, carrying
+    the remainder into the next block.
+    
+    Single-limb divisors skip the reciprocal, since a one-pass limb-by-limb
+    division already costs a single machine division per limb.
+    
+    Example:
+        >>> prepared = PreparedDivisor(
+        ...     divisor=BinaryNumber.from_int(decimal_num=8192))
+        >>> quotient, remainder = prepared.divmod(
+        ...     dividend=BinaryNumber.from_int(decimal_num=1048577))
+        >>> quotient.to_int(), remainder.to_int()
+        (128, 1)
+    """
+    
+    def __init__(
+            self,
+            *,
+            divisor: BinaryNumber,
+            multiply: MultiplyFunc = LimbArithmetic.multiply,
+            threshold: int = 32) -> None:
+        """Initialize the prepared divisor and compute its reciprocal.
+        
+        Args:
+            divisor: Divisor as BinaryNumber
+            multiply: Multiplication kernel, called as
+                multiply(limbs_1=..., limbs_2=...)
+            threshold: Divisor size (in limbs) from which the reciprocal and
+                the Barrett products use the multiply kernel and
+                Burnikel-Ziegler division instead of truncated schoolbook
+                products
+            
+        Raises:
+            ZeroDivisionError: If divisor is zero
+        """
+        limbs = list(divisor.limbs)
+        if not limbs:
+            raise ZeroDivisionError("Cannot divide by zero")
+        
+        self._divisor = divisor
+        self._limbs = limbs
+        self._size = len(limbs)
+        self._multiply = multiply
+        self._threshold = threshold
+        self._reciprocal: p_typ.List[int] = []
+        if self._size > 1:
+            self._reciprocal, _ = LimbArithmetic.divide_burnikel_ziegler(
+                limbs_1=[0] * (2 * self._size) + [1],
+                limbs_2=limbs,
+                multiply=multiply,
+                threshold=threshold)
+    
+    @property
+    def divisor(self) -> BinaryNumber:
+        """Get the divisor.
+        
+        Returns:
+            Divisor as BinaryNumber object
+        """
+        return self._divisor
+    
+    @property
+    def limb_count(self) -> int:
+        """Get the number of limbs held by the divisor and its reciprocal.
+        
+        Returns:
+            Limb count of the stored divisor plus the reciprocal
+        """
+        return self._size + len(self._reciprocal)
+    
+    def matches(self, *, operand: BinaryNumber) -> bool:
+        """Check if a number equals the prepared divisor.
+        
+        Args:
+            operand: Binary number to check
+            
+        Returns:
+            True if operand has the same value as the divisor
+        """
+        return BinaryComparator.compare_limbs(
+            limbs_1=operand.limbs,
+            limbs_2=self._limbs) == 0
+    
+    def divide(self, *, dividend: BinaryNumber) -> BinaryNumber:
+        """Divide a binary number by the prepared divisor.
+        
+        Args:
+            dividend: Dividend as BinaryNumber
+            
+        Returns:
+            Quotient as BinaryNumber object (packed if dividend or divisor
+            is packed)
+        """
+        quotient, _ = self.divmod(dividend=dividend)
+        return quotient
+    
+    def modulo(self, *, dividend: BinaryNumber) -> BinaryNumber:
+        """Reduce a binary number modulo the prepared divisor.
+        
+        Args:
+            dividend: Dividend as BinaryNumber
+            
+        Returns:
+            Remainder as BinaryNumber object (packed if dividend or divisor
+            is packed)
+        """
+        _, remainder = self.divmod(dividend=dividend)
+        return remainder
+    
+    def divmod(
+            self,
+            *,
+            dividend: BinaryNumber) -> p_typ.Tuple[
+                BinaryNumber, BinaryNumber]:
+        """Divide a binary number by the prepared divisor.
+        
+        Args:
+            dividend: Dividend as BinaryNumber
+            
+        Returns:
+            Tuple of (quotient, remainder) as BinaryNumber objects (packed
+            if dividend or divisor is packed)
+        """
+        quotient, remainder = self.divmod_limbs(limbs=dividend.limbs)
+        packed = dividend.is_packed or self._divisor.is_packed
+        return (
+            self._wrap(limbs=quotient, packed=packed),
+            self._wrap(limbs=remainder, packed=packed))
+    
+    def divmod_limbs(
+            self,
+            *,
+            limbs: p_typ.Sequence[int]) -> p_typ.Tuple[
+                p_typ.List[int], p_typ.List[int]]:
+        """Divide a limb list by the prepared divisor.
+        
+        Args:
+            limbs: Dividend, least significant limb first
+            
+        Returns:
+            Tuple of (quotient, remainder) as trimmed limb lists
+        """
+        if self._size == 1:
+            return LimbArithmetic.divide(
+                limbs_1=limbs,
+                limbs_2=self._limbs)
+        
+        size = self._size
+        length = len(limbs)
+        if length <= 2 * size:
+            return self._reduce(limbs=list(limbs))
+        
+        # The top chunk takes up to 2n limbs, every later chunk n limbs
+        # plus the remainder carried over (still below b ** (2n))
+        start = length - size - (length - 1) % size - 1
+        quotient, remainder = self._reduce(limbs=list(limbs[start:]))
+        quotient = [0] * start + quotient
+        for start in range(start - size, -1, -size):
+            block = list(limbs[start:start + size])
+            block.extend(remainder)
+            block_quotient, remainder = self._reduce(limbs=block)
+            quotient[start:start + len(block_quotient)] = block_quotient
+        while quotient and not quotient[-1]:
+            quotient.pop()
+        return quotient, remainder
+    
+    def _reduce(
+            self,
+            *,
+            limbs: p_typ.List[int]) -> p_typ.Tuple[
+                p_typ.List[int], p_typ.List[int]]:
+        """Divide a value below divisor * b ** n with one Barrett step.
+        
+        Below threshold limbs both products are truncated: only the high
+        limbs of the quotient estimate and the low n + 1 limbs of the
+        remainder are formed (see LimbArithmetic.multiply_high and
+        multiply_low). Larger divisors use the full tiered products.
+        
+        Args:
+            limbs: Dividend below divisor * b ** n
+            
+        Returns:
+            Tuple of (quotient, remainder) as trimmed limb lists
+        """
+        size = self._size
+        if size < self._threshold:
+            estimate = LimbArithmetic.multiply_high(
+                limbs_1=limbs[size - 1:],
+                limbs_2=self._reciprocal,
+                size=size + 1)
+            product = LimbArithmetic.multiply_low(
+                limbs_1=estimate,
+                limbs_2=self._limbs,
+                size=size + 1)
+        else:
+            estimate = self._multiply(
+                limbs_1=limbs[size - 1:],
+                limbs_2=self._reciprocal)[size + 1:]
+            product = self._multiply(
+                limbs_1=estimate,
+                limbs_2=self._limbs)[:size + 1]
+        
+        # The remainder is below 4 * divisor < b ** (n + 1), so it can be
+        # computed mod b ** (n + 1)
+        low = limbs[:size + 1]
+        product.extend([0] * (size + 1 - len(product)))
+        remainder, _ = LimbArithmetic.subtract_with_borrow(
+            limbs_1=low,
+            limbs_2=product)
+        
+        # The estimate is at most three below the true quotient
+        while BinaryComparator.compare_limbs(
+                limbs_1=remainder,
+                limbs_2=self._limbs) >= 0:
+            remainder = LimbArithmetic.subtract(
+                limbs_1=remainder,
+                limbs_2=self._limbs)
+            estimate = LimbArithmetic.add(limbs_1=estimate, limbs_2=[1])
+        return estimate, remainder
+    
+    @staticmethod
+    def _wrap(*, limbs: p_typ.Sequence[int], packed: bool) -> BinaryNumber:
+        """Wrap result limbs in a BinaryNumber.
+        
+        Args:
+            limbs: Result limbs, least significant limb first
+            packed: If True, keep the packed backend
+            
+        Returns:
+            Result as BinaryNumber object
+        """
+        if packed:
+            return BinaryNumber.from_limbs(limbs=limbs)
+        return BinaryNumber(binary_str=BinaryPacker.unpack(limbs=limbs))
@@ -1,5 +1,7 @@
 """Binary comparator class for comparing binary strings."""
 
+import typing as p_typ
+
 
 class BinaryComparator:
     """Comparator for binary string comparison operations.
@@ -50,6 +52,47 @@ class BinaryComparator:
         else:
             return 0
     
+    @staticmethod
+    def compare_limbs(
+            *,
+            limbs_1: p_typ.Sequence[int],
+            limbs_2: p_typ.Sequence[int]) -> int:
+        """Compare two limb lists of the packed storage backend.
+        
+        Compares the significant limb counts first and then the limbs
+        from the most significant one down, one 64-bit word at a time.
+        
+        Args:
+            limbs_1: First limb list (least significant limb first)
+            limbs_2: Second limb list (least significant limb first)
+            
+        Returns:
+            -1 if limbs_1 < limbs_2
+             0 if limbs_1 == limbs_2
+             1 if limbs_1 > limbs_2
+             
+        Example:
+            >>> comparator = BinaryComparator()
+            >>> comparator.compare_limbs(limbs_1=[0, 1], limbs_2=[7])
+            1
+        """
+        len_1 = len(limbs_1)
+        while len_1 and not limbs_1[len_1 - 1]:
+            len_1 -= 1
+        len_2 = len(limbs_2)
+        while len_2 and not limbs_2[len_2 - 1]:
+            len_2 -= 1
+        
+        # Compare significant lengths first
+        if len_1 != len_2:
+            return -1 if len_1 < len_2 else 1
+        
+        # Same length, compare from the most significant limb
+        for i in range(len_1 - 1, -1, -1):
+            if limbs_1[i] != limbs_2[i]:
+                return -1 if limbs_1[i] < limbs_2[i] else 1
+        return 0
+    
     def smaller(self, *, binary_1: str, binary_2: str) -> bool:
         """Check if first binary string is smaller than second.
         
@@ -1,6 +1,6 @@
 """Binary converter module."""
 
 from .binary_converter import BinaryConverter
+from .radix_power_cache import RadixPowerCache
 
-__all__ = ['BinaryConverter']
-
+__all__ = ['BinaryConverter', 'RadixPowerCache']
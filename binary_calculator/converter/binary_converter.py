@@ -1,5 +1,20 @@
 """Binary converter class for converting between binary and decimal."""
 
+import array as p_arr
+import itertools as p_itt
+import typing as p_typ
+from ..calculator import ArithmeticCalculator
+from ..instruction import BinaryNumber
+from ..limbs import BinaryPacker, LimbArithmetic
+from .radix_power_cache import RadixPowerCache
+
+try:
+    import numpy as p_np
+except ImportError:  # NumPy is optional
+    p_np = None
+
+UINT64_MAX = (1 << 64) - 1
+
 
 class BinaryConverter:
     """Converter for binary-decimal transformations.
@@ -7,8 +22,25 @@ class BinaryConverter:
     This class provides utility methods for converting between binary string
     representations and decimal integer values. These conversions are separate
     from the arithmetic operations performed by BinaryCalculator.
+    
+    Digit strings of any length and any radix from 2 to 36 are converted
+    in both directions without building a Python int:
+        - Power-of-two radices (2, 4, 8, 16, 32) map every digit to a fixed
+          group of bits, so no arithmetic is needed
+        - Other radices split the number recursively at powers
+          radix ** (k * 2 ** i), where k digits fill one 64-bit limb, and
+          combine or separate the halves with the calculator's fast
+          multiplication and division. These powers live in a process-wide,
+          size-bounded RadixPowerCache shared by all conversions.
     """
     
+    SCHOOLBOOK_LIMBS = 16
+    DIGITS = '0123456789abcdefghijklmnopqrstuvwxyz'
+    _calculator = ArithmeticCalculator()
+    _power_cache = RadixPowerCache(calculator=_calculator)
+    _group_tables: p_typ.Dict[int, p_typ.Dict[int, str]] = {}
+    _digit_tables: p_typ.Dict[int, p_typ.Dict[str, str]] = {}
+    
     @staticmethod
     def binary_to_decimal(*, binary_str: str) -> int:
         """Convert binary string to decimal integer.
@@ -57,4 +89,579 @@ class BinaryConverter:
         else:
             # For negative numbers, use '-' prefix for simplicity
             return '-' + bin(decimal_num)[3:]
-
+    
+    @staticmethod
+    def decimal_str_to_binary(*, decimal_str: str) -> str:
+        """Convert a decimal string of any length to a binary string.
+        
+        Unlike decimal_to_binary(), this does not need a Python int, whose
+        parsing is quadratic in the number of digits (and limited to 4300
+        digits by default since Python 3.11). The digits are split
+        recursively: the low k * 2 ** i digits and the remaining high
+        digits are converted separately and combined as
+        high * 10 ** (k * 2 ** i) + low with the calculator's fused
+        multiply-add, so the cost follows the fast multiplication tiers.
+        Short strings are converted limb by limb (k = 19 digits per limb).
+        
+        Args:
+            decimal_str: Decimal digits, optionally prefixed with '-'
+                (leading zeros are allowed)
+            
+        Returns:
+            Binary representation as string (without leading zeros, '-'
+            prefix for negative numbers)
+            
+        Raises:
+            ValueError: If decimal_str is not a decimal number
+            
+        Example:
+            >>> converter = BinaryConverter()
+            >>> converter.decimal_str_to_binary(decimal_str='1000')
+            '1111101000'
+        """
+        return BinaryConverter._parse(
+            digits_str=decimal_str, radix=10, name='decimal')
+    
+    @staticmethod
+    def binary_to_decimal_str(*, binary_str: str) -> str:
+        """Convert a binary string of any length to a decimal string.
+        
+        Rendering a big int with str() is quadratic in the number of digits
+        (and limited to 4300 digits by default since Python 3.11). Here the
+        number is split recursively by dividing by a cached power
+        10 ** (k * 2 ** i) with about half its size; quotient and remainder
+        are rendered separately, the remainder zero-padded to k * 2 ** i
+        digits. Every power is divided by through a cached PreparedDivisor
+        (Barrett reduction with the calculator's multiplication tiers), so
+        the cost follows the fast multiplication. Short numbers are
+        rendered limb by limb (k = 19 digits per limb).
+        
+        Args:
+            binary_str: Binary number as string, optionally prefixed with
+                '-' (leading zeros are allowed)
+            
+        Returns:
+            Decimal representation as string (without leading zeros, '-'
+            prefix for negative numbers)
+            
+        Raises:
+            ValueError: If binary_str is not a binary number
+            
+        Example:
+            >>> converter = BinaryConverter()
+            >>> converter.binary_to_decimal_str(binary_str='1111101000')
+            '1000'
+        """
+        return BinaryConverter._render(binary_str=binary_str, radix=10)
+    
+    @staticmethod
+    def hex_to_binary(*, hex_str: str) -> str:
+        """Convert a hexadecimal string to a binary string.
+        
+        Every hex digit maps to four bits, so the conversion is a single
+        character translation without arithmetic.
+        
+        Args:
+            hex_str: Hexadecimal digits (either case, no '0x' prefix),
+                optionally prefixed with '-'
+            
+        Returns:
+            Binary representation as string (without leading zeros, '-'
+            prefix for negative numbers)
+            
+        Raises:
+            ValueError: If hex_str is not a hexadecimal number
+            
+        Example:
+            >>> converter = BinaryConverter()
+            >>> converter.hex_to_binary(hex_str='3E8')
+            '1111101000'
+        """
+        return BinaryConverter._parse(
+            digits_str=hex_str, radix=16, name='hexadecimal')
+    
+    @staticmethod
+    def binary_to_hex(*, binary_str: str) -> str:
+        """Convert a binary string to a hexadecimal string.
+        
+        Every group of four bits maps to one hex digit, so the conversion
+        needs no arithmetic.
+        
+        Args:
+            binary_str: Binary number as string, optionally prefixed with
+                '-'
+            
+        Returns:
+            Lowercase hexadecimal representation (without leading zeros,
+            '-' prefix for negative numbers)
+            
+        Raises:
+            ValueError: If binary_str is not a binary number
+            
+        Example:
+            >>> converter = BinaryConverter()
+            >>> converter.binary_to_hex(binary_str='1111101000')
+            '3e8'
+        """
+        return BinaryConverter._render(binary_str=binary_str, radix=16)
+    
+    @staticmethod
+    def octal_to_binary(*, octal_str: str) -> str:
+        """Convert an octal string to a binary string.
+        
+        Every octal digit maps to three bits, so the conversion is a single
+        character translation without arithmetic.
+        
+        Args:
+            octal_str: Octal digits (no '0o' prefix), optionally prefixed
+                with '-'
+            
+        Returns:
+            Binary representation as string (without leading zeros, '-'
+            prefix for negative numbers)
+            
+        Raises:
+            ValueError: If octal_str is not an octal number
+            
+        Example:
+            >>> converter = BinaryConverter()
+            >>> converter.octal_to_binary(octal_str='1750')
+            '1111101000'
+        """
+        return BinaryConverter._parse(
+            digits_str=octal_str, radix=8, name='octal')
+    
+    @staticmethod
+    def binary_to_octal(*, binary_str: str) -> str:
+        """Convert a binary string to an octal string.
+        
+        Every group of three bits maps to one octal digit, so the
+        conversion needs no arithmetic.
+        
+        Args:
+            binary_str: Binary number as string, optionally prefixed with
+                '-'
+            
+        Returns:
+            Octal representation (without leading zeros, '-' prefix for
+            negative numbers)
+            
+        Raises:
+            ValueError: If binary_str is not a binary number
+            
+        Example:
+            >>> converter = BinaryConverter()
+            >>> converter.binary_to_octal(binary_str='1111101000')
+            '1750'
+        """
+        return BinaryConverter._render(binary_str=binary_str, radix=8)
+    
+    @staticmethod
+    def radix_str_to_binary(*, digits_str: str, radix: int) -> str:
+        """Convert a digit string of any radix from 2 to 36 to binary.
+        
+        Digits above 9 are the letters a-z in either case. Power-of-two
+        radices are translated digit by digit into bit groups; all other
+        radices use the divide-and-conquer conversion of
+        decimal_str_to_binary() with the cached powers of the radix.
+        
+        Args:
+            digits_str: Digits of the radix, optionally prefixed with '-'
+            radix: Radix of digits_str (2 to 36)
+            
+        Returns:
+            Binary representation as string (without leading zeros, '-'
+            prefix for negative numbers)
+            
+        Raises:
+            ValueError: If radix is out of range or digits_str is not a
+                number in that radix
+            
+        Example:
+            >>> converter = BinaryConverter()
+            >>> converter.radix_str_to_binary(digits_str='rs', radix=36)
+            '1111101000'
+        """
+        BinaryConverter._validate_radix(radix=radix)
+        return BinaryConverter._parse(
+            digits_str=digits_str, radix=radix, name=f"radix-{radix}")
+    
+    @staticmethod
+    def binary_to_radix_str(*, binary_str: str, radix: int) -> str:
+        """Convert a binary string to digits of any radix from 2 to 36.
+        
+        Power-of-two radices group the bits directly; all other radices
+        use the divide-and-conquer rendering of binary_to_decimal_str()
+        with the cached powers of the radix.
+        
+        Args:
+            binary_str: Binary number as string, optionally prefixed with
+                '-'
+            radix: Radix of the result (2 to 36)
+            
+        Returns:
+            Digits of the radix in lowercase (without leading zeros, '-'
+            prefix for negative numbers)
+            
+        Raises:
+            ValueError: If radix is out of range or binary_str is not a
+                binary number
+            
+        Example:
+            >>> converter = BinaryConverter()
+            >>> converter.binary_to_radix_str(
+            ...     binary_str='1111101000', radix=36)
+            'rs'
+        """
+        BinaryConverter._validate_radix(radix=radix)
+        return BinaryConverter._render(binary_str=binary_str, radix=radix)
+    
+    @staticmethod
+    def binary_to_decimal_many(
+            *,
+            binary_strs: p_typ.Iterable[str]) -> p_typ.Any:
+        """Convert many binary strings to decimal integers in one call.
+        
+        Bulk version of binary_to_decimal() with the same rules per value.
+        The conversion is still per element: every string goes through
+        int(s, 2), but in a single map() loop without a keyword-only method
+        call per value (about twice as fast for 64-bit values). There is no
+        vectorised word-size path; NumPy input is converted via tolist(),
+        and only the result dtype (uint64 when every value fits) is fixed
+        width.
+        
+        Args:
+            binary_strs: Binary strings as list, tuple, any other iterable
+                or NumPy array of strings (of any shape)
+            
+        Returns:
+            Decimal integers in the same shape: a tuple for a tuple, a NumPy
+            array for a NumPy array (dtype uint64 if every value fits in 64
+            bits, object otherwise) and a list for anything else
+            
+        Raises:
+            ValueError: If a string is not a binary number
+            
+        Example:
+            >>> converter = BinaryConverter()
+            >>> converter.binary_to_decimal_many(binary_strs=['1010', '11'])
+            [10, 3]
+        """
+        if p_np is not None and isinstance(binary_strs, p_np.ndarray):
+            values = list(map(
+                int, binary_strs.ravel().tolist(), p_itt.repeat(2)))
+            if not values or (min(values) >= 0
+                               and max(values) <= UINT64_MAX):
+                result = p_np.array(values, dtype=p_np.uint64)
+            else:
+                result = p_np.array(values, dtype=object)
+            return result.reshape(binary_strs.shape)
+        
+        values = list(map(int, binary_strs, p_itt.repeat(2)))
+        return tuple(values) if isinstance(binary_strs, tuple) else values
+    
+    @staticmethod
+    def decimal_to_binary_many(
+            *,
+            decimal_nums: p_typ.Iterable[int]) -> p_typ.Any:
+        """Convert many decimal integers to binary strings in one call.
+        
+        Bulk version of decimal_to_binary() with the same rules per value.
+        The conversion is still per element: every value goes through
+        bin() in a single comprehension, without a keyword-only method call
+        per value (about 1.6 times as fast for 64-bit values). There is no
+        vectorised word-size path; NumPy input is converted via tolist().
+        Unsigned input (array objects with typecode B, H, I, L or Q and
+        unsigned NumPy arrays such as uint64) cannot hold negative numbers,
+        so it is rendered without any sign handling; other input takes the
+        same path once a single min() shows that no value is negative.
+        
+        Args:
+            decimal_nums: Integers as list, tuple, array object, any other
+                iterable or NumPy integer array (of any shape)
+            
+        Returns:
+            Binary strings in the same shape: a tuple for a tuple, a NumPy
+            string array for a NumPy array and a list for anything else
+            (including array objects, which cannot hold strings)
+            
+        Example:
+            >>> converter = BinaryConverter()
+            >>> converter.decimal_to_binary_many(decimal_nums=[10, -3])
+            ['1010', '-11']
+        """
+        if p_np is not None and isinstance(decimal_nums, p_np.ndarray):
+            binary_strs = BinaryConverter._format_many(
+                values=decimal_nums.ravel().tolist(),
+                unsigned=decimal_nums.dtype.kind == 'u')
+            return p_np.array(binary_strs, dtype=str).reshape(
+                decimal_nums.shape)
+        
+        if isinstance(decimal_nums, p_arr.array):
+            binary_strs = BinaryConverter._format_many(
+                values=decimal_nums,
+                unsigned=decimal_nums.typecode in 'BHILQ')
+        else:
+            binary_strs = BinaryConverter._format_many(
+                values=decimal_nums
+                if isinstance(decimal_nums, (list, tuple))
+                else list(decimal_nums),
+                unsigned=False)
+        if isinstance(decimal_nums, tuple):
+            return tuple(binary_strs)
+        return binary_strs
+    
+    @staticmethod
+    def _parse(*, digits_str: str, radix: int, name: str) -> str:
+        """Validate a signed digit string and convert it to binary.
+        
+        Args:
+            digits_str: Digits of the radix, optionally prefixed with '-'
+            radix: Radix of digits_str (2 to 36)
+            name: Name of the number format for error messages
+            
+        Returns:
+            Binary representation as string
+            
+        Raises:
+            ValueError: If digits_str is not a number in the radix
+        """
+        negative = digits_str.startswith('-')
+        digits = digits_str[1:] if negative else digits_str
+        if not digits or not digits.isascii() or digits.lower().strip(
+                BinaryConverter.DIGITS[:radix]):
+            shown = digits_str if len(digits_str) <= 20 else (
+                digits_str[:20] + '...')
+            raise ValueError(f"Invalid {name} string: '{shown}'")
+        
+        bits = radix.bit_length() - 1
+        if radix == 1 << bits:
+            binary_str = digits.lower().translate(
+                BinaryConverter._group_table(bits=bits)).lstrip('0') or '0'
+        else:
+            binary_str = BinaryPacker.unpack(
+                limbs=BinaryConverter._digits_to_number(
+                    digits=digits, radix=radix).limbs)
+        if negative and binary_str != '0':
+            return '-' + binary_str
+        return binary_str
+    
+    @staticmethod
+    def _render(*, binary_str: str, radix: int) -> str:
+        """Validate a signed binary string and render it in a radix.
+        
+        Args:
+            binary_str: Binary number as string, optionally prefixed with
+                '-'
+            radix: Radix of the result (2 to 36)
+            
+        Returns:
+            Digits of the radix
+            
+        Raises:
+            ValueError: If binary_str is not a binary number
+        """
+        negative = binary_str.startswith('-')
+        bits = binary_str[1:] if negative else binary_str
+        if not bits or bits.strip('01'):
+            shown = binary_str if len(binary_str) <= 20 else (
+                binary_str[:20] + '...')
+            raise ValueError(f"Invalid binary string: '{shown}'")
+        
+        group = radix.bit_length() - 1
+        if radix == 1 << group:
+            bits = bits.lstrip('0') or '0'
+            bits = '0' * (-len(bits) % group) + bits
+            table = BinaryConverter._digit_table(bits=group)
+            digits_str = ''.join([
+                table[bits[start:start + group]]
+                for start in range(0, len(bits), group)])
+        else:
+            digits_str = BinaryConverter._number_to_digits(
+                number=BinaryNumber.from_limbs(
+                    limbs=BinaryPacker.pack(binary_str=bits)),
+                radix=radix)
+        if negative and digits_str != '0':
+            return '-' + digits_str
+        return digits_str
+    
+    @staticmethod
+    def _digits_to_number(*, digits: str, radix: int) -> BinaryNumber:
+        """Convert validated digits of a radix to a packed BinaryNumber.
+        
+        Args:
+            digits: Digits of the radix, most significant first
+            radix: Radix of digits (2 to 36)
+            
+        Returns:
+            Packed BinaryNumber with the value of digits
+        """
+        chunk = RadixPowerCache.digits_per_limb(radix=radix)
+        if len(digits) <= chunk * BinaryConverter.SCHOOLBOOK_LIMBS:
+            # Horner's scheme with one limb of digits per step
+            scale = [radix ** chunk]
+            head = len(digits) % chunk or chunk
+            limbs = LimbArithmetic.multiply_add(
+                limbs_1=[], limbs_2=[], limbs_3=[int(digits[:head], radix)])
+            for start in range(head, len(digits), chunk):
+                limbs = LimbArithmetic.multiply_add(
+                    limbs_1=scale,
+                    limbs_2=limbs,
+                    limbs_3=[int(digits[start:start + chunk], radix)])
+            return BinaryNumber.from_limbs(limbs=limbs)
+        
+        # Split off the largest k * 2 ** level low digits below the length
+        level = 0
+        while chunk << (level + 1) < len(digits):
+            level += 1
+        split = len(digits) - (chunk << level)
+        return BinaryConverter._calculator.multiply_add(
+            operand_1=BinaryConverter._digits_to_number(
+                digits=digits[:split], radix=radix),
+            operand_2=BinaryConverter._power_cache.power(
+                radix=radix, level=level),
+            operand_3=BinaryConverter._digits_to_number(
+                digits=digits[split:], radix=radix))
+    
+    @staticmethod
+    def _number_to_digits(
+            *,
+            number: BinaryNumber,
+            radix: int,
+            width: int = 0) -> str:
+        """Render a packed BinaryNumber as digits of a radix.
+        
+        Args:
+            number: Packed BinaryNumber to render
+            radix: Radix of the digits (2 to 36)
+            width: Exact number of digits to produce (zero-padded), or 0 for
+                no leading zeros
+            
+        Returns:
+            Digits of number, most significant first
+        """
+        limbs = number.limbs
+        chunk = RadixPowerCache.digits_per_limb(radix=radix)
+        if len(limbs) <= BinaryConverter.SCHOOLBOOK_LIMBS:
+            # Peel off one limb of digits per single-limb division
+            scale = [radix ** chunk]
+            chunks = []
+            while limbs:
+                limbs, remainder = LimbArithmetic.divide(
+                    limbs_1=limbs, limbs_2=scale)
+                chunks.append(BinaryConverter._format_limb(
+                    value=remainder[0] if remainder else 0,
+                    radix=radix,
+                    width=chunk))
+            digits = ''.join(reversed(chunks)).lstrip('0')
+            return digits.zfill(width) if width else digits or '0'
+        
+        # Divide by the largest cached power with at most half the limbs,
+        # which leaves a non-zero quotient
+        level = 0
+        while 2 * len(BinaryConverter._power_cache.power(
+                radix=radix, level=level + 1).limbs) <= len(limbs) + 1:
+            level += 1
+        low_width = chunk << level
+        quotient, remainder = BinaryConverter._power_cache.divisor(
+            radix=radix, level=level).divmod(dividend=number)
+        return (
+            BinaryConverter._number_to_digits(
+                number=quotient,
+                radix=radix,
+                width=max(width - low_width, 0))
+            + BinaryConverter._number_to_digits(
+                number=remainder,
+                radix=radix,
+                width=low_width))
+    
+    @staticmethod
+    def _format_many(
+            *,
+            values: p_typ.Sequence[int],
+            unsigned: bool) -> p_typ.List[str]:
+        """Render a sequence of integers as binary strings.
+        
+        Args:
+            values: Integers to render
+            unsigned: True if values cannot be negative
+            
+        Returns:
+            List of binary strings ('-' prefix for negative numbers)
+        """
+        if unsigned or not values or min(values) >= 0:
+            return [bin(value)[2:] for value in values]
+        return [bin(value)[2:] if value >= 0 else '-' + bin(value)[3:]
+                for value in values]
+    
+    @staticmethod
+    def _format_limb(*, value: int, radix: int, width: int) -> str:
+        """Format a single limb value as zero-padded digits of a radix.
+        
+        Args:
+            value: Value below 2 ** 64
+            radix: Radix of the digits (2 to 36)
+            width: Number of digits to produce
+            
+        Returns:
+            Digits of value, zero-padded to width
+        """
+        if radix == 10:
+            return str(value).zfill(width)
+        digits = []
+        for _ in range(width):
+            value, digit = divmod(value, radix)
+            digits.append(BinaryConverter.DIGITS[digit])
+        return ''.join(reversed(digits))
+    
+    @staticmethod
+    def _group_table(*, bits: int) -> p_typ.Dict[int, str]:
+        """Get the cached translation table from digits to groups of bits.
+        
+        Args:
+            bits: Bits per digit (1 to 5)
+            
+        Returns:
+            str.translate() table mapping every digit (either case) of the
+            radix 2 ** bits to its bits
+        """
+        if bits not in BinaryConverter._group_tables:
+            table = {}
+            for value, digit in enumerate(
+                    BinaryConverter.DIGITS[:1 << bits]):
+                group = format(value, f"0{bits}b")
+                table[ord(digit)] = group
+                table[ord(digit.upper())] = group
+            BinaryConverter._group_tables[bits] = table
+        return BinaryConverter._group_tables[bits]
+    
+    @staticmethod
+    def _digit_table(*, bits: int) -> p_typ.Dict[str, str]:
+        """Get the cached table from groups of bits to digits.
+        
+        Args:
+            bits: Bits per digit (1 to 5)
+            
+        Returns:
+            Dictionary mapping every bits-wide group to its digit
+        """
+        if bits not in BinaryConverter._digit_tables:
+            BinaryConverter._digit_tables[bits] = {
+                format(value, f"0{bits}b"): digit
+                for value, digit in enumerate(
+                    BinaryConverter.DIGITS[:1 << bits])}
+        return BinaryConverter._digit_tables[bits]
+    
+    @staticmethod
+    def _validate_radix(*, radix: int) -> None:
+        """Validate a radix.
+        
+        Args:
+            radix: Radix to check
+            
+        Raises:
+            ValueError: If radix is not an integer from 2 to 36
+        """
+        if not isinstance(radix, int) or not 2 <= radix <= 36:
+            raise ValueError(
+                f"Radix must be an integer from 2 to 36, got {radix}")
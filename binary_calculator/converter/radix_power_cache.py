@@ -0,0 +1,179 @@
+"""Radix power cache class for divide-and-conquer radix conversion."""
+
+import collections as p_coll
+import typing as p_typ
+from ..calculator import ArithmeticCalculator, PreparedDivisor
+from ..instruction import BinaryNumber
+from ..limbs import LIMB_BITS
+
+
+class RadixPowerCache:
+    """Size-bounded cache of radix power tables.
+    
+    For a radix r with k digits per 64-bit limb, the table holds the powers
+    r ** (k * 2 ** i) for i = 0, 1, 2, ... as packed BinaryNumbers, each
+    one the square of the previous, plus (on demand) a PreparedDivisor per
+    power. Radix conversions split numbers at these powers, so a table is
+    built once and reused by every later conversion in the same radix.
+    
+    Tables are kept in least-recently-used order. When more than
+    max_radices tables are cached, or the cached powers and prepared
+    divisors (divisor plus reciprocal) exceed max_limbs limbs in total,
+    the least recently used tables are dropped (never the one just
+    requested).
+    
+    Example:
+        >>> cache = RadixPowerCache(calculator=ArithmeticCalculator())
+        >>> cache.power(radix=10, level=1).to_int() == 10 ** 38
+        True
+    """
+    
+    MAX_RADICES = 8
+    MAX_LIMBS = 1 << 22
+    
+    def __init__(
+            self,
+            *,
+            calculator: ArithmeticCalculator,
+            max_radices: int = MAX_RADICES,
+            max_limbs: int = MAX_LIMBS) -> None:
+        """Initialize an empty cache.
+        
+        Args:
+            calculator: Calculator used to square powers and prepare
+                divisors
+            max_radices: Maximum number of cached radix tables
+            max_limbs: Maximum number of limbs held by all cached powers
+                and prepared divisors
+            
+        Raises:
+            ValueError: If a bound is not a positive integer
+        """
+        for name, bound in [('max_radices', max_radices),
+                            ('max_limbs', max_limbs)]:
+            if not isinstance(bound, int) or bound < 1:
+                raise ValueError(
+                    f"{name} must be a positive integer, got {bound}")
+        
+        self._calculator = calculator
+        self._max_radices = max_radices
+        self._max_limbs = max_limbs
+        self._powers: p_coll.OrderedDict[
+            int, p_typ.List[BinaryNumber]] = p_coll.OrderedDict()
+        self._divisors: p_typ.Dict[
+            int, p_typ.Dict[int, PreparedDivisor]] = {}
+        self._limbs = 0
+    
+    @property
+    def cached_limbs(self) -> int:
+        """Get the number of limbs held by all cached powers and divisors.
+        
+        Returns:
+            Total limb count of the cached powers and prepared divisors
+        """
+        return self._limbs
+    
+    def radices(self) -> p_typ.List[int]:
+        """Get the cached radices.
+        
+        Returns:
+            List of radices, least recently used first
+        """
+        return list(self._powers)
+    
+    def power(self, *, radix: int, level: int) -> BinaryNumber:
+        """Get the power radix ** (k * 2 ** level).
+        
+        Missing levels are computed by repeated squaring.
+        
+        Args:
+            radix: Radix of the power table (2 to 36)
+            level: Level in the power table
+            
+        Returns:
+            Packed BinaryNumber with the value of the power
+        """
+        table = self._table(radix=radix)
+        while len(table) <= level:
+            table.append(self._calculator.square(operand=table[-1]))
+            self._limbs += len(table[-1].limbs)
+        self._evict(keep=radix)
+        return table[level]
+    
+    def divisor(self, *, radix: int, level: int) -> PreparedDivisor:
+        """Get a PreparedDivisor for radix ** (k * 2 ** level).
+        
+        Args:
+            radix: Radix of the power table (2 to 36)
+            level: Level in the power table
+            
+        Returns:
+            PreparedDivisor dividing by the power
+        """
+        power = self.power(radix=radix, level=level)
+        divisors = self._divisors.setdefault(radix, {})
+        if level not in divisors:
+            divisors[level] = self._calculator.prepare_divisor(
+                divisor=power)
+            self._limbs += divisors[level].limb_count
+            self._evict(keep=radix)
+        return divisors[level]
+    
+    def clear(self) -> None:
+        """Drop all cached tables."""
+        self._powers.clear()
+        self._divisors.clear()
+        self._limbs = 0
+    
+    @staticmethod
+    def digits_per_limb(*, radix: int) -> int:
+        """Get the number of radix digits that always fit in one limb.
+        
+        Args:
+            radix: Radix of the digits (2 to 36)
+            
+        Returns:
+            Largest k with radix ** k < 2 ** 64
+        """
+        chunk = 1
+        while radix ** (chunk + 1) < 1 << LIMB_BITS:
+            chunk += 1
+        return chunk
+    
+    def _table(self, *, radix: int) -> p_typ.List[BinaryNumber]:
+        """Get the power table of a radix and mark it as recently used.
+        
+        Args:
+            radix: Radix of the power table
+            
+        Returns:
+            Power table (at least level 0)
+        """
+        if radix in self._powers:
+            self._powers.move_to_end(radix)
+            return self._powers[radix]
+        
+        table = [BinaryNumber.from_limbs(
+            limbs=[radix ** self.digits_per_limb(radix=radix)])]
+        self._powers[radix] = table
+        self._limbs += 1
+        return table
+    
+    def _evict(self, *, keep: int) -> None:
+        """Drop least recently used tables until the bounds hold.
+        
+        Args:
+            keep: Radix whose table must stay cached
+        """
+        while len(self._powers) > 1 and (
+                len(self._powers) > self._max_radices
+                or self._limbs > self._max_limbs):
+            radix = next(iter(self._powers))
+            if radix == keep:
+                self._powers.move_to_end(radix)
+                radix = next(iter(self._powers))
+            table = self._powers.pop(radix)
+            self._limbs -= sum(len(power.limbs) for power in table)
+            self._limbs -= sum(
+                divisor.limb_count
+                for divisor in self._divisors.pop(radix, {}).values())
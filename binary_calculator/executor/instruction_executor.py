@@ -1,13 +1,16 @@
 """Instruction executor class for executing binary instructions."""
 
+import itertools as p_itt
 import typing as p_typ
 from ..calculator.arithmetic_calculator import ArithmeticCalculator
+from ..calculator.constant_multiplier import ConstantMultiplier
+from ..calculator.prepared_divisor import PreparedDivisor
 from ..comparator import BinaryComparator
+from ..instruction.binary_instruction import BinaryInstruction
 from ..instruction.binary_number import BinaryNumber
+from ..instruction.binary_number_array import BinaryNumberArray
 from ..instruction.operation_enum import OperationEnum, OperationType
-
-if p_typ.TYPE_CHECKING:
-    from ..instruction.binary_instruction import BinaryInstruction
+from ..limbs import BinaryPacker
 
 
 class InstructionExecutor:
@@ -17,34 +20,69 @@ class InstructionExecutor:
     appropriate handler based on the instruction's state.
     
     Methods:
-        calculate(): Execute calculation instructions (returns binary string)
+        calculate(): Execute calculation instructions (returns BinaryNumber,
+            or a (quotient, remainder) tuple for '/%')
+        calculate_batch(): Execute a sequence of calculation instructions,
+            compiling operand_2 once where it recurs
+        calculate_array(): Execute one calculation element-wise over a
+            BinaryNumberArray (returns BinaryNumberArray)
         compare(): Execute comparison instructions (returns boolean)
     """
     
+    BATCH_REUSE_COUNT = 2
+    
     def __init__(self) -> None:
         """Initialize the instruction executor with dependencies."""
         self._arithmetic_calculator = ArithmeticCalculator()
         self._comparator = BinaryComparator()
+        self._limb_comparison_map: p_typ.Dict[
+                OperationEnum, p_typ.Callable[[int], bool]] = {
+            OperationEnum.SMALLER: lambda order: order < 0,
+            OperationEnum.SMALLER_EQUAL: lambda order: order <= 0,
+            OperationEnum.LARGER: lambda order: order > 0,
+            OperationEnum.LARGER_EQUAL: lambda order: order >= 0,
+            OperationEnum.EQUAL: lambda order: order == 0,
+            OperationEnum.NOT_EQUAL: lambda order: order != 0}
     
     def calculate(
             self,
             *,
             instruction: 'BinaryInstruction',
-            print_result: bool = False) -> BinaryNumber:
+            print_result: bool = False,
+            prepared_divisor: p_typ.Optional[PreparedDivisor] = None,
+            constant_multiplier: p_typ.Optional[ConstantMultiplier] = None
+            ) -> p_typ.Union[
+                BinaryNumber, p_typ.Tuple[BinaryNumber, BinaryNumber]]:
         """Execute a calculation instruction.
         
-        This method executes arithmetic operations (+, -, *, /) and returns
-        the result as a BinaryNumber object.
+        This method executes arithmetic operations (+, -, *, /, %, **, *+)
+        and returns the result as a BinaryNumber object. The divmod
+        operation (/%) returns quotient and remainder from a single division
+        pass, and the fused multiply-add (*+) computes
+        operand_1 * operand_2 + operand_3 without an intermediate product.
+        
+        Division instructions (/, %, /%) whose divisor recurs can pass a
+        PreparedDivisor (see ArithmeticCalculator.prepare_divisor) to skip
+        the per-call division setup. Likewise, multiplications by a
+        recurring operand_2 can pass a ConstantMultiplier (see
+        ArithmeticCalculator.compile_multiplier).
         
         Args:
             instruction: BinaryInstruction with CALCULATE state
             print_result: If True, print formatted calculation with result
+            prepared_divisor: Optional PreparedDivisor for operand_2 of a
+                division instruction
+            constant_multiplier: Optional ConstantMultiplier for operand_2
+                of a multiplication instruction
             
         Returns:
-            Result as BinaryNumber object
+            Result as BinaryNumber object, or a tuple of (quotient,
+            remainder) BinaryNumber objects for '/%'
             
         Raises:
-            ValueError: If instruction is not a calculation (is comparison)
+            ValueError: If instruction is not a calculation (is comparison),
+                or prepared_divisor (constant_multiplier) does not match a
+                division (multiplication) instruction
             ZeroDivisionError: If dividing by zero
             
         Example:
@@ -67,23 +105,215 @@ class InstructionExecutor:
             OperationEnum.ADD: self._arithmetic_calculator.add,
             OperationEnum.SUBTRACT: self._arithmetic_calculator.subtract,
             OperationEnum.MULTIPLY: self._arithmetic_calculator.multiply,
-            OperationEnum.DIVIDE: self._arithmetic_calculator.divide}
+            OperationEnum.DIVIDE: self._arithmetic_calculator.divide,
+            OperationEnum.MODULO: self._arithmetic_calculator.modulo,
+            OperationEnum.DIVMOD: self._arithmetic_calculator.divmod,
+            OperationEnum.POWER: self._arithmetic_calculator.power,
+            OperationEnum.MULTIPLY_ADD:
+                self._arithmetic_calculator.multiply_add}
         
         if instruction.operation not in operation_map:
             raise ValueError(
                 f"Unsupported calculation operation: "
                 f"'{instruction.operation.symbol}'")
         
-        operation_func = operation_map[instruction.operation]
-        result = operation_func(
-            operand_1=instruction.operand_1,
-            operand_2=instruction.operand_2)
+        if prepared_divisor is not None:
+            result = self._calculate_prepared(
+                instruction=instruction,
+                prepared_divisor=prepared_divisor)
+        elif constant_multiplier is not None:
+            result = self._calculate_constant(
+                instruction=instruction,
+                constant_multiplier=constant_multiplier)
+        elif instruction.operation == OperationEnum.MULTIPLY_ADD:
+            result = self._arithmetic_calculator.multiply_add(
+                operand_1=instruction.operand_1,
+                operand_2=instruction.operand_2,
+                operand_3=instruction.operand_3)
+        else:
+            operation_func = operation_map[instruction.operation]
+            result = operation_func(
+                operand_1=instruction.operand_1,
+                operand_2=instruction.operand_2)
         
         if print_result:
             self._print_calculation(instruction=instruction, result=result)
         
         return result
     
+    def prepare_divisor(self, *, divisor: BinaryNumber) -> PreparedDivisor:
+        """Prepare a divisor for repeated division instructions.
+        
+        Args:
+            divisor: Divisor as BinaryNumber
+            
+        Returns:
+            PreparedDivisor to pass to calculate()
+            
+        Raises:
+            ZeroDivisionError: If divisor is zero
+        """
+        return self._arithmetic_calculator.prepare_divisor(divisor=divisor)
+    
+    def compile_multiplier(
+            self,
+            *,
+            multiplier: BinaryNumber) -> ConstantMultiplier:
+        """Compile a constant factor for repeated multiplication instructions.
+        
+        Args:
+            multiplier: Constant factor as BinaryNumber
+            
+        Returns:
+            ConstantMultiplier to pass to calculate()
+        """
+        return self._arithmetic_calculator.compile_multiplier(
+            multiplier=multiplier)
+    
+    def calculate_batch(
+            self,
+            *,
+            instructions: p_typ.Iterable['BinaryInstruction'],
+            print_result: bool = False) -> p_typ.List[p_typ.Union[
+                BinaryNumber, p_typ.Tuple[BinaryNumber, BinaryNumber]]]:
+        """Execute a batch of calculation instructions.
+        
+        Every operand_2 that recurs at least BATCH_REUSE_COUNT times is
+        prepared once for the whole batch: multipliers are compiled into a
+        ConstantMultiplier and divisors (for /, % and /%) into a
+        PreparedDivisor. All other instructions run as in calculate().
+        
+        Args:
+            instructions: BinaryInstructions with CALCULATE state
+            print_result: If True, print every calculation with its result
+            
+        Returns:
+            List of results in instruction order, as returned by calculate()
+            
+        Raises:
+            ValueError: If an instruction is not a calculation
+            ZeroDivisionError: If dividing by zero
+            
+        Example:
+            >>> executor = InstructionExecutor()
+            >>> stride = BinaryNumber(binary_str='10000001')
+            >>> results = executor.calculate_batch(instructions=[
+            ...     BinaryInstruction(
+            ...         operand_1=BinaryNumber.from_int(decimal_num=index),
+            ...         operand_2=stride,
+            ...         operation='*')
+            ...     for index in range(3)])
+            >>> [result.to_int() for result in results]
+            [0, 129, 258]
+        """
+        instructions = list(instructions)
+        kinds = {
+            OperationEnum.MULTIPLY: 'multiply',
+            OperationEnum.DIVIDE: 'divide',
+            OperationEnum.MODULO: 'divide',
+            OperationEnum.DIVMOD: 'divide'}
+        
+        # Count every (kind, operand_2 value) pair across the batch
+        keys: p_typ.List[p_typ.Optional[p_typ.Tuple[str, bytes]]] = []
+        counts: p_typ.Dict[p_typ.Tuple[str, bytes], int] = {}
+        for instruction in instructions:
+            kind = kinds.get(instruction.operation)
+            if kind is None or (
+                    kind == 'divide' and not instruction.operand_2.limbs):
+                keys.append(None)
+                continue
+            key = (kind, instruction.operand_2.limbs.tobytes())
+            keys.append(key)
+            counts[key] = counts.get(key, 0) + 1
+        
+        compiled: p_typ.Dict[p_typ.Tuple[str, bytes], p_typ.Any] = {}
+        results = []
+        for instruction, key in zip(instructions, keys):
+            if key is None or counts[key] < self.BATCH_REUSE_COUNT:
+                results.append(self.calculate(
+                    instruction=instruction,
+                    print_result=print_result))
+                continue
+            if key not in compiled:
+                if key[0] == 'multiply':
+                    compiled[key] = self.compile_multiplier(
+                        multiplier=instruction.operand_2)
+                else:
+                    compiled[key] = self.prepare_divisor(
+                        divisor=instruction.operand_2)
+            if key[0] == 'multiply':
+                results.append(self.calculate(
+                    instruction=instruction,
+                    print_result=print_result,
+                    constant_multiplier=compiled[key]))
+            else:
+                results.append(self.calculate(
+                    instruction=instruction,
+                    print_result=print_result,
+                    prepared_divisor=compiled[key]))
+        return results
+    
+    def calculate_array(
+            self,
+            *,
+            operands_1: BinaryNumberArray,
+            operation: str,
+            operands_2: p_typ.Union[BinaryNumberArray, BinaryNumber]
+            ) -> p_typ.Union[
+                BinaryNumberArray,
+                p_typ.Tuple[BinaryNumberArray, BinaryNumberArray]]:
+        """Execute one calculation element-wise over a BinaryNumberArray.
+        
+        One instruction per element is run through calculate_batch(), with
+        the array elements as operands (views, not copies). A scalar
+        operand_2 is therefore compiled once for the whole array, e.g.
+        into a PreparedDivisor for '%'.
+        
+        Args:
+            operands_1: First operands
+            operation: Calculation symbol (+, -, *, /, %, /%, **)
+            operands_2: Second operand for every element, or array of the
+                same length
+            
+        Returns:
+            BinaryNumberArray of results, or a tuple of (quotients,
+            remainders) arrays for '/%'
+            
+        Raises:
+            ValueError: If operation is not a two-operand calculation, a
+                subtraction result would be negative, or operands_2 is an
+                array of a different length
+            ZeroDivisionError: If dividing by zero
+            
+        Example:
+            >>> executor = InstructionExecutor()
+            >>> results = executor.calculate_array(
+            ...     operands_1=BinaryNumberArray.from_ints(
+            ...         decimal_nums=[10, 11, 12]),
+            ...     operation='%',
+            ...     operands_2=BinaryNumber(binary_str='11'))
+            >>> results.to_ints()
+            [1, 2, 0]
+        """
+        if isinstance(operands_2, BinaryNumber):
+            operands_2 = p_itt.repeat(operands_2, len(operands_1))
+        elif len(operands_2) != len(operands_1):
+            raise ValueError(
+                f"Cannot combine arrays of length {len(operands_1)} and "
+                f"{len(operands_2)}")
+        
+        results = self.calculate_batch(instructions=[
+            BinaryInstruction(
+                operand_1=operand_1,
+                operand_2=operand_2,
+                operation=operation)
+            for operand_1, operand_2 in zip(operands_1, operands_2)])
+        if OperationEnum.from_symbol(operation) == OperationEnum.DIVMOD:
+            return (
+                BinaryNumberArray(numbers=[result[0] for result in results]),
+                BinaryNumberArray(numbers=[result[1] for result in results]))
+        return BinaryNumberArray(numbers=results)
+    
     def compare(
             self,
             *,
@@ -133,21 +363,127 @@ class InstructionExecutor:
                 f"Unsupported comparison operation: "
                 f"'{instruction.operation.symbol}'")
         
-        operation_func = operation_map[instruction.operation]
-        result = operation_func(
-            binary_1=instruction.operand_1.value,
-            binary_2=instruction.operand_2.value)
+        operand_1 = instruction.operand_1
+        operand_2 = instruction.operand_2
+        if operand_1.is_packed or operand_2.is_packed:
+            # Packed operands are compared limb by limb
+            order = self._comparator.compare_limbs(
+                limbs_1=operand_1.limbs,
+                limbs_2=operand_2.limbs)
+            result = self._limb_comparison_map[instruction.operation](order)
+        else:
+            operation_func = operation_map[instruction.operation]
+            result = operation_func(
+                binary_1=operand_1.value,
+                binary_2=operand_2.value)
         
         if print_result:
             self._print_comparison(instruction=instruction, result=result)
         
         return result
     
+    @staticmethod
+    def _calculate_prepared(
+            *,
+            instruction: 'BinaryInstruction',
+            prepared_divisor: PreparedDivisor) -> p_typ.Union[
+                BinaryNumber, p_typ.Tuple[BinaryNumber, BinaryNumber]]:
+        """Execute a division instruction with a prepared divisor.
+        
+        Args:
+            instruction: Division instruction (/, %, /%)
+            prepared_divisor: PreparedDivisor for operand_2
+            
+        Returns:
+            Quotient, remainder or both, as for calculate()
+            
+        Raises:
+            ValueError: If instruction is not a division or operand_2 does
+                not equal the prepared divisor
+        """
+        division_operations = (
+            OperationEnum.DIVIDE, OperationEnum.MODULO, OperationEnum.DIVMOD)
+        if instruction.operation not in division_operations:
+            raise ValueError(
+                f"A prepared divisor only applies to division operations, "
+                f"got '{instruction.operation.symbol}'")
+        if not prepared_divisor.matches(operand=instruction.operand_2):
+            raise ValueError(
+                "Prepared divisor does not match operand_2 of the "
+                "instruction")
+        
+        quotient, remainder = prepared_divisor.divmod_limbs(
+            limbs=instruction.operand_1.limbs)
+        if instruction.operation == OperationEnum.DIVIDE:
+            return InstructionExecutor._wrap_limbs(
+                limbs=quotient, instruction=instruction)
+        if instruction.operation == OperationEnum.MODULO:
+            return InstructionExecutor._wrap_limbs(
+                limbs=remainder, instruction=instruction)
+        return (
+            InstructionExecutor._wrap_limbs(
+                limbs=quotient, instruction=instruction),
+            InstructionExecutor._wrap_limbs(
+                limbs=remainder, instruction=instruction))
+    
+    @staticmethod
+    def _calculate_constant(
+            *,
+            instruction: 'BinaryInstruction',
+            constant_multiplier: ConstantMultiplier) -> BinaryNumber:
+        """Execute a multiplication instruction with a compiled constant.
+        
+        Args:
+            instruction: Multiplication instruction (*)
+            constant_multiplier: ConstantMultiplier for operand_2
+            
+        Returns:
+            Product as BinaryNumber object (packed if either operand is)
+            
+        Raises:
+            ValueError: If instruction is not a multiplication or operand_2
+                does not equal the compiled constant
+        """
+        if instruction.operation != OperationEnum.MULTIPLY:
+            raise ValueError(
+                f"A constant multiplier only applies to multiplication, "
+                f"got '{instruction.operation.symbol}'")
+        if not constant_multiplier.matches(operand=instruction.operand_2):
+            raise ValueError(
+                "Constant multiplier does not match operand_2 of the "
+                "instruction")
+        
+        return InstructionExecutor._wrap_limbs(
+            limbs=constant_multiplier.multiply_limbs(
+                limbs=instruction.operand_1.limbs),
+            instruction=instruction)
+    
+    @staticmethod
+    def _wrap_limbs(
+            *,
+            limbs: p_typ.Sequence[int],
+            instruction: 'BinaryInstruction') -> BinaryNumber:
+        """Wrap result limbs with the storage backend of an instruction.
+        
+        Args:
+            limbs: Result limbs, least significant limb first
+            instruction: Instruction the result belongs to
+            
+        Returns:
+            Packed BinaryNumber if either operand is packed, otherwise a
+            string-backed BinaryNumber
+        """
+        if instruction.operand_1.is_packed or instruction.operand_2.is_packed:
+            return BinaryNumber.from_limbs(limbs=limbs)
+        return BinaryNumber(binary_str=BinaryPacker.unpack(limbs=limbs))
+    
     def _print_calculation(
             self,
             *,
             instruction: 'BinaryInstruction',
-            result: BinaryNumber) -> None:
+            result: p_typ.Union[
+                BinaryNumber, p_typ.Tuple[BinaryNumber, BinaryNumber]]
+            ) -> None:
         """Print formatted calculation with result.
         
         Format:
@@ -157,18 +493,21 @@ class InstructionExecutor:
           <indent>result
           ===========
         
+        A (quotient, remainder) result is printed as two result lines.
+        
         Args:
             instruction: The instruction being executed
             result: The calculated result
         """
+        results = result if isinstance(result, tuple) else (result,)
+        
         # Print instruction
         print(instruction)
         
         # Calculate width for separator lines
         max_operand_width = max(
-            len(instruction.operand_1.value),
-            len(instruction.operand_2.value))
-        result_width = len(result.value)
+            len(value) for value in instruction.operand_values())
+        result_width = max(len(number.value) for number in results)
         total_width = max(
             instruction.__repr_indent__() + max_operand_width,
             instruction.__repr_indent__() + result_width)
@@ -176,10 +515,11 @@ class InstructionExecutor:
         # Print separator line
         print('-' * total_width)
         
-        # Print result (right-aligned with indent)
+        # Print results (right-aligned with indent)
         indent = ' ' * instruction.__repr_indent__()
         max_width = max(max_operand_width, result_width)
-        print(f"{indent}{result.value.rjust(max_width)}")
+        for number in results:
+            print(f"{indent}{number.value.rjust(max_width)}")
         
         # Print final separator line
         print('=' * total_width)
@@ -2,11 +2,13 @@
 
 from .binary_instruction import BinaryInstruction
 from .binary_number import BinaryNumber
+from .binary_number_array import BinaryNumberArray
 from .operation_enum import OperationEnum, OperationType
 
 __all__ = [
     'BinaryInstruction',
     'BinaryNumber',
+    'BinaryNumberArray',
     'OperationEnum',
     'OperationType']
 
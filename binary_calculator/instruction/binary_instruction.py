@@ -6,18 +6,24 @@ from .operation_enum import OperationEnum, OperationType
 
 
 class BinaryInstruction:
-    """Represents an instruction with two binary operands and an operation.
+    """Represents an instruction with binary operands and an operation.
     
     This class encapsulates binary operands and operations with validation.
     All attributes are accessed through properties with validated setters.
     
     Instructions have two states:
-    - CALCULATE: Arithmetic operations (+, -, *, /)
+    - CALCULATE: Arithmetic operations (+, -, *, /, %, /%, **, *+)
     - COMPARE: Comparison operations (<, <=, >, >=, ==, !=)
     
+    The fused multiply-add (*+) is the only three-operand form and computes
+    operand_1 * operand_2 + operand_3; all other operations take exactly two
+    operands. Use set_operation() to switch an instruction into or out of
+    '*+'.
+    
     Attributes:
         operand_1: First binary number as BinaryNumber object
         operand_2: Second binary number as BinaryNumber object
+        operand_3: Addend of '*+' as BinaryNumber object, None otherwise
         operation: Operation enum member (e.g., OperationEnum.ADD)
         state: Instruction state (OperationType.CALCULATE or OperationType.COMPARE)
     """
@@ -27,21 +33,27 @@ class BinaryInstruction:
             *,
             operand_1: BinaryNumber,
             operand_2: BinaryNumber,
-            operation: str) -> None:
+            operation: str,
+            operand_3: p_typ.Optional[BinaryNumber] = None) -> None:
         """Initialize a binary instruction.
         
         Args:
             operand_1: First binary number as BinaryNumber object
             operand_2: Second binary number as BinaryNumber object
-            operation: Operation symbol (+, -, *, /, <, <=, >, >=, ==, !=)
+            operation: Operation symbol (+, -, *, /, %, /%, **, *+, <, <=,
+                >, >=, ==, !=)
+            operand_3: Addend as BinaryNumber object, required for '*+'
+                and not allowed otherwise
             
         Raises:
-            ValueError: If operation is not supported
+            ValueError: If operation is not supported, or operand_3 does not
+                fit the operation
             TypeError: If operands are not BinaryNumber instances
         """
         # Use property setters for validation
         self.operand_1 = operand_1
         self.operand_2 = operand_2
+        self.operand_3 = operand_3
         self.operation = operation
         # State is automatically set based on operation type
     
@@ -95,6 +107,37 @@ class BinaryInstruction:
                 f"got {type(value).__name__}")
         self._operand_2 = value
     
+    @property
+    def operand_3(self) -> p_typ.Optional[BinaryNumber]:
+        """Get the third binary operand (addend of '*+').
+        
+        Returns:
+            Third binary operand as BinaryNumber object, or None
+        """
+        return self._operand_3
+    
+    @operand_3.setter
+    def operand_3(self, value: p_typ.Optional[BinaryNumber]) -> None:
+        """Set the third binary operand with validation.
+        
+        Args:
+            value: BinaryNumber object to set, or None
+            
+        Raises:
+            TypeError: If value is neither None nor a BinaryNumber instance
+            ValueError: If value is None for '*+' or set for another
+                operation
+        """
+        if value is not None and not isinstance(value, BinaryNumber):
+            raise TypeError(
+                f"operand_3 must be a BinaryNumber instance or None, "
+                f"got {type(value).__name__}")
+        # The operation is not set yet while __init__ runs
+        operation = getattr(self, '_operation', None)
+        if operation is not None:
+            self._validate_operand_3(operation=operation, operand_3=value)
+        self._operand_3 = value
+    
     @property
     def operation(self) -> OperationEnum:
         """Get the operation enum.
@@ -109,14 +152,75 @@ class BinaryInstruction:
         """Set the operation with validation.
         
         Args:
-            value: Operation symbol to set (+, -, *, /, <, <=, >, >=, ==, !=)
+            value: Operation symbol to set (+, -, *, /, %, /%, **, *+, <,
+                <=, >, >=, ==, !=)
             
         Raises:
-            ValueError: If value is not a supported operation
+            ValueError: If value is not a supported operation, or operand_3
+                is missing for '*+' or set for another operation
         """
         # Convert symbol to enum and validate
         operation_enum = OperationEnum.from_symbol(symbol=value)
+        self._validate_operand_3(
+            operation=operation_enum,
+            operand_3=self._operand_3)
+        self._operation = operation_enum
+    
+    def set_operation(
+            self,
+            *,
+            operation: str,
+            operand_3: p_typ.Optional[BinaryNumber] = None) -> None:
+        """Set the operation and operand_3 together.
+        
+        Switching an instruction into or out of '*+' changes both the
+        operation and whether operand_3 is set, which the individual
+        setters cannot do one after the other.
+        
+        Args:
+            operation: Operation symbol to set (+, -, *, /, %, /%, **, *+,
+                <, <=, >, >=, ==, !=)
+            operand_3: Addend as BinaryNumber object, required for '*+'
+                and not allowed otherwise
+            
+        Raises:
+            ValueError: If operation is not supported, or operand_3 does not
+                fit the operation
+            TypeError: If operand_3 is neither None nor a BinaryNumber
+                instance
+        """
+        if operand_3 is not None and not isinstance(operand_3, BinaryNumber):
+            raise TypeError(
+                f"operand_3 must be a BinaryNumber instance or None, "
+                f"got {type(operand_3).__name__}")
+        operation_enum = OperationEnum.from_symbol(symbol=operation)
+        self._validate_operand_3(operation=operation_enum, operand_3=operand_3)
         self._operation = operation_enum
+        self._operand_3 = operand_3
+    
+    @staticmethod
+    def _validate_operand_3(
+            *,
+            operation: OperationEnum,
+            operand_3: p_typ.Optional[BinaryNumber]) -> None:
+        """Validate that operand_3 fits the operation.
+        
+        Args:
+            operation: Operation enum member
+            operand_3: Third operand, or None
+            
+        Raises:
+            ValueError: If operand_3 is None for '*+' or set for another
+                operation
+        """
+        if operation == OperationEnum.MULTIPLY_ADD:
+            if operand_3 is None:
+                raise ValueError(
+                    f"Operation '{operation.symbol}' requires operand_3")
+        elif operand_3 is not None:
+            raise ValueError(
+                f"Operation '{operation.symbol}' takes two operands, "
+                f"but operand_3 is set")
     
     @property
     def state(self) -> OperationType:
@@ -152,25 +256,49 @@ class BinaryInstruction:
         """
         return len(self.operation.symbol) + 1
     
+    def operand_values(self) -> p_typ.List[str]:
+        """Get the binary strings of all operands.
+        
+        Returns:
+            List of operand values (two, or three for '*+')
+        """
+        operands = [self.operand_1, self.operand_2]
+        if self.operand_3 is not None:
+            operands.append(self.operand_3)
+        return [operand.value for operand in operands]
+    
     def __repr__(self) -> str:
-        """Return two-line string representation of the instruction.
+        """Return the multi-line string representation of the instruction.
         
         Format (right-aligned binary numbers):
             <indent>operand_1
           <op> operand_2
         
+        A '*+' instruction shows its factors and addend on three lines:
+            <indent>operand_1
+          *  operand_2
+          +  operand_3
+        
         Returns:
-            Two-line formatted string showing the binary operation
+            Formatted string showing the binary operation
         """
         indent = ' ' * self.__repr_indent__()
+        values = self.operand_values()
         
         # Calculate maximum width for right alignment
-        max_width = max(len(self.operand_1.value), len(self.operand_2.value))
+        max_width = max(len(value) for value in values)
         
-        # Right-align both operands
-        line_1 = f"{indent}{self.operand_1.value.rjust(max_width)}"
-        line_2 = (f"{self.operation.symbol} "
-                  f"{self.operand_2.value.rjust(max_width)}")
+        # Right-align all operands
+        line_1 = f"{indent}{values[0].rjust(max_width)}"
+        if self.operation != OperationEnum.MULTIPLY_ADD:
+            line_2 = (f"{self.operation.symbol} "
+                      f"{values[1].rjust(max_width)}")
+            return f"{line_1}\n{line_2}"
         
-        return f"{line_1}\n{line_2}"
+        symbols = self.operation.symbol
+        line_2 = (f"{symbols[0].ljust(len(symbols))} "
+                  f"{values[1].rjust(max_width)}")
+        line_3 = (f"{symbols[1].ljust(len(symbols))} "
+                  f"{values[2].rjust(max_width)}")
+        return f"{line_1}\n{line_2}\n{line_3}"
 
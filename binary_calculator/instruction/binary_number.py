@@ -1,7 +1,10 @@
 """Binary number class for encapsulating binary string values."""
 
+import array as p_arr
+import sys as p_sys
 import typing as p_typ
 from ..comparator.binary_comparator import BinaryComparator
+from ..limbs import BinaryPacker, LimbArithmetic
 
 
 class BinaryNumber:
@@ -11,37 +14,276 @@ class BinaryNumber:
     methods for conversion, increment, decrement, and copying operations.
     All binary values are stored as strings containing only '0' and '1'.
     
+    Alternatively, a number can use the packed storage backend, which keeps
+    the bits in an array of 64-bit limbs (least significant limb first).
+    Packed numbers need one eighth of the memory of the string form and let
+    ArithmeticCalculator and BinaryComparator work a word at a time. Their
+    string value is materialized on demand and is not cached. Raw unsigned
+    integers are moved in and out of packed numbers as bytes (from_bytes(),
+    to_bytes()) or shared as a read-only buffer (to_memoryview()).
+    
     Attributes:
         value: Binary number as string (e.g., '1010')
+        limbs: Binary number as array of 64-bit limbs
+        is_packed: True if the packed storage backend is used
     """
     
-    def __init__(self, *, binary_str: str) -> None:
+    def __init__(self, *, binary_str: str, packed: bool = False) -> None:
         """Initialize a binary number.
         
         Args:
             binary_str: Binary number as string containing only 0s and 1s
+            packed: If True, store the value as 64-bit limbs
             
         Raises:
             ValueError: If binary_str is not a valid binary string
         """
         self._validate_binary_string(binary_str=binary_str)
-        self._value = binary_str
+        if packed:
+            self._value: p_typ.Optional[str] = None
+            self._limbs: p_typ.Optional[p_arr.array] = BinaryPacker.pack(
+                binary_str=binary_str)
+            self._width = len(binary_str)
+        else:
+            self._value = binary_str
+            self._limbs = None
+            self._width = 0
     
     @property
     def value(self) -> str:
         """Get the binary value as string.
         
+        For packed numbers the string is rendered from the limbs on every
+        access, keeping the width the number was created with.
+        
         Returns:
             Binary number as string
         """
+        if self._limbs is not None:
+            return BinaryPacker.unpack(limbs=self._limbs, width=self._width)
         return self._value
     
+    @property
+    def limbs(self) -> p_arr.array:
+        """Get the binary value as array of 64-bit limbs.
+        
+        Packed numbers return their own storage (do not modify it), string
+        numbers are packed into a new array on every access.
+        
+        Returns:
+            array('Q') of limbs, least significant limb first
+        """
+        if self._limbs is not None:
+            return self._limbs
+        return BinaryPacker.pack(binary_str=self._value)
+    
+    @property
+    def is_packed(self) -> bool:
+        """Check if the packed storage backend is used.
+        
+        Returns:
+            True if the value is stored as 64-bit limbs
+        """
+        return self._limbs is not None
+    
+    @classmethod
+    def from_limbs(
+            cls,
+            *,
+            limbs: p_typ.Iterable[int]) -> 'BinaryNumber':
+        """Create a packed BinaryNumber from 64-bit limbs.
+        
+        Args:
+            limbs: Limbs of the number, least significant limb first
+            
+        Returns:
+            New packed BinaryNumber instance
+            
+        Example:
+            >>> num = BinaryNumber.from_limbs(limbs=[0, 1])
+            >>> num.bit_length()
+            65
+        """
+        number = cls.__new__(cls)
+        number._value = None
+        number._limbs = BinaryPacker.to_array(limbs=limbs)
+        number._width = 0
+        return number
+    
+    @classmethod
+    def from_bytes(
+            cls,
+            *,
+            buffer: p_typ.Any,
+            byteorder: str = 'big',
+            packed: bool = True) -> 'BinaryNumber':
+        """Create a BinaryNumber from an unsigned integer in a buffer.
+        
+        The buffer is read through a memoryview, so bytes, bytearray,
+        memoryview and mmap objects (or slices of them) are accepted. With
+        the packed backend its 8-byte words are copied straight into the
+        limb array; neither a Python int nor a binary string is built.
+        
+        Args:
+            buffer: Object supporting the buffer protocol, C-contiguous
+            byteorder: Byte order of the buffer, 'big' or 'little'
+                ('little' needs no reordering of the words)
+            packed: If True, store the value as 64-bit limbs
+            
+        Returns:
+            New BinaryNumber instance
+            
+        Raises:
+            ValueError: If byteorder is not 'big' or 'little'
+            
+        Example:
+            >>> num = BinaryNumber.from_bytes(buffer=b'\\x01\\x02')
+            >>> num.to_int()
+            258
+        """
+        limbs = BinaryPacker.from_bytes(buffer=buffer, byteorder=byteorder)
+        if not packed:
+            return cls(binary_str=BinaryPacker.unpack(limbs=limbs))
+        return cls._wrap_limbs(limbs=limbs)
+    
     @classmethod
-    def from_int(cls, *, decimal_num: int) -> 'BinaryNumber':
+    def _wrap_limbs(
+            cls,
+            *,
+            limbs: p_typ.Union[p_arr.array, memoryview]) -> 'BinaryNumber':
+        """Create a packed BinaryNumber that uses limbs as its storage.
+        
+        Unlike from_limbs(), the limbs are neither copied nor trimmed.
+        
+        Args:
+            limbs: Trimmed array('Q') or 'Q' memoryview, least significant
+                limb first
+            
+        Returns:
+            New packed BinaryNumber instance sharing limbs
+        """
+        number = cls.__new__(cls)
+        number._value = None
+        number._limbs = limbs
+        number._width = 0
+        return number
+    
+    def to_bytes(
+            self,
+            *,
+            byteorder: str = 'big',
+            length: p_typ.Optional[int] = None) -> bytes:
+        """Export the number as an unsigned integer in bytes.
+        
+        Packed numbers are exported from their limbs without building a
+        Python int or a binary string.
+        
+        Args:
+            byteorder: Byte order of the result, 'big' or 'little'
+            length: Number of bytes (defaults to the fewest bytes that
+                hold the number, at least one)
+            
+        Returns:
+            Unsigned integer as bytes
+            
+        Raises:
+            ValueError: If byteorder is not 'big' or 'little', or if the
+                number does not fit in length bytes
+            
+        Example:
+            >>> BinaryNumber(binary_str='100000010').to_bytes(length=4)
+            b'\\x00\\x00\\x01\\x02'
+        """
+        return BinaryPacker.to_bytes(
+            limbs=self.limbs,
+            byteorder=byteorder,
+            length=length)
+    
+    def to_memoryview(self) -> memoryview:
+        """Get a read-only view of the number's 64-bit limbs.
+        
+        For packed numbers the view shares the limb storage (zero-copy on
+        Python 3.8+, a read-only copy before); string numbers are packed
+        first. The view has format 'Q' and holds the limbs least
+        significant first in native byte order, so on little-endian hosts
+        its bytes are the little-endian integer padded to whole limbs. Zero is an empty view. The view stays valid (and
+        unchanged) when the number is later modified, e.g. by incr().
+        
+        Returns:
+            Read-only memoryview of the limbs
+            
+        Example:
+            >>> view = BinaryNumber.from_int(decimal_num=5).to_memoryview()
+            >>> view.format, view.tolist()
+            ('Q', [5])
+        """
+        return BinaryPacker.readonly_view(buffer=self.limbs)
+    
+    def __buffer__(self, flags: int) -> memoryview:
+        """Export the limbs through the buffer protocol (see to_memoryview()).
+        
+        Since Python 3.12, this lets memoryview(number), bytes(number) and
+        other buffer consumers read a BinaryNumber directly.
+        
+        Args:
+            flags: Buffer request flags (writable requests are refused by
+                the read-only view)
+            
+        Returns:
+            Read-only memoryview of the limbs
+        """
+        return self.to_memoryview()
+    
+    def __getstate__(self) -> p_typ.Dict[str, p_typ.Any]:
+        """Get the state for pickling and copying.
+        
+        Views created by _wrap_limbs() (e.g. BinaryNumberArray elements)
+        store their limbs as memoryview, which cannot be pickled; the state
+        holds an owned array('Q') copy instead.
+        
+        Returns:
+            Attribute dict with limbs as array('Q') (or None)
+        """
+        state = self.__dict__.copy()
+        if isinstance(self._limbs, memoryview):
+            state['_limbs'] = p_arr.array('Q', self._limbs)
+        return state
+    
+    def to_packed(self) -> 'BinaryNumber':
+        """Get this number using the packed storage backend.
+        
+        Returns:
+            This instance if already packed, otherwise a packed copy
+        """
+        if self._limbs is not None:
+            return self
+        return BinaryNumber(binary_str=self._value, packed=True)
+    
+    def bit_length(self) -> int:
+        """Get the number of significant bits.
+        
+        Returns:
+            Bit length without leading zeros (0 for zero)
+            
+        Example:
+            >>> BinaryNumber(binary_str='00101').bit_length()
+            3
+        """
+        if self._limbs is not None:
+            return BinaryPacker.bit_length(limbs=self._limbs)
+        return len(self._value.lstrip('0'))
+    
+    @classmethod
+    def from_int(
+            cls,
+            *,
+            decimal_num: int,
+            packed: bool = False) -> 'BinaryNumber':
         """Create a BinaryNumber from a decimal integer.
         
         Args:
             decimal_num: Decimal integer to convert (must be non-negative)
+            packed: If True, store the value as 64-bit limbs
             
         Returns:
             New BinaryNumber instance
@@ -60,7 +302,7 @@ class BinaryNumber:
                 f"{decimal_num}")
         
         binary_str = bin(decimal_num)[2:]
-        return cls(binary_str=binary_str)
+        return cls(binary_str=binary_str, packed=packed)
     
     def to_int(self) -> int:
         """Convert the binary number to a decimal integer.
@@ -73,6 +315,8 @@ class BinaryNumber:
             >>> num.to_int()
             10
         """
+        if self._limbs is not None:
+            return int.from_bytes(self._limbs.tobytes(), p_sys.byteorder)
         return int(self._value, 2)
     
     def incr(
@@ -93,6 +337,13 @@ class BinaryNumber:
         if increment is None:
             increment = BinaryNumber(binary_str='1')
         
+        if self._limbs is not None:
+            self._limbs = BinaryPacker.to_array(limbs=LimbArithmetic.add(
+                limbs_1=self._limbs,
+                limbs_2=increment.limbs))
+            self._width = 0
+            return
+        
         result = self.to_int() + increment.to_int()
         self._value = bin(result)[2:]
     
@@ -117,6 +368,18 @@ class BinaryNumber:
         if decrement is None:
             decrement = BinaryNumber(binary_str='1')
         
+        if self._limbs is not None:
+            result, borrow = LimbArithmetic.subtract_with_borrow(
+                limbs_1=self._limbs,
+                limbs_2=decrement.limbs)
+            if borrow:
+                raise ValueError(
+                    f"Cannot decrement {self.value} by {decrement.value}: "
+                    f"result would be negative")
+            self._limbs = BinaryPacker.to_array(limbs=result)
+            self._width = 0
+            return
+        
         current_val = self.to_int()
         decrement_val = decrement.to_int()
         
@@ -140,6 +403,10 @@ class BinaryNumber:
             >>> num2.value
             '1010'
         """
+        if self._limbs is not None:
+            number = BinaryNumber.from_limbs(limbs=self._limbs)
+            number._width = self._width
+            return number
         return BinaryNumber(binary_str=self._value)
     
     @staticmethod
@@ -155,18 +422,38 @@ class BinaryNumber:
         if not binary_str:
             raise ValueError("Binary string cannot be empty")
         
-        if not all(char in '01' for char in binary_str):
+        if binary_str.strip('01'):
             raise ValueError(
                 f"Invalid binary string: '{binary_str}'. "
                 f"Must contain only 0 and 1")
     
     def __repr__(self) -> str:
         """Return string representation of the binary number."""
-        return f"BinaryNumber(value='{self._value}')"
+        return f"BinaryNumber(value='{self.value}')"
     
     def __str__(self) -> str:
         """Return the binary value as string."""
-        return self._value
+        return self.value
+    
+    def _compare_with(self, *, other: 'BinaryNumber') -> int:
+        """Compare this BinaryNumber with another using BinaryComparator.
+        
+        Packed operands are compared limb by limb, string operands
+        character by character.
+        
+        Args:
+            other: BinaryNumber to compare with
+            
+        Returns:
+            -1, 0 or 1 as returned by BinaryComparator
+        """
+        if self._limbs is not None or other._limbs is not None:
+            return BinaryComparator.compare_limbs(
+                limbs_1=self.limbs,
+                limbs_2=other.limbs)
+        return BinaryComparator.compare(
+            binary_1=self._value,
+            binary_2=other._value)
     
     def __eq__(self, other: object) -> bool:
         """Compare two BinaryNumber instances for equality.
@@ -181,8 +468,7 @@ class BinaryNumber:
         """
         if not isinstance(other, BinaryNumber):
             return NotImplemented
-        comparator = BinaryComparator()
-        return comparator.equal(binary_1=self._value, binary_2=other._value)
+        return self._compare_with(other=other) == 0
     
     def __ne__(self, other: object) -> bool:
         """Compare two BinaryNumber instances for inequality.
@@ -197,10 +483,7 @@ class BinaryNumber:
         """
         if not isinstance(other, BinaryNumber):
             return NotImplemented
-        comparator = BinaryComparator()
-        return comparator.not_equal(
-            binary_1=self._value,
-            binary_2=other._value)
+        return self._compare_with(other=other) != 0
     
     def __lt__(self, other: object) -> bool:
         """Compare if this BinaryNumber is less than another.
@@ -215,10 +498,7 @@ class BinaryNumber:
         """
         if not isinstance(other, BinaryNumber):
             return NotImplemented
-        comparator = BinaryComparator()
-        return comparator.smaller(
-            binary_1=self._value,
-            binary_2=other._value)
+        return self._compare_with(other=other) < 0
     
     def __le__(self, other: object) -> bool:
         """Compare if this BinaryNumber is less than or equal to another.
@@ -233,10 +513,7 @@ class BinaryNumber:
         """
         if not isinstance(other, BinaryNumber):
             return NotImplemented
-        comparator = BinaryComparator()
-        return comparator.smaller_equal(
-            binary_1=self._value,
-            binary_2=other._value)
+        return self._compare_with(other=other) <= 0
     
     def __gt__(self, other: object) -> bool:
         """Compare if this BinaryNumber is greater than another.
@@ -251,8 +528,7 @@ class BinaryNumber:
         """
         if not isinstance(other, BinaryNumber):
             return NotImplemented
-        comparator = BinaryComparator()
-        return comparator.larger(binary_1=self._value, binary_2=other._value)
+        return self._compare_with(other=other) > 0
     
     def __ge__(self, other: object) -> bool:
         """Compare if this BinaryNumber is greater than or equal to another.
@@ -267,8 +543,4 @@ class BinaryNumber:
         """
         if not isinstance(other, BinaryNumber):
             return NotImplemented
-        comparator = BinaryComparator()
-        return comparator.larger_equal(
-            binary_1=self._value,
-            binary_2=other._value)
-
+        return self._compare_with(other=other) >= 0
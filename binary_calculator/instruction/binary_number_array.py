@@ -0,0 +1,435 @@
+"""Binary number array class for compact columns of binary numbers."""
+
+import array as p_arr
+import itertools as p_itt
+import operator as p_op
+import sys as p_sys
+import typing as p_typ
+from ..comparator.binary_comparator import BinaryComparator
+from ..limbs import BinaryPacker, LimbArithmetic, LIMB_MASK
+from .binary_number import BinaryNumber
+from .operation_enum import OperationEnum
+
+Element = p_typ.Union[int, memoryview]
+Operand = p_typ.Union['BinaryNumberArray', BinaryNumber]
+
+
+class BinaryNumberArray:
+    """Array of non-negative binary numbers in one contiguous limb buffer.
+    
+    A list of BinaryNumber objects costs an object, its attribute dict and
+    a string (or limb array) per value. A BinaryNumberArray stores all
+    values back to back as trimmed 64-bit limbs in a single array('Q'),
+    indexed by two more arrays holding each value's first limb (offset)
+    and limb count (length). Values take 8 bytes per limb plus 16 bytes
+    of index, whatever their number.
+    
+    The buffers are read-only once built and are shared, not copied:
+        - Slicing (including steps) returns an array over slices of the
+          index, sharing the limb buffer
+        - Indexing and iteration yield lightweight views: packed
+          BinaryNumbers whose limbs are read-only memoryviews into the
+          buffer. A view behaves like any other packed BinaryNumber; in
+          place operations such as incr() give it its own storage and
+          leave the array unchanged
+    
+    add(), subtract() and compare() work element-wise against a scalar
+    BinaryNumber or another array of the same length. Values that fit in
+    one limb (the usual case for columns of fixed-width data) are handled
+    as plain 64-bit words; longer values go through the LimbArithmetic and
+    BinaryComparator limb kernels. Other operations run element-wise
+    through InstructionExecutor.calculate_array().
+    
+    Example:
+        >>> numbers = BinaryNumberArray.from_ints(decimal_nums=[5, 2, 9])
+        >>> numbers.add(other=BinaryNumber(binary_str='1')).to_ints()
+        [6, 3, 10]
+        >>> numbers[::2].compare(other=numbers[1:], operation='<')
+        [False, False]
+    """
+    
+    _ORDER_TESTS: p_typ.Dict[
+            OperationEnum, p_typ.Callable[[int, int], bool]] = {
+        OperationEnum.SMALLER: p_op.lt,
+        OperationEnum.SMALLER_EQUAL: p_op.le,
+        OperationEnum.LARGER: p_op.gt,
+        OperationEnum.LARGER_EQUAL: p_op.ge,
+        OperationEnum.EQUAL: p_op.eq,
+        OperationEnum.NOT_EQUAL: p_op.ne}
+    
+    def __init__(
+            self,
+            *,
+            numbers: p_typ.Iterable[BinaryNumber] = ()) -> None:
+        """Initialize the array by packing binary numbers.
+        
+        String numbers are packed; leading zeros (the string width) are
+        not kept.
+        
+        Args:
+            numbers: BinaryNumbers to store, in order
+        """
+        data, offsets, lengths = self._pack(
+            values=(number.limbs for number in numbers))
+        self._set_storage(data=data, offsets=offsets, lengths=lengths)
+    
+    @classmethod
+    def from_ints(
+            cls,
+            *,
+            decimal_nums: p_typ.Iterable[int]) -> 'BinaryNumberArray':
+        """Create an array from decimal integers.
+        
+        Args:
+            decimal_nums: Integers to store (must be non-negative)
+            
+        Returns:
+            New BinaryNumberArray instance
+            
+        Raises:
+            ValueError: If an integer is negative
+            
+        Example:
+            >>> numbers = BinaryNumberArray.from_ints(
+            ...     decimal_nums=[3, 2 ** 64])
+            >>> [len(number.limbs) for number in numbers]
+            [1, 2]
+        """
+        decimal_nums = list(decimal_nums)
+        if decimal_nums and min(decimal_nums) < 0:
+            raise ValueError(
+                f"Cannot create BinaryNumberArray from negative integer: "
+                f"{min(decimal_nums)}")
+        
+        return cls._from_values(values=decimal_nums)
+    
+    def to_ints(self) -> p_typ.List[int]:
+        """Convert all values to decimal integers.
+        
+        Returns:
+            List of integers in array order
+        """
+        return [
+            element if isinstance(element, int)
+            else int.from_bytes(element, p_sys.byteorder)
+            for element in self._elements()]
+    
+    def copy(self) -> 'BinaryNumberArray':
+        """Create a compact copy with its own buffers.
+        
+        A slice keeps the whole limb buffer of its source alive; a copy
+        holds only its own values.
+        
+        Returns:
+            New BinaryNumberArray instance with the same values
+        """
+        return self._from_values(values=self._elements())
+    
+    def add(self, *, other: Operand) -> 'BinaryNumberArray':
+        """Add a scalar or another array element-wise.
+        
+        Args:
+            other: BinaryNumber added to every element, or array of the
+                same length
+            
+        Returns:
+            New BinaryNumberArray with the sums
+            
+        Raises:
+            ValueError: If other is an array of a different length
+            TypeError: If other is neither BinaryNumber nor
+                BinaryNumberArray
+        """
+        return self._from_values(values=(
+            value_1 + value_2
+            if isinstance(value_1, int) and isinstance(value_2, int)
+            else LimbArithmetic.add(
+                limbs_1=self._as_limbs(element=value_1),
+                limbs_2=self._as_limbs(element=value_2))
+            for value_1, value_2 in self._pairs(other=other)))
+    
+    def subtract(self, *, other: Operand) -> 'BinaryNumberArray':
+        """Subtract a scalar or another array element-wise.
+        
+        Args:
+            other: BinaryNumber subtracted from every element, or array of
+                the same length
+            
+        Returns:
+            New BinaryNumberArray with the differences
+            
+        Raises:
+            ValueError: If a difference would be negative, or if other is
+                an array of a different length
+            TypeError: If other is neither BinaryNumber nor
+                BinaryNumberArray
+        """
+        return self._from_values(
+            values=self._differences(pairs=self._pairs(other=other)))
+    
+    def compare(
+            self,
+            *,
+            other: Operand,
+            operation: str) -> p_typ.List[bool]:
+        """Compare with a scalar or another array element-wise.
+        
+        Args:
+            other: BinaryNumber compared with every element, or array of
+                the same length
+            operation: Comparison symbol (<, <=, >, >=, ==, !=)
+            
+        Returns:
+            List of comparison results in array order
+            
+        Raises:
+            ValueError: If operation is not a comparison, or if other is an
+                array of a different length
+            TypeError: If other is neither BinaryNumber nor
+                BinaryNumberArray
+        """
+        test = self._ORDER_TESTS.get(OperationEnum.from_symbol(operation))
+        if test is None:
+            raise ValueError(
+                f"Operation '{operation}' is a calculation, not a "
+                f"comparison")
+        
+        return [
+            test(value_1, value_2)
+            if isinstance(value_1, int) and isinstance(value_2, int)
+            else test(BinaryComparator.compare_limbs(
+                limbs_1=self._as_limbs(element=value_1),
+                limbs_2=self._as_limbs(element=value_2)), 0)
+            for value_1, value_2 in self._pairs(other=other)]
+    
+    def __len__(self) -> int:
+        """Return the number of values."""
+        return len(self._offsets)
+    
+    def __getitem__(
+            self,
+            index: p_typ.Union[int, slice]) -> p_typ.Union[
+                BinaryNumber, 'BinaryNumberArray']:
+        """Get a view of one value, or a zero-copy slice.
+        
+        Args:
+            index: Position of the value, or slice of positions
+            
+        Returns:
+            Packed BinaryNumber view for an integer index, BinaryNumberArray
+            sharing this array's buffers for a slice
+            
+        Raises:
+            IndexError: If index is out of range
+        """
+        if isinstance(index, slice):
+            array = BinaryNumberArray.__new__(BinaryNumberArray)
+            array._set_storage(
+                data=self._data,
+                offsets=self._offsets[index],
+                lengths=self._lengths[index])
+            return array
+        
+        if not -len(self) <= index < len(self):
+            raise IndexError(
+                f"BinaryNumberArray index {index} out of range for length "
+                f"{len(self)}")
+        offset = self._offsets[index]
+        return BinaryNumber._wrap_limbs(
+            limbs=self._data[offset:offset + self._lengths[index]])
+    
+    def __iter__(self) -> p_typ.Iterator[BinaryNumber]:
+        """Iterate over views of the values (see __getitem__())."""
+        data = self._data
+        for offset, length in zip(self._offsets, self._lengths):
+            yield BinaryNumber._wrap_limbs(
+                limbs=data[offset:offset + length])
+    
+    def __repr__(self) -> str:
+        """Return string representation with up to ten values."""
+        shown = [repr(number.value) for number in self[:10]]
+        if len(self) > 10:
+            shown.append(f"... ({len(self)} values)")
+        return f"BinaryNumberArray([{', '.join(shown)}])"
+    
+    def __getstate__(self) -> p_typ.Dict[str, p_arr.array]:
+        """Get the state for pickling and copying.
+        
+        The read-only memoryviews cannot be pickled; the state holds the
+        values repacked into owned array('Q') buffers, compacted as by
+        copy().
+        
+        Returns:
+            Dict of the data, offsets and lengths arrays
+        """
+        data, offsets, lengths = self._pack(values=self._elements())
+        return {'data': data, 'offsets': offsets, 'lengths': lengths}
+    
+    def __setstate__(self, state: p_typ.Dict[str, p_arr.array]) -> None:
+        """Restore the read-only views from a pickled state.
+        
+        Args:
+            state: Dict returned by __getstate__()
+        """
+        self._set_storage(
+            data=state['data'],
+            offsets=state['offsets'],
+            lengths=state['lengths'])
+    
+    @classmethod
+    def _from_values(
+            cls,
+            *,
+            values: p_typ.Iterable[p_typ.Union[int, p_typ.Sequence[int]]]
+            ) -> 'BinaryNumberArray':
+        """Create an array from ints or trimmed limb sequences.
+        
+        Args:
+            values: Non-negative ints or trimmed limb sequences
+            
+        Returns:
+            New BinaryNumberArray instance
+        """
+        data, offsets, lengths = cls._pack(values=values)
+        array = cls.__new__(cls)
+        array._set_storage(data=data, offsets=offsets, lengths=lengths)
+        return array
+    
+    def _set_storage(
+            self,
+            *,
+            data: p_typ.Union[p_arr.array, memoryview],
+            offsets: p_typ.Union[p_arr.array, memoryview],
+            lengths: p_typ.Union[p_arr.array, memoryview]) -> None:
+        """Store read-only views of the limb buffer and the index.
+        
+        Args:
+            data: Limbs of all values ('Q' array or memoryview)
+            offsets: First limb of every value ('Q' array or memoryview)
+            lengths: Limb count of every value ('Q' array or memoryview)
+        """
+        self._data = BinaryPacker.readonly_view(buffer=data)
+        self._offsets = BinaryPacker.readonly_view(buffer=offsets)
+        self._lengths = BinaryPacker.readonly_view(buffer=lengths)
+    
+    def _elements(self) -> p_typ.Iterator[Element]:
+        """Iterate over the values as single words or limb views.
+        
+        Returns:
+            Iterator yielding an int for values of at most one limb and a
+            'Q' memoryview of the limbs for longer values
+        """
+        data = self._data
+        for offset, length in zip(self._offsets, self._lengths):
+            if length > 1:
+                yield data[offset:offset + length]
+            else:
+                yield data[offset] if length else 0
+    
+    def _pairs(
+            self,
+            *,
+            other: Operand) -> p_typ.Iterator[p_typ.Tuple[Element, Element]]:
+        """Pair every element with the matching element of other.
+        
+        Args:
+            other: Scalar BinaryNumber or array of the same length
+            
+        Returns:
+            Iterator of (element, other element) pairs
+            
+        Raises:
+            ValueError: If other is an array of a different length
+            TypeError: If other is neither BinaryNumber nor
+                BinaryNumberArray
+        """
+        if isinstance(other, BinaryNumber):
+            limbs = other.limbs
+            scalar = limbs if len(limbs) > 1 else (limbs[0] if limbs else 0)
+            return zip(self._elements(), p_itt.repeat(scalar))
+        if isinstance(other, BinaryNumberArray):
+            if len(other) != len(self):
+                raise ValueError(
+                    f"Cannot combine arrays of length {len(self)} and "
+                    f"{len(other)}")
+            return zip(self._elements(), other._elements())
+        raise TypeError(
+            f"other must be a BinaryNumber or BinaryNumberArray, got "
+            f"{type(other).__name__}")
+    
+    def _differences(
+            self,
+            *,
+            pairs: p_typ.Iterable[p_typ.Tuple[Element, Element]]
+            ) -> p_typ.Iterator[p_typ.Union[int, p_typ.List[int]]]:
+        """Subtract the elements of every pair.
+        
+        Args:
+            pairs: (minuend, subtrahend) element pairs
+            
+        Returns:
+            Iterator of differences as ints or trimmed limb lists
+            
+        Raises:
+            ValueError: If a difference would be negative
+        """
+        for index, (value_1, value_2) in enumerate(pairs):
+            if isinstance(value_1, int) and isinstance(value_2, int):
+                difference = value_1 - value_2
+                borrow = difference < 0
+            else:
+                difference, borrow = LimbArithmetic.subtract_with_borrow(
+                    limbs_1=self._as_limbs(element=value_1),
+                    limbs_2=self._as_limbs(element=value_2))
+                while difference and not difference[-1]:
+                    difference.pop()
+            if borrow:
+                raise ValueError(
+                    f"Cannot subtract: result would be negative at index "
+                    f"{index}")
+            yield difference
+    
+    @staticmethod
+    def _as_limbs(*, element: Element) -> p_typ.Sequence[int]:
+        """Get an element as limb sequence.
+        
+        Args:
+            element: Single word or limb view
+            
+        Returns:
+            Trimmed limbs, least significant limb first
+        """
+        if isinstance(element, int):
+            return [element] if element else []
+        return element
+    
+    @staticmethod
+    def _pack(
+            *,
+            values: p_typ.Iterable[p_typ.Union[int, p_typ.Sequence[int]]]
+            ) -> p_typ.Tuple[p_arr.array, p_arr.array, p_arr.array]:
+        """Pack values into a limb buffer and its offset/length index.
+        
+        Args:
+            values: Non-negative ints or trimmed limb sequences
+            
+        Returns:
+            Tuple of (data, offsets, lengths) arrays
+        """
+        data = p_arr.array('Q')
+        offsets = p_arr.array('Q')
+        lengths = p_arr.array('Q')
+        for value in values:
+            start = len(data)
+            if not isinstance(value, int):
+                data.extend(value)
+            elif value > LIMB_MASK:
+                data.extend(BinaryPacker.from_bytes(
+                    buffer=value.to_bytes(
+                        (value.bit_length() + 7) // 8, 'little'),
+                    byteorder='little'))
+            elif value:
+                data.append(value)
+            offsets.append(start)
+            lengths.append(len(data) - start)
+        return data, offsets, lengths
@@ -21,6 +21,10 @@ class OperationEnum(p_enum.Enum):
     SUBTRACT = ('-', OperationType.CALCULATE)
     MULTIPLY = ('*', OperationType.CALCULATE)
     DIVIDE = ('/', OperationType.CALCULATE)
+    MODULO = ('%', OperationType.CALCULATE)
+    DIVMOD = ('/%', OperationType.CALCULATE)
+    POWER = ('**', OperationType.CALCULATE)
+    MULTIPLY_ADD = ('*+', OperationType.CALCULATE)
     
     # Comparison operations
     SMALLER = ('<', OperationType.COMPARE)
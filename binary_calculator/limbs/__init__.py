@@ -0,0 +1,15 @@
+"""Limb storage module for word-packed binary numbers."""
+
+from .binary_packer import BinaryPacker, LIMB_BITS, LIMB_BYTES, LIMB_MASK
+from .limb_arithmetic import LimbArithmetic
+from .montgomery_context import MontgomeryContext
+from .number_theoretic_transform import NumberTheoreticTransform
+
+__all__ = [
+    'BinaryPacker',
+    'LimbArithmetic',
+    'MontgomeryContext',
+    'NumberTheoreticTransform',
+    'LIMB_BITS',
+    'LIMB_BYTES',
+    'LIMB_MASK']
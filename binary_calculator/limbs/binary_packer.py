@@ -0,0 +1,236 @@
+"""Binary packer class for converting binary strings to 64-bit limbs."""
+
+import array as p_arr
+import sys as p_sys
+import typing as p_typ
+
+LIMB_BITS = 64
+LIMB_BYTES = LIMB_BITS // 8
+LIMB_MASK = (1 << LIMB_BITS) - 1
+
+
+class BinaryPacker:
+    """Packer for binary string <-> limb array transformations.
+    
+    A limb array stores a binary number as unsigned 64-bit words in
+    little-endian limb order (limb 0 holds the least significant 64 bits).
+    Packed arrays never carry high zero limbs, so zero is the empty array.
+    
+    Each limb is parsed from (or rendered to) a 64-character slice of the
+    binary string, so the packer works one machine word at a time and never
+    builds an intermediate integer for the whole number. Raw unsigned
+    integers in any buffer (bytes, bytearray, memoryview, mmap) are loaded
+    into limbs directly by array.frombytes(), without a binary string.
+    """
+    
+    @staticmethod
+    def pack(*, binary_str: str) -> p_arr.array:
+        """Pack a binary string into an array of 64-bit limbs.
+        
+        Args:
+            binary_str: Binary number as string (e.g., '1010')
+            
+        Returns:
+            array('Q') of limbs, least significant limb first
+            
+        Example:
+            >>> packer = BinaryPacker()
+            >>> list(packer.pack(binary_str='1' + '0' * 64))
+            [0, 1]
+        """
+        limbs = p_arr.array('Q')
+        for end in range(len(binary_str), 0, -LIMB_BITS):
+            limbs.append(int(binary_str[max(0, end - LIMB_BITS):end], 2))
+        while limbs and not limbs[-1]:
+            limbs.pop()
+        return limbs
+    
+    @staticmethod
+    def unpack(
+            *,
+            limbs: p_typ.Sequence[int],
+            width: int = 0) -> str:
+        """Render an array of 64-bit limbs as a binary string.
+        
+        Args:
+            limbs: Limbs of the number, least significant limb first
+            width: Minimum string width; shorter results are zero-padded
+            
+        Returns:
+            Binary representation as string (at least '0')
+            
+        Example:
+            >>> packer = BinaryPacker()
+            >>> packer.unpack(limbs=[5])
+            '101'
+            >>> packer.unpack(limbs=[5], width=6)
+            '000101'
+        """
+        top = len(limbs)
+        while top and not limbs[top - 1]:
+            top -= 1
+        if not top:
+            return '0' * max(width, 1)
+        
+        parts = [format(limbs[top - 1], 'b')]
+        parts.extend(
+            format(limbs[i], '064b') for i in range(top - 2, -1, -1))
+        return ''.join(parts).zfill(width)
+    
+    @staticmethod
+    def to_array(*, limbs: p_typ.Iterable[int]) -> p_arr.array:
+        """Copy limbs into a trimmed array('Q').
+        
+        Args:
+            limbs: Limbs of the number, least significant limb first
+            
+        Returns:
+            array('Q') without high zero limbs
+        """
+        packed = p_arr.array('Q', limbs)
+        while packed and not packed[-1]:
+            packed.pop()
+        return packed
+    
+    @staticmethod
+    def from_bytes(
+            *,
+            buffer: p_typ.Any,
+            byteorder: str = 'big') -> p_arr.array:
+        """Load an unsigned integer from a buffer into 64-bit limbs.
+        
+        The whole 8-byte words of the buffer are copied into the limb
+        array in one array.frombytes() call (byte-swapped in place if the
+        byte order differs from the host); the remaining 0-7 bytes form
+        the most significant limb. No binary string or intermediate bytes
+        object is built.
+        
+        Args:
+            buffer: Object supporting the buffer protocol (bytes,
+                bytearray, memoryview, mmap, array, ...), C-contiguous
+            byteorder: Byte order of the buffer, 'big' or 'little'
+            
+        Returns:
+            array('Q') of limbs, least significant limb first
+            
+        Raises:
+            ValueError: If byteorder is not 'big' or 'little'
+            
+        Example:
+            >>> packer = BinaryPacker()
+            >>> list(packer.from_bytes(buffer=b'\\x01' + bytes(8)))
+            [0, 1]
+        """
+        if byteorder not in ('big', 'little'):
+            raise ValueError(
+                f"byteorder must be 'big' or 'little', got '{byteorder}'")
+        
+        limbs = p_arr.array('Q')
+        with memoryview(buffer) as view, view.cast('B') as data:
+            head = len(data) % LIMB_BYTES
+            if byteorder == 'little':
+                limbs.frombytes(data[:len(data) - head])
+            else:
+                limbs.frombytes(data[head:])
+                limbs.reverse()
+            if byteorder != p_sys.byteorder:
+                limbs.byteswap()
+            if head:
+                limbs.append(int.from_bytes(
+                    data[len(data) - head:] if byteorder == 'little'
+                    else data[:head],
+                    byteorder))
+        while limbs and not limbs[-1]:
+            limbs.pop()
+        return limbs
+    
+    @staticmethod
+    def to_bytes(
+            *,
+            limbs: p_typ.Sequence[int],
+            byteorder: str = 'big',
+            length: p_typ.Optional[int] = None) -> bytes:
+        """Export 64-bit limbs as an unsigned integer in bytes.
+        
+        Args:
+            limbs: Limbs of the number, least significant limb first
+            byteorder: Byte order of the result, 'big' or 'little'
+            length: Number of bytes (defaults to the fewest bytes that
+                hold the number, at least one)
+            
+        Returns:
+            Unsigned integer as bytes, zero-padded to length
+            
+        Raises:
+            ValueError: If byteorder is not 'big' or 'little', or if the
+                number does not fit in length bytes
+            
+        Example:
+            >>> packer = BinaryPacker()
+            >>> packer.to_bytes(limbs=[258])
+            b'\\x01\\x02'
+        """
+        if byteorder not in ('big', 'little'):
+            raise ValueError(
+                f"byteorder must be 'big' or 'little', got '{byteorder}'")
+        
+        needed = (BinaryPacker.bit_length(limbs=limbs) + 7) // 8
+        if length is None:
+            length = max(needed, 1)
+        elif length < needed:
+            raise ValueError(
+                f"Number needs {needed} bytes, more than length {length}")
+        
+        packed = p_arr.array('Q', limbs)
+        if p_sys.byteorder != 'little':
+            packed.byteswap()
+        data = packed.tobytes()[:length]
+        data += bytes(length - len(data))
+        return data if byteorder == 'little' else data[::-1]
+    
+    @staticmethod
+    def readonly_view(*, buffer: p_typ.Any) -> memoryview:
+        """Get a read-only memoryview of a buffer.
+        
+        memoryview.toreadonly() shares the buffer but needs Python 3.8;
+        older versions get a view of a read-only copy with the same format.
+        Read-only buffers (e.g. views from an earlier call) are never
+        copied.
+        
+        Args:
+            buffer: Object supporting the buffer protocol (e.g. an array)
+            
+        Returns:
+            Read-only memoryview with the format of buffer
+            
+        Example:
+            >>> view = BinaryPacker.readonly_view(
+            ...     buffer=p_arr.array('Q', [5]))
+            >>> view.readonly, view.tolist()
+            (True, [5])
+        """
+        view = memoryview(buffer)
+        if view.readonly:
+            return view
+        if hasattr(view, 'toreadonly'):
+            return view.toreadonly()
+        return memoryview(view.tobytes()).cast(view.format)
+    
+    @staticmethod
+    def bit_length(*, limbs: p_typ.Sequence[int]) -> int:
+        """Get the number of significant bits in a limb array.
+        
+        Args:
+            limbs: Trimmed limbs, least significant limb first
+            
+        Returns:
+            Bit length of the number (0 for zero)
+            
+        Example:
+            >>> packer = BinaryPacker()
+            >>> packer.bit_length(limbs=[0, 1])
+            65
+        """
+        if not limbs:
+            return 0
+        return (len(limbs) - 1) * LIMB_BITS + limbs[-1].bit_length()
@@ -0,0 +1,1828 @@
+"""Limb arithmetic class for word-level binary arithmetic kernels."""
+
+import operator as p_op
+import typing as p_typ
+from ..comparator.binary_comparator import BinaryComparator
+from ..normalizer.binary_normalizer import BinaryNormalizer
+from .binary_packer import BinaryPacker, LIMB_BITS, LIMB_MASK
+
+Limbs = p_typ.List[int]
+SignedLimbs = p_typ.Tuple[int, Limbs]
+MultiplyFunc = p_typ.Callable[..., Limbs]
+Element = p_typ.TypeVar('Element')
+
+
+class LimbArithmetic:
+    """Arithmetic kernels operating on 64-bit limb lists.
+    
+    These kernels back the packed storage backend of BinaryNumber. They
+    follow the same pencil-and-paper algorithms as ArithmeticCalculator,
+    but every step consumes a 64-bit word instead of a single bit, so a
+    carry or borrow travels between limbs rather than between characters.
+    
+    All inputs are limb sequences (least significant limb first) and all
+    results are new, trimmed limb lists (zero is the empty list).
+    """
+    
+    @staticmethod
+    def add(
+            *,
+            limbs_1: p_typ.Sequence[int],
+            limbs_2: p_typ.Sequence[int]) -> Limbs:
+        """Add two limb lists with carry propagation between limbs.
+        
+        Args:
+            limbs_1: First addend
+            limbs_2: Second addend
+            
+        Returns:
+            Sum as trimmed limb list
+            
+        Example:
+            >>> LimbArithmetic.add(limbs_1=[2 ** 64 - 1], limbs_2=[1])
+            [0, 1]
+        """
+        if len(limbs_1) < len(limbs_2):
+            limbs_1, limbs_2 = limbs_2, limbs_1
+        
+        result = list(limbs_1)
+        carry = 0
+        for i, limb in enumerate(limbs_2):
+            total = result[i] + limb + carry
+            result[i] = total & LIMB_MASK
+            carry = total >> LIMB_BITS
+        
+        # Ripple the carry through the remaining limbs
+        i = len(limbs_2)
+        while carry and i < len(result):
+            total = result[i] + carry
+            result[i] = total & LIMB_MASK
+            carry = total >> LIMB_BITS
+            i += 1
+        if carry:
+            result.append(carry)
+        
+        return BinaryNormalizer.remove_leading_zero_limbs(limbs=result)
+    
+    @staticmethod
+    def add_many(*, numbers: p_typ.Iterable[p_typ.Sequence[int]]) -> Limbs:
+        """Add any number of limb lists with a single carry propagation.
+        
+        The running total is kept in carry-save form: every column holds
+        the plain sum of its limbs as an unbounded integer, so each addend
+        costs one element-wise column update without any carry handling
+        (the deferred carries simply occupy the bits above 64). Only the
+        final result propagates the carries from column to column. Summing
+        K numbers lets a column grow by at most log2(K) bits.
+        
+        numbers may be a generator; it is consumed one addend at a time.
+        
+        Args:
+            numbers: Iterable of limb sequences, least significant limb first
+            
+        Returns:
+            Sum as trimmed limb list
+            
+        Example:
+            >>> LimbArithmetic.add_many(
+            ...     numbers=[[2 ** 64 - 1], [2 ** 64 - 1], [2]])
+            [0, 2]
+        """
+        columns: Limbs = []
+        for limbs in numbers:
+            size = len(limbs)
+            if size > len(columns):
+                columns.extend([0] * (size - len(columns)))
+            columns[:size] = map(p_op.add, columns, limbs)
+        
+        result = []
+        carry = 0
+        for column in columns:
+            total = column + carry
+            result.append(total & LIMB_MASK)
+            carry = total >> LIMB_BITS
+        while carry:
+            result.append(carry & LIMB_MASK)
+            carry >>= LIMB_BITS
+        
+        return BinaryNormalizer.remove_leading_zero_limbs(limbs=result)
+    
+    @staticmethod
+    def subtract(
+            *,
+            limbs_1: p_typ.Sequence[int],
+            limbs_2: p_typ.Sequence[int]) -> Limbs:
+        """Subtract two limb lists with borrow propagation between limbs.
+        
+        Args:
+            limbs_1: Minuend
+            limbs_2: Subtrahend
+            
+        Returns:
+            Difference as trimmed limb list
+            
+        Raises:
+            ValueError: If the result would be negative
+            
+        Example:
+            >>> LimbArithmetic.subtract(limbs_1=[0, 1], limbs_2=[1])
+            [18446744073709551615]
+        """
+        result, borrow = LimbArithmetic.subtract_with_borrow(
+            limbs_1=limbs_1,
+            limbs_2=limbs_2)
+        if borrow:
+            raise ValueError("Cannot subtract: result would be negative")
+        return result
+    
+    @staticmethod
+    def subtract_with_borrow(
+            *,
+            limbs_1: p_typ.Sequence[int],
+            limbs_2: p_typ.Sequence[int]) -> p_typ.Tuple[Limbs, int]:
+        """Subtract two limb lists and report the final borrow.
+        
+        The sign check is fused into the subtraction: a borrow out of the
+        most significant limb means limbs_1 < limbs_2, so no separate
+        comparison pass is needed.
+        
+        Args:
+            limbs_1: Minuend
+            limbs_2: Subtrahend
+            
+        Returns:
+            Tuple of (difference, borrow). If borrow is 1 the difference is
+            meaningless (it is the two's complement wrap-around).
+        """
+        result = list(limbs_1)
+        if len(result) < len(limbs_2):
+            result.extend([0] * (len(limbs_2) - len(result)))
+        borrow = 0
+        for i in range(len(limbs_2)):
+            diff = result[i] - limbs_2[i] - borrow
+            result[i] = diff & LIMB_MASK
+            borrow = 1 if diff < 0 else 0
+        
+        # Ripple the borrow through the remaining limbs
+        i = len(limbs_2)
+        while borrow and i < len(result):
+            diff = result[i] - borrow
+            result[i] = diff & LIMB_MASK
+            borrow = 1 if diff < 0 else 0
+            i += 1
+        
+        return (
+            BinaryNormalizer.remove_leading_zero_limbs(limbs=result),
+            borrow)
+    
+    @staticmethod
+    def multiply(
+            *,
+            limbs_1: p_typ.Sequence[int],
+            limbs_2: p_typ.Sequence[int]) -> Limbs:
+        """Multiply two limb lists with the schoolbook algorithm.
+        
+        Each limb of limbs_1 is multiplied with every limb of limbs_2 and
+        accumulated at the matching offset, which is shift-and-add with a
+        64-bit digit instead of a single bit.
+        
+        Args:
+            limbs_1: Multiplicand
+            limbs_2: Multiplier
+            
+        Returns:
+            Product as trimmed limb list
+        """
+        if not limbs_1 or not limbs_2:
+            return []
+        
+        result = [0] * (len(limbs_1) + len(limbs_2))
+        for i, limb_1 in enumerate(limbs_1):
+            if not limb_1:
+                continue
+            carry = 0
+            k = i
+            for limb_2 in limbs_2:
+                total = limb_1 * limb_2 + result[k] + carry
+                result[k] = total & LIMB_MASK
+                carry = total >> LIMB_BITS
+                k += 1
+            result[k] = carry
+        
+        return BinaryNormalizer.remove_leading_zero_limbs(limbs=result)
+    
+    @staticmethod
+    def multiply_add(
+            *,
+            limbs_1: p_typ.Sequence[int],
+            limbs_2: p_typ.Sequence[int],
+            limbs_3: p_typ.Sequence[int]) -> Limbs:
+        """Compute limbs_1 * limbs_2 + limbs_3 in one schoolbook pass.
+        
+        The accumulator starts out as limbs_3 instead of zero, so the
+        addend is absorbed by the carry chains of the partial products and
+        no separate addition pass over the product is needed.
+        
+        Args:
+            limbs_1: Multiplicand
+            limbs_2: Multiplier
+            limbs_3: Addend
+            
+        Returns:
+            limbs_1 * limbs_2 + limbs_3 as trimmed limb list
+            
+        Example:
+            >>> LimbArithmetic.multiply_add(
+            ...     limbs_1=[2 ** 63], limbs_2=[2], limbs_3=[5])
+            [5, 1]
+        """
+        result = list(limbs_3)
+        if not limbs_1 or not limbs_2:
+            return BinaryNormalizer.remove_leading_zero_limbs(limbs=result)
+        
+        result.extend(
+            [0] * (len(limbs_1) + len(limbs_2) + 1 - len(result)))
+        for i, limb_1 in enumerate(limbs_1):
+            if not limb_1:
+                continue
+            carry = 0
+            k = i
+            for limb_2 in limbs_2:
+                total = limb_1 * limb_2 + result[k] + carry
+                result[k] = total & LIMB_MASK
+                carry = total >> LIMB_BITS
+                k += 1
+            # The addend may still occupy the limbs above this row
+            while carry:
+                total = result[k] + carry
+                result[k] = total & LIMB_MASK
+                carry = total >> LIMB_BITS
+                k += 1
+        
+        return BinaryNormalizer.remove_leading_zero_limbs(limbs=result)
+    
+    @staticmethod
+    def multiply_low(
+            *,
+            limbs_1: p_typ.Sequence[int],
+            limbs_2: p_typ.Sequence[int],
+            size: int) -> Limbs:
+        """Compute the low size limbs of a product (product mod B ** size).
+        
+        Only partial products that land below limb size are formed, which
+        is roughly half of the schoolbook work for equal-length factors.
+        
+        Args:
+            limbs_1: Multiplicand
+            limbs_2: Multiplier
+            size: Number of low limbs to keep
+            
+        Returns:
+            limbs_1 * limbs_2 mod 2 ** (64 * size) as trimmed limb list
+        """
+        result = [0] * (size + 1)
+        for i, limb_1 in enumerate(limbs_1[:size]):
+            if not limb_1:
+                continue
+            carry = 0
+            k = i
+            for limb_2 in limbs_2[:size - i]:
+                total = limb_1 * limb_2 + result[k] + carry
+                result[k] = total & LIMB_MASK
+                carry = total >> LIMB_BITS
+                k += 1
+            result[k] += carry
+        result.pop()
+        return BinaryNormalizer.remove_leading_zero_limbs(limbs=result)
+    
+    @staticmethod
+    def multiply_high(
+            *,
+            limbs_1: p_typ.Sequence[int],
+            limbs_2: p_typ.Sequence[int],
+            size: int) -> Limbs:
+        """Approximate the limbs of a product from limb size upwards.
+        
+        Partial products below limb size - 2 are skipped. They sum to less
+        than min(len(limbs_1), len(limbs_2)) * B ** (size - 1), so the
+        result is floor(product / B ** size) or one below it (for factors
+        shorter than B limbs).
+        
+        Args:
+            limbs_1: Multiplicand
+            limbs_2: Multiplier
+            size: Number of low limbs to drop
+            
+        Returns:
+            Approximation of limbs_1 * limbs_2 >> (64 * size) as trimmed
+            limb list
+        """
+        skip = max(size - 2, 0)
+        result = [0] * (len(limbs_1) + len(limbs_2) + 1)
+        for i, limb_1 in enumerate(limbs_1):
+            if not limb_1:
+                continue
+            start = max(skip - i, 0)
+            if start >= len(limbs_2):
+                continue
+            carry = 0
+            k = i + start
+            for limb_2 in limbs_2[start:]:
+                total = limb_1 * limb_2 + result[k] + carry
+                result[k] = total & LIMB_MASK
+                carry = total >> LIMB_BITS
+                k += 1
+            result[k] += carry
+        return BinaryNormalizer.remove_leading_zero_limbs(
+            limbs=result[size:])
+    
+    @staticmethod
+    def multiply_karatsuba(
+            *,
+            limbs_1: p_typ.Sequence[int],
+            limbs_2: p_typ.Sequence[int],
+            threshold: int) -> Limbs:
+        """Multiply two limb lists with Karatsuba's algorithm.
+        
+        Both operands are split at m limbs into high and low halves, and
+        the product is assembled from three half-size products:
+        z0 = lo_1 * lo_2, z2 = hi_1 * hi_2 and
+        z1 = (lo_1 + hi_1) * (lo_2 + hi_2) - z0 - z2.
+        Operands shorter than threshold limbs use the schoolbook kernel.
+        
+        Args:
+            limbs_1: Multiplicand
+            limbs_2: Multiplier
+            threshold: Limb count below which schoolbook is used
+            
+        Returns:
+            Product as trimmed limb list
+        """
+        if len(limbs_1) < len(limbs_2):
+            limbs_1, limbs_2 = limbs_2, limbs_1
+        if len(limbs_2) < max(threshold, 2):
+            return LimbArithmetic.multiply(limbs_1=limbs_1, limbs_2=limbs_2)
+        
+        m = len(limbs_1) // 2
+        low_1 = BinaryNormalizer.remove_leading_zero_limbs(
+            limbs=list(limbs_1[:m]))
+        high_1 = limbs_1[m:]
+        result = [0] * (len(limbs_1) + len(limbs_2) + 1)
+        
+        if len(limbs_2) <= m:
+            # Unbalanced operands: split only the longer one
+            LimbArithmetic._add_at(
+                target=result,
+                limbs=LimbArithmetic.multiply_karatsuba(
+                    limbs_1=low_1, limbs_2=limbs_2, threshold=threshold),
+                offset=0)
+            LimbArithmetic._add_at(
+                target=result,
+                limbs=LimbArithmetic.multiply_karatsuba(
+                    limbs_1=high_1, limbs_2=limbs_2, threshold=threshold),
+                offset=m)
+            return BinaryNormalizer.remove_leading_zero_limbs(limbs=result)
+        
+        low_2 = BinaryNormalizer.remove_leading_zero_limbs(
+            limbs=list(limbs_2[:m]))
+        high_2 = limbs_2[m:]
+        
+        z0 = LimbArithmetic.multiply_karatsuba(
+            limbs_1=low_1, limbs_2=low_2, threshold=threshold)
+        z2 = LimbArithmetic.multiply_karatsuba(
+            limbs_1=high_1, limbs_2=high_2, threshold=threshold)
+        z1 = LimbArithmetic.multiply_karatsuba(
+            limbs_1=LimbArithmetic.add(limbs_1=low_1, limbs_2=high_1),
+            limbs_2=LimbArithmetic.add(limbs_1=low_2, limbs_2=high_2),
+            threshold=threshold)
+        z1 = LimbArithmetic.subtract(
+            limbs_1=LimbArithmetic.subtract(limbs_1=z1, limbs_2=z0),
+            limbs_2=z2)
+        
+        LimbArithmetic._add_at(target=result, limbs=z0, offset=0)
+        LimbArithmetic._add_at(target=result, limbs=z1, offset=m)
+        LimbArithmetic._add_at(target=result, limbs=z2, offset=2 * m)
+        return BinaryNormalizer.remove_leading_zero_limbs(limbs=result)
+    
+    @staticmethod
+    def multiply_toom3(
+            *,
+            limbs_1: p_typ.Sequence[int],
+            limbs_2: p_typ.Sequence[int],
+            karatsuba_threshold: int,
+            toom3_threshold: int) -> Limbs:
+        """Multiply two limb lists with the Toom-Cook 3-way algorithm.
+        
+        Both operands are split into three k-limb parts, read as
+        polynomials of degree 2 and evaluated at 0, 1, -1, -2 and infinity.
+        The five point products are interpolated back (Bodrato's sequence,
+        using exact division by 2 and 3) into the product polynomial, which
+        is then evaluated at 2 ** (64 * k). Point products use Toom-3,
+        Karatsuba or schoolbook depending on their size.
+        
+        Args:
+            limbs_1: Multiplicand
+            limbs_2: Multiplier
+            karatsuba_threshold: Limb count from which Karatsuba is used
+            toom3_threshold: Limb count from which Toom-3 is used
+            
+        Returns:
+            Product as trimmed limb list
+        """
+        if len(limbs_1) < len(limbs_2):
+            limbs_1, limbs_2 = limbs_2, limbs_1
+        if len(limbs_2) < max(toom3_threshold, 3):
+            return LimbArithmetic._multiply_tiered(
+                limbs_1=limbs_1,
+                limbs_2=limbs_2,
+                karatsuba_threshold=karatsuba_threshold,
+                toom3_threshold=toom3_threshold)
+        
+        k = -(-len(limbs_1) // 3)
+        result = [0] * (len(limbs_1) + len(limbs_2) + 1)
+        
+        if len(limbs_2) <= k:
+            # Unbalanced operands: multiply k-limb slices of the longer one
+            for offset in range(0, len(limbs_1), k):
+                LimbArithmetic._add_at(
+                    target=result,
+                    limbs=LimbArithmetic._multiply_tiered(
+                        limbs_1=limbs_1[offset:offset + k],
+                        limbs_2=limbs_2,
+                        karatsuba_threshold=karatsuba_threshold,
+                        toom3_threshold=toom3_threshold),
+                    offset=offset)
+            return BinaryNormalizer.remove_leading_zero_limbs(limbs=result)
+        
+        points_1 = LimbArithmetic._toom3_evaluate(limbs=limbs_1, k=k)
+        points_2 = LimbArithmetic._toom3_evaluate(limbs=limbs_2, k=k)
+        products = [
+            (sign_1 * sign_2, LimbArithmetic._multiply_tiered(
+                limbs_1=value_1,
+                limbs_2=value_2,
+                karatsuba_threshold=karatsuba_threshold,
+                toom3_threshold=toom3_threshold))
+            for (sign_1, value_1), (sign_2, value_2)
+            in zip(points_1, points_2)]
+        LimbArithmetic._toom3_interpolate(
+            products=products, k=k, target=result)
+        return BinaryNormalizer.remove_leading_zero_limbs(limbs=result)
+    
+    @staticmethod
+    def square(*, limbs: p_typ.Sequence[int]) -> Limbs:
+        """Square a limb list with the schoolbook squaring algorithm.
+        
+        The cross products limbs[i] * limbs[j] with i < j appear twice in a
+        square, so each is computed once and the sum is doubled before the
+        diagonal squares limbs[i] ** 2 are added: about half the partial
+        products of multiply().
+        
+        Args:
+            limbs: Number to square
+            
+        Returns:
+            Square as trimmed limb list
+        """
+        size = len(limbs)
+        result = [0] * (2 * size)
+        
+        # Cross products above the diagonal
+        for i in range(size):
+            limb_i = limbs[i]
+            if not limb_i:
+                continue
+            carry = 0
+            k = 2 * i + 1
+            for j in range(i + 1, size):
+                total = limb_i * limbs[j] + result[k] + carry
+                result[k] = total & LIMB_MASK
+                carry = total >> LIMB_BITS
+                k += 1
+            result[i + size] = carry
+        
+        # Double the cross products and add the diagonal squares
+        shifted_out = 0
+        carry = 0
+        for i in range(size):
+            low = result[2 * i]
+            high = result[2 * i + 1]
+            total = (
+                ((low << 1) & LIMB_MASK | shifted_out)
+                + limbs[i] * limbs[i] + carry)
+            result[2 * i] = total & LIMB_MASK
+            shifted_out = low >> (LIMB_BITS - 1)
+            total = (
+                ((high << 1) & LIMB_MASK | shifted_out)
+                + (total >> LIMB_BITS))
+            result[2 * i + 1] = total & LIMB_MASK
+            shifted_out = high >> (LIMB_BITS - 1)
+            carry = total >> LIMB_BITS
+        
+        return BinaryNormalizer.remove_leading_zero_limbs(limbs=result)
+    
+    @staticmethod
+    def square_karatsuba(
+            *,
+            limbs: p_typ.Sequence[int],
+            threshold: int) -> Limbs:
+        """Square a limb list with Karatsuba's algorithm.
+        
+        With a single operand the three half-size products become the
+        squares lo ** 2, hi ** 2 and (lo + hi) ** 2, each of which recurses
+        into squaring again.
+        
+        Args:
+            limbs: Number to square
+            threshold: Limb count below which schoolbook squaring is used
+            
+        Returns:
+            Square as trimmed limb list
+        """
+        if len(limbs) < max(threshold, 2):
+            return LimbArithmetic.square(limbs=limbs)
+        
+        m = len(limbs) // 2
+        low = BinaryNormalizer.remove_leading_zero_limbs(
+            limbs=list(limbs[:m]))
+        high = limbs[m:]
+        
+        z0 = LimbArithmetic.square_karatsuba(limbs=low, threshold=threshold)
+        z2 = LimbArithmetic.square_karatsuba(limbs=high, threshold=threshold)
+        z1 = LimbArithmetic.square_karatsuba(
+            limbs=LimbArithmetic.add(limbs_1=low, limbs_2=high),
+            threshold=threshold)
+        z1 = LimbArithmetic.subtract(
+            limbs_1=LimbArithmetic.subtract(limbs_1=z1, limbs_2=z0),
+            limbs_2=z2)
+        
+        result = [0] * (2 * len(limbs) + 1)
+        LimbArithmetic._add_at(target=result, limbs=z0, offset=0)
+        LimbArithmetic._add_at(target=result, limbs=z1, offset=m)
+        LimbArithmetic._add_at(target=result, limbs=z2, offset=2 * m)
+        return BinaryNormalizer.remove_leading_zero_limbs(limbs=result)
+    
+    @staticmethod
+    def square_toom3(
+            *,
+            limbs: p_typ.Sequence[int],
+            karatsuba_threshold: int,
+            toom3_threshold: int) -> Limbs:
+        """Square a limb list with the Toom-Cook 3-way algorithm.
+        
+        The operand is evaluated only once and the five point values are
+        squared (all point squares are non-negative).
+        
+        Args:
+            limbs: Number to square
+            karatsuba_threshold: Limb count from which Karatsuba is used
+            toom3_threshold: Limb count from which Toom-3 is used
+            
+        Returns:
+            Square as trimmed limb list
+        """
+        if len(limbs) < max(toom3_threshold, 3):
+            return LimbArithmetic._square_tiered(
+                limbs=limbs,
+                karatsuba_threshold=karatsuba_threshold,
+                toom3_threshold=toom3_threshold)
+        
+        k = -(-len(limbs) // 3)
+        products = [
+            (1, LimbArithmetic._square_tiered(
+                limbs=value,
+                karatsuba_threshold=karatsuba_threshold,
+                toom3_threshold=toom3_threshold))
+            for _, value in LimbArithmetic._toom3_evaluate(limbs=limbs, k=k)]
+        result = [0] * (2 * len(limbs) + 1)
+        LimbArithmetic._toom3_interpolate(
+            products=products, k=k, target=result)
+        return BinaryNormalizer.remove_leading_zero_limbs(limbs=result)
+    
+    @staticmethod
+    def divide_exact(
+            *,
+            limbs: p_typ.Sequence[int],
+            divisor: int) -> Limbs:
+        """Divide a limb list by a small odd constant known to divide it.
+        
+        Instead of long division from the top, every quotient limb is
+        obtained from the bottom by multiplying with the inverse of the
+        divisor modulo 2 ** 64 (Jebelean's exact division), so no trial
+        quotients or remainders are needed.
+        
+        Args:
+            limbs: Dividend, an exact multiple of divisor
+            divisor: Odd single-limb divisor
+            
+        Returns:
+            Quotient as trimmed limb list
+            
+        Raises:
+            ValueError: If divisor is even or does not fit in one limb
+            
+        Example:
+            >>> LimbArithmetic.divide_exact(limbs=[0, 3], divisor=3)
+            [0, 1]
+        """
+        if not divisor & 1 or divisor > LIMB_MASK:
+            raise ValueError(
+                f"Exact division requires an odd single-limb divisor, "
+                f"got {divisor}")
+        
+        # Inverse of divisor modulo 2 ** 64 by Newton iteration: each step
+        # doubles the number of correct low bits (3 -> 6 -> ... -> 96)
+        inverse = divisor
+        for _ in range(5):
+            inverse = (inverse * (2 - divisor * inverse)) & LIMB_MASK
+        
+        quotient = []
+        borrow = 0
+        for limb in limbs:
+            value = limb - borrow
+            borrow = 1 if value < 0 else 0
+            digit = (value * inverse) & LIMB_MASK
+            quotient.append(digit)
+            borrow += (digit * divisor) >> LIMB_BITS
+        return BinaryNormalizer.remove_leading_zero_limbs(limbs=quotient)
+    
+    @staticmethod
+    def divide(
+            *,
+            limbs_1: p_typ.Sequence[int],
+            limbs_2: p_typ.Sequence[int]) -> p_typ.Tuple[Limbs, Limbs]:
+        """Divide two limb lists with limb-wise long division.
+        
+        Uses Knuth's Algorithm D: the divisor is normalized so that its top
+        bit is set, every quotient limb is estimated from the top two limbs
+        of the running remainder and corrected at most twice.
+        
+        Args:
+            limbs_1: Dividend
+            limbs_2: Divisor
+            
+        Returns:
+            Tuple of (quotient, remainder) as trimmed limb lists
+            
+        Raises:
+            ZeroDivisionError: If limbs_2 is zero
+        """
+        dividend = BinaryNormalizer.remove_leading_zero_limbs(
+            limbs=list(limbs_1))
+        divisor = BinaryNormalizer.remove_leading_zero_limbs(
+            limbs=list(limbs_2))
+        if not divisor:
+            raise ZeroDivisionError("Cannot divide by zero")
+        
+        if BinaryComparator.compare_limbs(
+                limbs_1=dividend, limbs_2=divisor) < 0:
+            return [], dividend
+        
+        if len(divisor) == 1:
+            return LimbArithmetic._divide_single(
+                limbs=dividend, divisor=divisor[0])
+        
+        # Normalize so that the top divisor limb has its high bit set
+        shift = LIMB_BITS - divisor[-1].bit_length()
+        divisor = LimbArithmetic.shift_left(limbs=divisor, bits=shift)
+        remainder = LimbArithmetic.shift_left(limbs=dividend, bits=shift)
+        if len(remainder) == len(dividend):
+            remainder.append(0)
+        
+        n = len(divisor)
+        m = len(remainder) - n
+        quotient = [0] * m
+        top = divisor[-1]
+        second = divisor[-2]
+        
+        for j in range(m - 1, -1, -1):
+            # Estimate the quotient limb from the top two remainder limbs
+            numerator = (remainder[j + n] << LIMB_BITS) | remainder[j + n - 1]
+            q_hat, r_hat = divmod(numerator, top)
+            while q_hat > LIMB_MASK or (
+                    q_hat * second
+                    > ((r_hat << LIMB_BITS) | remainder[j + n - 2])):
+                q_hat -= 1
+                r_hat += top
+                if r_hat > LIMB_MASK:
+                    break
+            
+            # Multiply and subtract q_hat * divisor from the remainder
+            carry = 0
+            borrow = 0
+            for i in range(n):
+                product = q_hat * divisor[i] + carry
+                carry = product >> LIMB_BITS
+                diff = remainder[i + j] - (product & LIMB_MASK) - borrow
+                remainder[i + j] = diff & LIMB_MASK
+                borrow = 1 if diff < 0 else 0
+            diff = remainder[j + n] - carry - borrow
+            remainder[j + n] = diff & LIMB_MASK
+            
+            # Estimate was one too large: add the divisor back
+            if diff < 0:
+                q_hat -= 1
+                carry = 0
+                for i in range(n):
+                    total = remainder[i + j] + divisor[i] + carry
+                    remainder[i + j] = total & LIMB_MASK
+                    carry = total >> LIMB_BITS
+                remainder[j + n] = (remainder[j + n] + carry) & LIMB_MASK
+            
+            quotient[j] = q_hat
+        
+        remainder = LimbArithmetic.shift_right(
+            limbs=remainder[:n], bits=shift)
+        return (
+            BinaryNormalizer.remove_leading_zero_limbs(limbs=quotient),
+            remainder)
+    
+    @staticmethod
+    def divide_newton(
+            *,
+            limbs_1: p_typ.Sequence[int],
+            limbs_2: p_typ.Sequence[int],
+            multiply: MultiplyFunc,
+            base_limbs: int) -> p_typ.Tuple[Limbs, Limbs]:
+        """Divide two limb lists using a Newton-Raphson reciprocal.
+        
+        The divisor is normalized to a whole number of limbs (m bits) and
+        its reciprocal x ~ 2 ** (2m) / divisor is computed once by Newton
+        iteration. The dividend is then consumed in m-bit blocks: each block
+        (with the running remainder on top) is divided by one multiplication
+        with x, one multiplication with the divisor and a small correction,
+        so division costs a few multiplications instead of O(n * m) limb
+        operations.
+        
+        Args:
+            limbs_1: Dividend
+            limbs_2: Divisor
+            multiply: Multiplication kernel called as
+                multiply(limbs_1=..., limbs_2=...)
+            base_limbs: Divisor size (in limbs) below which the reciprocal
+                is computed by long division instead of Newton iteration
+            
+        Returns:
+            Tuple of (quotient, remainder) as trimmed limb lists
+            
+        Raises:
+            ZeroDivisionError: If limbs_2 is zero
+        """
+        dividend = BinaryNormalizer.remove_leading_zero_limbs(
+            limbs=list(limbs_1))
+        divisor = BinaryNormalizer.remove_leading_zero_limbs(
+            limbs=list(limbs_2))
+        if not divisor:
+            raise ZeroDivisionError("Cannot divide by zero")
+        if BinaryComparator.compare_limbs(
+                limbs_1=dividend, limbs_2=divisor) < 0:
+            return [], dividend
+        
+        # Normalize so that the divisor fills its top limb
+        shift = LIMB_BITS - divisor[-1].bit_length()
+        divisor = LimbArithmetic.shift_left(limbs=divisor, bits=shift)
+        dividend = LimbArithmetic.shift_left(limbs=dividend, bits=shift)
+        k = len(divisor)
+        reciprocal = LimbArithmetic._reciprocal(
+            limbs=divisor,
+            multiply=multiply,
+            base_bits=base_limbs * LIMB_BITS)
+        
+        # Divide block by block from the most significant k-limb block
+        quotient = [0] * len(dividend)
+        remainder: Limbs = []
+        for start in range((len(dividend) - 1) // k * k, -1, -k):
+            block = list(dividend[start:start + k])
+            block.extend([0] * (k - len(block)))
+            block_quotient, remainder = LimbArithmetic._divide_block(
+                limbs=BinaryNormalizer.remove_leading_zero_limbs(
+                    limbs=block + remainder),
+                divisor=divisor,
+                reciprocal=reciprocal,
+                multiply=multiply)
+            quotient[start:start + len(block_quotient)] = block_quotient
+        
+        return (
+            BinaryNormalizer.remove_leading_zero_limbs(limbs=quotient),
+            LimbArithmetic.shift_right(limbs=remainder, bits=shift))
+    
+    @staticmethod
+    def divide_burnikel_ziegler(
+            *,
+            limbs_1: p_typ.Sequence[int],
+            limbs_2: p_typ.Sequence[int],
+            multiply: MultiplyFunc,
+            threshold: int) -> p_typ.Tuple[Limbs, Limbs]:
+        """Divide two limb lists with Burnikel-Ziegler recursive division.
+        
+        The divisor is padded and normalized to n = j * 2 ** k limbs with
+        j < threshold, and the dividend is consumed in n-limb blocks. Each
+        2n-by-n block division splits into two 3h-by-2h divisions
+        (h = n / 2), which in turn recurse into an h-limb division and one
+        h-by-h multiplication, so the cost follows the multiplication tier.
+        
+        Args:
+            limbs_1: Dividend
+            limbs_2: Divisor
+            multiply: Multiplication kernel called as
+                multiply(limbs_1=..., limbs_2=...)
+            threshold: Divisor size (in limbs) below which long division is
+                used
+            
+        Returns:
+            Tuple of (quotient, remainder) as trimmed limb lists
+            
+        Raises:
+            ZeroDivisionError: If limbs_2 is zero
+        """
+        dividend = BinaryNormalizer.remove_leading_zero_limbs(
+            limbs=list(limbs_1))
+        divisor = BinaryNormalizer.remove_leading_zero_limbs(
+            limbs=list(limbs_2))
+        threshold = max(threshold, 2)
+        if not divisor:
+            raise ZeroDivisionError("Cannot divide by zero")
+        if len(divisor) < threshold or BinaryComparator.compare_limbs(
+                limbs_1=dividend, limbs_2=divisor) < 0:
+            return LimbArithmetic.divide(limbs_1=dividend, limbs_2=divisor)
+        
+        # Pad the divisor to n = j * 2 ** k limbs with its top bit set
+        levels = 0
+        block = len(divisor)
+        while block >= threshold:
+            block = -(-block // 2)
+            levels += 1
+        n = block << levels
+        shift = (n - len(divisor)) * LIMB_BITS + (
+            LIMB_BITS - divisor[-1].bit_length())
+        divisor = LimbArithmetic.shift_left(limbs=divisor, bits=shift)
+        dividend = LimbArithmetic.shift_left(limbs=dividend, bits=shift)
+        
+        # Schoolbook division over n-limb blocks of the dividend
+        quotient = [0] * len(dividend)
+        remainder: Limbs = []
+        for start in range((len(dividend) - 1) // n * n, -1, -n):
+            block_quotient, remainder = LimbArithmetic._divide_2n_1n(
+                limbs=LimbArithmetic._concat(
+                    high=remainder,
+                    low=dividend[start:start + n],
+                    size=n),
+                divisor=divisor,
+                n=n,
+                multiply=multiply,
+                threshold=threshold)
+            quotient[start:start + len(block_quotient)] = block_quotient
+        
+        return (
+            BinaryNormalizer.remove_leading_zero_limbs(limbs=quotient),
+            LimbArithmetic.shift_right(limbs=remainder, bits=shift))
+    
+    @staticmethod
+    def isqrt(
+            *,
+            limbs: p_typ.Sequence[int],
+            multiply: MultiplyFunc,
+            threshold: int) -> Limbs:
+        """Compute the integer square root with precision-doubling Newton.
+        
+        Each Newton step a' = (a + n / a) / 2 roughly doubles the number of
+        correct bits, so the iteration starts from one bit and works on a
+        correspondingly truncated n: step i divides a 2^i-bit slice of n by
+        a 2^(i-1)-bit approximation. The total cost is about two divisions
+        at full size, followed by a single correction against a ** 2.
+        
+        Args:
+            limbs: Number to take the square root of
+            multiply: Multiplication kernel used for the divisions and the
+                final check
+            threshold: Divisor size (in limbs) from which the divisions use
+                Burnikel-Ziegler
+            
+        Returns:
+            floor(sqrt(limbs)) as trimmed limb list
+            
+        Example:
+            >>> LimbArithmetic.isqrt(
+            ...     limbs=[99], multiply=LimbArithmetic.multiply, threshold=32)
+            [9]
+        """
+        value = BinaryNormalizer.remove_leading_zero_limbs(limbs=list(limbs))
+        if not value:
+            return []
+        
+        top = (BinaryPacker.bit_length(limbs=value) - 1) // 2
+        root = [1]
+        precision = 0
+        for step in range(top.bit_length() - 1, -1, -1):
+            previous = precision
+            precision = top >> step
+            quotient, _ = LimbArithmetic.divide_burnikel_ziegler(
+                limbs_1=LimbArithmetic.shift_right(
+                    limbs=value,
+                    bits=2 * top - previous - precision + 1),
+                limbs_2=root,
+                multiply=multiply,
+                threshold=threshold)
+            root = LimbArithmetic.add(
+                limbs_1=LimbArithmetic.shift_left(
+                    limbs=root,
+                    bits=precision - previous - 1),
+                limbs_2=quotient)
+        
+        # The approximation is at most one too large
+        if BinaryComparator.compare_limbs(
+                limbs_1=multiply(limbs_1=root, limbs_2=root),
+                limbs_2=value) > 0:
+            root = LimbArithmetic.subtract(limbs_1=root, limbs_2=[1])
+        return root
+    
+    @staticmethod
+    def gcd_binary(
+            *,
+            limbs_1: p_typ.Sequence[int],
+            limbs_2: p_typ.Sequence[int]) -> Limbs:
+        """Compute the greatest common divisor with Stein's binary GCD.
+        
+        Common factors of two are shifted out once; afterwards both values
+        are odd, and the smaller is repeatedly subtracted from the larger,
+        whose trailing zeros are then shifted out. Only subtractions and
+        shifts are used, no division. Once both values fit in one limb the
+        loop continues on machine words.
+        
+        Args:
+            limbs_1: First number
+            limbs_2: Second number
+            
+        Returns:
+            gcd(limbs_1, limbs_2) as trimmed limb list (gcd(0, 0) = 0)
+        """
+        value_1 = BinaryNormalizer.remove_leading_zero_limbs(
+            limbs=list(limbs_1))
+        value_2 = BinaryNormalizer.remove_leading_zero_limbs(
+            limbs=list(limbs_2))
+        if not value_1:
+            return value_2
+        if not value_2:
+            return value_1
+        
+        zeros_1 = LimbArithmetic._trailing_zeros(limbs=value_1)
+        zeros_2 = LimbArithmetic._trailing_zeros(limbs=value_2)
+        value_1 = LimbArithmetic.shift_right(limbs=value_1, bits=zeros_1)
+        value_2 = LimbArithmetic.shift_right(limbs=value_2, bits=zeros_2)
+        
+        while len(value_1) > 1 or len(value_2) > 1:
+            order = BinaryComparator.compare_limbs(
+                limbs_1=value_1, limbs_2=value_2)
+            if not order:
+                break
+            if order < 0:
+                value_1, value_2 = value_2, value_1
+            value_1 = LimbArithmetic.subtract(
+                limbs_1=value_1, limbs_2=value_2)
+            value_1 = LimbArithmetic.shift_right(
+                limbs=value_1,
+                bits=LimbArithmetic._trailing_zeros(limbs=value_1))
+        else:
+            word_1, word_2 = value_1[0], value_2[0]
+            while word_1 != word_2:
+                if word_1 < word_2:
+                    word_1, word_2 = word_2, word_1
+                word_1 -= word_2
+                word_1 >>= (word_1 & -word_1).bit_length() - 1
+            value_1 = [word_1]
+        
+        return LimbArithmetic.shift_left(
+            limbs=value_1, bits=min(zeros_1, zeros_2))
+    
+    @staticmethod
+    def gcd_lehmer(
+            *,
+            limbs_1: p_typ.Sequence[int],
+            limbs_2: p_typ.Sequence[int],
+            threshold: int) -> Limbs:
+        """Compute the greatest common divisor with Lehmer's algorithm.
+        
+        Euclid's algorithm is simulated on the leading 64 bits of both
+        values, collecting its quotients in a 2x2 cofactor matrix for as
+        long as they provably match the quotients of the full values. One
+        matrix application then replaces many full-length division steps;
+        only when no quotient can be predicted does a real division run.
+        Below threshold limbs the computation finishes with gcd_binary().
+        
+        Args:
+            limbs_1: First number
+            limbs_2: Second number
+            threshold: Size (in limbs) of the smaller value below which
+                Stein's binary GCD takes over
+            
+        Returns:
+            gcd(limbs_1, limbs_2) as trimmed limb list
+        """
+        value_1 = BinaryNormalizer.remove_leading_zero_limbs(
+            limbs=list(limbs_1))
+        value_2 = BinaryNormalizer.remove_leading_zero_limbs(
+            limbs=list(limbs_2))
+        if BinaryComparator.compare_limbs(
+                limbs_1=value_1, limbs_2=value_2) < 0:
+            value_1, value_2 = value_2, value_1
+        
+        while len(value_2) >= max(threshold, 2):
+            matrix = LimbArithmetic._lehmer_matrix(
+                limbs_1=value_1, limbs_2=value_2)
+            if matrix is None:
+                _, remainder = LimbArithmetic.divide(
+                    limbs_1=value_1, limbs_2=value_2)
+                value_1, value_2 = value_2, remainder
+                continue
+            a, b, c, d = matrix
+            value_1, value_2 = (
+                LimbArithmetic._lehmer_combine(
+                    limbs_1=value_1, limbs_2=value_2, factor_1=a, factor_2=b),
+                LimbArithmetic._lehmer_combine(
+                    limbs_1=value_1, limbs_2=value_2, factor_1=c, factor_2=d))
+        
+        return LimbArithmetic.gcd_binary(limbs_1=value_1, limbs_2=value_2)
+    
+    @staticmethod
+    def extended_gcd(
+            *,
+            limbs_1: p_typ.Sequence[int],
+            limbs_2: p_typ.Sequence[int]) -> p_typ.Tuple[
+                Limbs, SignedLimbs, SignedLimbs]:
+        """Compute the GCD and Bezout coefficients with Lehmer's algorithm.
+        
+        Runs the same Lehmer steps as gcd_lehmer() down to zero, applying
+        every cofactor matrix and division quotient to the coefficient of
+        limbs_1 as well. The coefficient of limbs_2 follows from one exact
+        division at the end.
+        
+        Args:
+            limbs_1: First number a
+            limbs_2: Second number b
+            
+        Returns:
+            Tuple of (g, x, y) with a * x + b * y = g, where x and y are
+            signed values given as (sign, magnitude limbs)
+            
+        Example:
+            >>> LimbArithmetic.extended_gcd(limbs_1=[240], limbs_2=[46])
+            ([2], (-1, [9]), (1, [47]))
+        """
+        value_1 = BinaryNormalizer.remove_leading_zero_limbs(
+            limbs=list(limbs_1))
+        value_2 = BinaryNormalizer.remove_leading_zero_limbs(
+            limbs=list(limbs_2))
+        if not value_2:
+            return value_1, (1, [1] if value_1 else []), (1, [])
+        
+        # Invariant: limbs_1 * coefficient ≡ value (mod limbs_2)
+        coefficient_1: SignedLimbs = (1, [1])
+        coefficient_2: SignedLimbs = (1, [])
+        while value_2:
+            # The matrix needs value_1 >= value_2; a smaller multi-limb
+            # limbs_1 is first swapped by a plain division (quotient 0)
+            matrix = None
+            if len(value_1) > 1 and BinaryComparator.compare_limbs(
+                    limbs_1=value_1, limbs_2=value_2) >= 0:
+                matrix = LimbArithmetic._lehmer_matrix(
+                    limbs_1=value_1, limbs_2=value_2)
+            if matrix is None:
+                quotient, remainder = LimbArithmetic.divide(
+                    limbs_1=value_1, limbs_2=value_2)
+                value_1, value_2 = value_2, remainder
+                coefficient_1, coefficient_2 = (
+                    coefficient_2,
+                    LimbArithmetic._signed_subtract(
+                        value_1=coefficient_1,
+                        value_2=(coefficient_2[0], LimbArithmetic.multiply(
+                            limbs_1=coefficient_2[1], limbs_2=quotient))))
+                continue
+            a, b, c, d = matrix
+            value_1, value_2 = (
+                LimbArithmetic._lehmer_combine(
+                    limbs_1=value_1, limbs_2=value_2, factor_1=a, factor_2=b),
+                LimbArithmetic._lehmer_combine(
+                    limbs_1=value_1, limbs_2=value_2, factor_1=c, factor_2=d))
+            coefficient_1, coefficient_2 = (
+                LimbArithmetic._signed_combine(
+                    value_1=coefficient_1, value_2=coefficient_2,
+                    factor_1=a, factor_2=b),
+                LimbArithmetic._signed_combine(
+                    value_1=coefficient_1, value_2=coefficient_2,
+                    factor_1=c, factor_2=d))
+        
+        # y = (g - a * x) / b, an exact division
+        sign, difference = LimbArithmetic._signed_subtract(
+            value_1=(1, value_1),
+            value_2=(coefficient_1[0], LimbArithmetic.multiply(
+                limbs_1=limbs_1, limbs_2=coefficient_1[1])))
+        quotient, _ = LimbArithmetic.divide(
+            limbs_1=difference, limbs_2=limbs_2)
+        return (
+            value_1,
+            (coefficient_1[0] if coefficient_1[1] else 1, coefficient_1[1]),
+            (sign if quotient else 1, quotient))
+    
+    @staticmethod
+    def power(
+            *,
+            base: Element,
+            exponent: p_typ.Sequence[int],
+            one: Element,
+            multiply: p_typ.Callable[[Element, Element], Element],
+            square: p_typ.Callable[[Element], Element]) -> Element:
+        """Raise base to a limb exponent by sliding-window exponentiation.
+        
+        The exponent bits are scanned from the most significant end. Runs
+        of zero bits cost one squaring each; every window of up to k bits
+        that starts and ends with a one costs its squarings plus a single
+        multiplication by a precomputed odd power base ** w. The window
+        size k grows with the exponent, so an e-bit exponent takes about
+        e squarings and e / (k + 1) multiplications instead of e / 2.
+        
+        The arithmetic is supplied by the caller, so the same loop drives
+        plain, Montgomery and modular exponentiation.
+        
+        Args:
+            base: Base in the caller's representation
+            exponent: Exponent as limbs, least significant limb first
+            one: Multiplicative identity in the caller's representation
+            multiply: Product of two elements
+            square: Square of one element
+            
+        Returns:
+            base ** exponent in the caller's representation
+            
+        Example:
+            >>> LimbArithmetic.power(
+            ...     base=3, exponent=[13], one=1,
+            ...     multiply=lambda x, y: x * y, square=lambda x: x * x)
+            1594323
+        """
+        bits = BinaryPacker.bit_length(limbs=exponent)
+        if not bits:
+            return one
+        
+        window = 1
+        for limit in (24, 80, 240, 672):
+            if bits > limit:
+                window += 1
+        
+        # Odd powers base ** 1, base ** 3, ..., base ** (2 ** window - 1)
+        odd_powers = [base]
+        if window > 1:
+            base_squared = square(base)
+            for _ in range((1 << (window - 1)) - 1):
+                odd_powers.append(multiply(odd_powers[-1], base_squared))
+        
+        def bit(index: int) -> int:
+            return exponent[index // LIMB_BITS] >> (index % LIMB_BITS) & 1
+        
+        result = None
+        i = bits - 1
+        while i >= 0:
+            if not bit(i):
+                result = square(result)
+                i -= 1
+                continue
+            
+            # Longest window i..j (at most window bits) ending in a one
+            j = max(i - window + 1, 0)
+            while not bit(j):
+                j += 1
+            value = 0
+            for index in range(i, j - 1, -1):
+                value = (value << 1) | bit(index)
+            
+            if result is None:
+                result = odd_powers[value >> 1]
+            else:
+                for _ in range(i - j + 1):
+                    result = square(result)
+                result = multiply(result, odd_powers[value >> 1])
+            i = j - 1
+        return result
+    
+    @staticmethod
+    def shift_left(*, limbs: p_typ.Sequence[int], bits: int) -> Limbs:
+        """Shift a limb list left (multiply by 2 ** bits).
+        
+        Args:
+            limbs: Limbs to shift
+            bits: Number of bit positions to shift
+            
+        Returns:
+            Shifted value as trimmed limb list
+        """
+        limb_shift, bit_shift = divmod(bits, LIMB_BITS)
+        result = [0] * limb_shift
+        if not bit_shift:
+            result.extend(limbs)
+        else:
+            carry = 0
+            back_shift = LIMB_BITS - bit_shift
+            for limb in limbs:
+                result.append(((limb << bit_shift) & LIMB_MASK) | carry)
+                carry = limb >> back_shift
+            result.append(carry)
+        return BinaryNormalizer.remove_leading_zero_limbs(limbs=result)
+    
+    @staticmethod
+    def shift_right(*, limbs: p_typ.Sequence[int], bits: int) -> Limbs:
+        """Shift a limb list right (floor divide by 2 ** bits).
+        
+        Args:
+            limbs: Limbs to shift
+            bits: Number of bit positions to shift
+            
+        Returns:
+            Shifted value as trimmed limb list
+        """
+        limb_shift, bit_shift = divmod(bits, LIMB_BITS)
+        source = limbs[limb_shift:]
+        if not bit_shift:
+            result = list(source)
+        else:
+            back_shift = LIMB_BITS - bit_shift
+            result = [
+                (source[i] >> bit_shift)
+                | ((source[i + 1] << back_shift) & LIMB_MASK)
+                for i in range(len(source) - 1)]
+            if source:
+                result.append(source[-1] >> bit_shift)
+        return BinaryNormalizer.remove_leading_zero_limbs(limbs=result)
+    
+    @staticmethod
+    def _divide_single(
+            *,
+            limbs: p_typ.Sequence[int],
+            divisor: int) -> p_typ.Tuple[Limbs, Limbs]:
+        """Divide a limb list by a single non-zero limb.
+        
+        Args:
+            limbs: Dividend
+            divisor: Single-limb divisor
+            
+        Returns:
+            Tuple of (quotient, remainder) as trimmed limb lists
+        """
+        quotient = [0] * len(limbs)
+        remainder = 0
+        for i in range(len(limbs) - 1, -1, -1):
+            quotient[i], remainder = divmod(
+                (remainder << LIMB_BITS) | limbs[i], divisor)
+        return (
+            BinaryNormalizer.remove_leading_zero_limbs(limbs=quotient),
+            [remainder] if remainder else [])
+    
+    @staticmethod
+    def _add_at(
+            *,
+            target: Limbs,
+            limbs: p_typ.Sequence[int],
+            offset: int) -> None:
+        """Add limbs into target in place, starting at limb offset.
+        
+        Args:
+            target: Accumulator limb list, long enough to hold the sum
+            limbs: Limbs to add
+            offset: Limb position in target of limbs[0]
+        """
+        carry = 0
+        k = offset
+        for limb in limbs:
+            total = target[k] + limb + carry
+            target[k] = total & LIMB_MASK
+            carry = total >> LIMB_BITS
+            k += 1
+        while carry:
+            total = target[k] + carry
+            target[k] = total & LIMB_MASK
+            carry = total >> LIMB_BITS
+            k += 1
+    
+    @staticmethod
+    def _multiply_tiered(
+            *,
+            limbs_1: p_typ.Sequence[int],
+            limbs_2: p_typ.Sequence[int],
+            karatsuba_threshold: int,
+            toom3_threshold: int) -> Limbs:
+        """Multiply two limb lists with the tier matching their size.
+        
+        Args:
+            limbs_1: Multiplicand
+            limbs_2: Multiplier
+            karatsuba_threshold: Limb count from which Karatsuba is used
+            toom3_threshold: Limb count from which Toom-3 is used
+            
+        Returns:
+            Product as trimmed limb list
+        """
+        size = min(len(limbs_1), len(limbs_2))
+        if size >= max(toom3_threshold, 3):
+            return LimbArithmetic.multiply_toom3(
+                limbs_1=limbs_1,
+                limbs_2=limbs_2,
+                karatsuba_threshold=karatsuba_threshold,
+                toom3_threshold=toom3_threshold)
+        if size >= karatsuba_threshold:
+            return LimbArithmetic.multiply_karatsuba(
+                limbs_1=limbs_1,
+                limbs_2=limbs_2,
+                threshold=karatsuba_threshold)
+        return LimbArithmetic.multiply(limbs_1=limbs_1, limbs_2=limbs_2)
+    
+    @staticmethod
+    def _toom3_evaluate(
+            *,
+            limbs: p_typ.Sequence[int],
+            k: int) -> p_typ.List[SignedLimbs]:
+        """Evaluate a 3-part split of limbs at 0, 1, -1, -2 and infinity.
+        
+        Args:
+            limbs: Number to split into parts of k limbs
+            k: Part size in limbs
+            
+        Returns:
+            Signed values [p(0), p(1), p(-1), p(-2), p(inf)]
+        """
+        part_0 = BinaryNormalizer.remove_leading_zero_limbs(
+            limbs=list(limbs[:k]))
+        part_1 = BinaryNormalizer.remove_leading_zero_limbs(
+            limbs=list(limbs[k:2 * k]))
+        part_2 = BinaryNormalizer.remove_leading_zero_limbs(
+            limbs=list(limbs[2 * k:]))
+        
+        even = LimbArithmetic.add(limbs_1=part_0, limbs_2=part_2)
+        at_1 = LimbArithmetic.add(limbs_1=even, limbs_2=part_1)
+        at_m1 = LimbArithmetic._signed_subtract(
+            value_1=(1, even), value_2=(1, part_1))
+        # p(-2) = 2 * (p(-1) + a2) - a0
+        at_m2 = LimbArithmetic._signed_add(
+            value_1=at_m1, value_2=(1, part_2))
+        at_m2 = LimbArithmetic._signed_subtract(
+            value_1=(at_m2[0], LimbArithmetic.shift_left(
+                limbs=at_m2[1], bits=1)),
+            value_2=(1, part_0))
+        return [(1, part_0), (1, at_1), at_m1, at_m2, (1, part_2)]
+    
+    @staticmethod
+    def _signed_add(
+            *,
+            value_1: SignedLimbs,
+            value_2: SignedLimbs) -> SignedLimbs:
+        """Add two signed values given as (sign, magnitude limbs).
+        
+        Args:
+            value_1: First addend, sign is 1 or -1
+            value_2: Second addend, sign is 1 or -1
+            
+        Returns:
+            Sum as (sign, magnitude limbs)
+        """
+        sign_1, limbs_1 = value_1
+        sign_2, limbs_2 = value_2
+        if sign_1 == sign_2:
+            return sign_1, LimbArithmetic.add(
+                limbs_1=limbs_1, limbs_2=limbs_2)
+        difference, borrow = LimbArithmetic.subtract_with_borrow(
+            limbs_1=limbs_1, limbs_2=limbs_2)
+        if borrow:
+            return sign_2, LimbArithmetic.subtract(
+                limbs_1=limbs_2, limbs_2=limbs_1)
+        return sign_1, difference
+    
+    @staticmethod
+    def _signed_subtract(
+            *,
+            value_1: SignedLimbs,
+            value_2: SignedLimbs) -> SignedLimbs:
+        """Subtract two signed values given as (sign, magnitude limbs).
+        
+        Args:
+            value_1: Minuend, sign is 1 or -1
+            value_2: Subtrahend, sign is 1 or -1
+            
+        Returns:
+            Difference as (sign, magnitude limbs)
+        """
+        return LimbArithmetic._signed_add(
+            value_1=value_1,
+            value_2=(-value_2[0], value_2[1]))
+    
+    @staticmethod
+    def _signed_divide_exact(
+            *,
+            value: SignedLimbs,
+            divisor: int) -> SignedLimbs:
+        """Divide a signed value by 2 or an odd constant dividing it exactly.
+        
+        Args:
+            value: Dividend as (sign, magnitude limbs)
+            divisor: 2 or a small odd constant
+            
+        Returns:
+            Quotient as (sign, magnitude limbs)
+        """
+        sign, limbs = value
+        if divisor == 2:
+            return sign, LimbArithmetic.shift_right(limbs=limbs, bits=1)
+        return sign, LimbArithmetic.divide_exact(
+            limbs=limbs, divisor=divisor)
+    
+    @staticmethod
+    def _square_tiered(
+            *,
+            limbs: p_typ.Sequence[int],
+            karatsuba_threshold: int,
+            toom3_threshold: int) -> Limbs:
+        """Square a limb list with the tier matching its size.
+        
+        Args:
+            limbs: Number to square
+            karatsuba_threshold: Limb count from which Karatsuba is used
+            toom3_threshold: Limb count from which Toom-3 is used
+            
+        Returns:
+            Square as trimmed limb list
+        """
+        if len(limbs) >= max(toom3_threshold, 3):
+            return LimbArithmetic.square_toom3(
+                limbs=limbs,
+                karatsuba_threshold=karatsuba_threshold,
+                toom3_threshold=toom3_threshold)
+        if len(limbs) >= karatsuba_threshold:
+            return LimbArithmetic.square_karatsuba(
+                limbs=limbs,
+                threshold=karatsuba_threshold)
+        return LimbArithmetic.square(limbs=limbs)
+    
+    @staticmethod
+    def _toom3_interpolate(
+            *,
+            products: p_typ.List[SignedLimbs],
+            k: int,
+            target: Limbs) -> None:
+        """Interpolate Toom-3 point products and add them into target.
+        
+        Uses Bodrato's sequence to recover the coefficients c0..c4 of the
+        product polynomial from its values at 0, 1, -1, -2 and infinity,
+        then adds c_i at limb offset i * k.
+        
+        Args:
+            products: Signed point products [r(0), r(1), r(-1), r(-2),
+                r(inf)]
+            k: Part size in limbs
+            target: Accumulator limb list, long enough to hold the product
+        """
+        r_0, r_1, r_m1, r_m2, r_inf = products
+        c_3 = LimbArithmetic._signed_divide_exact(
+            value=LimbArithmetic._signed_subtract(value_1=r_m2, value_2=r_1),
+            divisor=3)
+        c_1 = LimbArithmetic._signed_divide_exact(
+            value=LimbArithmetic._signed_subtract(value_1=r_1, value_2=r_m1),
+            divisor=2)
+        c_2 = LimbArithmetic._signed_subtract(value_1=r_m1, value_2=r_0)
+        c_3 = LimbArithmetic._signed_add(
+            value_1=LimbArithmetic._signed_divide_exact(
+                value=LimbArithmetic._signed_subtract(
+                    value_1=c_2, value_2=c_3),
+                divisor=2),
+            value_2=(1, LimbArithmetic.shift_left(limbs=r_inf[1], bits=1)))
+        c_2 = LimbArithmetic._signed_subtract(
+            value_1=LimbArithmetic._signed_add(value_1=c_2, value_2=c_1),
+            value_2=r_inf)
+        c_1 = LimbArithmetic._signed_subtract(value_1=c_1, value_2=c_3)
+        
+        for power, (_, coefficient) in enumerate(
+                [r_0, c_1, c_2, c_3, r_inf]):
+            LimbArithmetic._add_at(
+                target=target,
+                limbs=coefficient,
+                offset=power * k)
+    
+    @staticmethod
+    def _reciprocal(
+            *,
+            limbs: Limbs,
+            multiply: MultiplyFunc,
+            base_bits: int) -> Limbs:
+        """Approximate 2 ** (2m) / limbs for an m-bit value.
+        
+        The reciprocal of the top half of the bits is computed recursively
+        and refined by one Newton step x = 2x - (d * x * x) / 2 ** (2m),
+        which doubles the number of correct bits. The result is within one
+        unit of the exact floor.
+        
+        Args:
+            limbs: Divisor d (non-zero, trimmed)
+            multiply: Multiplication kernel
+            base_bits: Bit length up to which long division is used
+            
+        Returns:
+            Approximate reciprocal as trimmed limb list
+        """
+        bits = BinaryPacker.bit_length(limbs=limbs)
+        if bits <= base_bits:
+            power = LimbArithmetic.shift_left(limbs=[1], bits=2 * bits)
+            return LimbArithmetic.divide(limbs_1=power, limbs_2=limbs)[0]
+        
+        # Two guard bits keep the recursive estimate within one unit
+        half = (bits + 1) // 2 + 2
+        estimate = LimbArithmetic.shift_left(
+            limbs=LimbArithmetic._reciprocal(
+                limbs=LimbArithmetic.shift_right(
+                    limbs=limbs, bits=bits - half),
+                multiply=multiply,
+                base_bits=base_bits),
+            bits=bits - half)
+        correction = multiply(
+            limbs_1=multiply(limbs_1=limbs, limbs_2=estimate),
+            limbs_2=estimate)
+        return LimbArithmetic.subtract(
+            limbs_1=LimbArithmetic.shift_left(limbs=estimate, bits=1),
+            limbs_2=LimbArithmetic.shift_right(
+                limbs=correction, bits=2 * bits))
+    
+    @staticmethod
+    def _divide_block(
+            *,
+            limbs: Limbs,
+            divisor: Limbs,
+            reciprocal: Limbs,
+            multiply: MultiplyFunc) -> p_typ.Tuple[Limbs, Limbs]:
+        """Divide a value below divisor * 2 ** m using the reciprocal.
+        
+        Args:
+            limbs: Dividend block, less than divisor * 2 ** m
+            divisor: Normalized m-bit divisor
+            reciprocal: Approximation of 2 ** (2m) / divisor
+            multiply: Multiplication kernel
+            
+        Returns:
+            Tuple of (quotient, remainder) as trimmed limb lists
+        """
+        # Only the top half of the block matters for the estimate: the low
+        # m bits contribute less than 3 units to block * reciprocal / 2 ** 2m
+        k = len(divisor)
+        quotient = LimbArithmetic.shift_right(
+            limbs=multiply(limbs_1=limbs[k:], limbs_2=reciprocal),
+            bits=k * LIMB_BITS)
+        product = multiply(limbs_1=quotient, limbs_2=divisor)
+        remainder, borrow = LimbArithmetic.subtract_with_borrow(
+            limbs_1=limbs, limbs_2=product)
+        
+        # Estimate too large: step the quotient down
+        while borrow:
+            quotient = LimbArithmetic.subtract(limbs_1=quotient, limbs_2=[1])
+            product = LimbArithmetic.subtract(
+                limbs_1=product, limbs_2=divisor)
+            remainder, borrow = LimbArithmetic.subtract_with_borrow(
+                limbs_1=limbs, limbs_2=product)
+        
+        # Estimate too small: step the quotient up
+        while BinaryComparator.compare_limbs(
+                limbs_1=remainder, limbs_2=divisor) >= 0:
+            quotient = LimbArithmetic.add(limbs_1=quotient, limbs_2=[1])
+            remainder = LimbArithmetic.subtract(
+                limbs_1=remainder, limbs_2=divisor)
+        
+        return quotient, remainder
+    
+    @staticmethod
+    def _divide_2n_1n(
+            *,
+            limbs: Limbs,
+            divisor: Limbs,
+            n: int,
+            multiply: MultiplyFunc,
+            threshold: int) -> p_typ.Tuple[Limbs, Limbs]:
+        """Divide a value below divisor * B ** n by an n-limb divisor.
+        
+        Here B = 2 ** 64 and the divisor has its top bit set.
+        
+        Args:
+            limbs: Dividend, less than divisor * B ** n
+            divisor: Normalized n-limb divisor
+            n: Divisor size in limbs
+            multiply: Multiplication kernel
+            threshold: Size below which long division is used
+            
+        Returns:
+            Tuple of (quotient, remainder) as trimmed limb lists
+        """
+        if n % 2 or n < threshold:
+            return LimbArithmetic.divide(limbs_1=limbs, limbs_2=divisor)
+        
+        half = n // 2
+        quotient_high, remainder = LimbArithmetic._divide_3n_2n(
+            limbs=limbs[half:],
+            divisor=divisor,
+            half=half,
+            multiply=multiply,
+            threshold=threshold)
+        quotient_low, remainder = LimbArithmetic._divide_3n_2n(
+            limbs=LimbArithmetic._concat(
+                high=remainder,
+                low=limbs[:half],
+                size=half),
+            divisor=divisor,
+            half=half,
+            multiply=multiply,
+            threshold=threshold)
+        return (
+            LimbArithmetic._concat(
+                high=quotient_high,
+                low=quotient_low,
+                size=half),
+            remainder)
+    
+    @staticmethod
+    def _divide_3n_2n(
+            *,
+            limbs: p_typ.Sequence[int],
+            divisor: Limbs,
+            half: int,
+            multiply: MultiplyFunc,
+            threshold: int) -> p_typ.Tuple[Limbs, Limbs]:
+        """Divide a 3-part value by a 2-part divisor (parts of half limbs).
+        
+        The quotient is estimated by dividing the top two parts by the top
+        divisor part and corrected by at most two additions of the divisor.
+        
+        Args:
+            limbs: Dividend [a1, a2, a3], less than divisor * B ** half
+            divisor: Normalized divisor [b1, b2]
+            half: Part size in limbs
+            multiply: Multiplication kernel
+            threshold: Size below which long division is used
+            
+        Returns:
+            Tuple of (quotient, remainder) as trimmed limb lists
+        """
+        top = BinaryNormalizer.remove_leading_zero_limbs(
+            limbs=list(limbs[half:]))
+        divisor_high = divisor[half:]
+        divisor_low = BinaryNormalizer.remove_leading_zero_limbs(
+            limbs=list(divisor[:half]))
+        
+        if BinaryComparator.compare_limbs(
+                limbs_1=top[half:], limbs_2=divisor_high) < 0:
+            quotient, partial = LimbArithmetic._divide_2n_1n(
+                limbs=top,
+                divisor=divisor_high,
+                n=half,
+                multiply=multiply,
+                threshold=threshold)
+        else:
+            # Quotient saturates at B ** half - 1
+            quotient = [LIMB_MASK] * half
+            partial = LimbArithmetic.add(
+                limbs_1=LimbArithmetic.subtract(
+                    limbs_1=top,
+                    limbs_2=[0] * half + list(divisor_high)),
+                limbs_2=divisor_high)
+        
+        remainder = LimbArithmetic._signed_subtract(
+            value_1=(1, LimbArithmetic._concat(
+                high=partial,
+                low=limbs[:half],
+                size=half)),
+            value_2=(1, multiply(limbs_1=quotient, limbs_2=divisor_low)))
+        while remainder[0] < 0 and remainder[1]:
+            quotient = LimbArithmetic.subtract(limbs_1=quotient, limbs_2=[1])
+            remainder = LimbArithmetic._signed_add(
+                value_1=remainder,
+                value_2=(1, divisor))
+        return quotient, remainder[1]
+    
+    @staticmethod
+    def _concat(
+            *,
+            high: p_typ.Sequence[int],
+            low: p_typ.Sequence[int],
+            size: int) -> Limbs:
+        """Concatenate limb lists into high * B ** size + low.
+        
+        Args:
+            high: High part
+            low: Low part, shorter than size limbs
+            size: Limb position of high
+            
+        Returns:
+            Combined value as trimmed limb list
+        """
+        result = list(low)
+        result.extend([0] * (size - len(result)))
+        result.extend(high)
+        return BinaryNormalizer.remove_leading_zero_limbs(limbs=result)
+    
+    @staticmethod
+    def _trailing_zeros(*, limbs: p_typ.Sequence[int]) -> int:
+        """Count the trailing zero bits of a non-zero limb list.
+        
+        Args:
+            limbs: Non-zero number
+            
+        Returns:
+            Number of trailing zero bits
+        """
+        index = 0
+        while not limbs[index]:
+            index += 1
+        limb = limbs[index]
+        return index * LIMB_BITS + (limb & -limb).bit_length() - 1
+    
+    @staticmethod
+    def _lehmer_matrix(
+            *,
+            limbs_1: Limbs,
+            limbs_2: Limbs) -> p_typ.Optional[p_typ.Tuple[int, int, int, int]]:
+        """Collect one Lehmer cofactor matrix from the leading 64 bits.
+        
+        Args:
+            limbs_1: Larger value
+            limbs_2: Smaller value
+            
+        Returns:
+            Matrix (a, b, c, d) mapping (x, y) to (a * x + b * y,
+            c * x + d * y), or None if not even one quotient is certain
+        """
+        shift = max(BinaryPacker.bit_length(limbs=limbs_1) - LIMB_BITS, 0)
+        index, bits = divmod(shift, LIMB_BITS)
+        top_1 = top_2 = 0
+        for offset in range(2, -1, -1):
+            top_1 = (top_1 << LIMB_BITS) | (
+                limbs_1[index + offset]
+                if index + offset < len(limbs_1) else 0)
+            top_2 = (top_2 << LIMB_BITS) | (
+                limbs_2[index + offset]
+                if index + offset < len(limbs_2) else 0)
+        top_1 >>= bits
+        top_2 >>= bits
+        
+        # Euclid on the leading words with Knuth's two-quotient test
+        a, b, c, d = 1, 0, 0, 1
+        while top_2 + c and top_2 + d:
+            quotient = (top_1 + a) // (top_2 + c)
+            if quotient != (top_1 + b) // (top_2 + d):
+                break
+            a, c = c, a - quotient * c
+            b, d = d, b - quotient * d
+            top_1, top_2 = top_2, top_1 - quotient * top_2
+        if not b:
+            return None
+        return a, b, c, d
+    
+    @staticmethod
+    def _lehmer_combine(
+            *,
+            limbs_1: Limbs,
+            limbs_2: Limbs,
+            factor_1: int,
+            factor_2: int) -> Limbs:
+        """Compute factor_1 * limbs_1 + factor_2 * limbs_2 (non-negative).
+        
+        Args:
+            limbs_1: First value
+            limbs_2: Second value
+            factor_1: Single-word signed factor of limbs_1
+            factor_2: Single-word signed factor of limbs_2
+            
+        Returns:
+            Combination as trimmed limb list
+        """
+        _, limbs = LimbArithmetic._signed_combine(
+            value_1=(1, limbs_1),
+            value_2=(1, limbs_2),
+            factor_1=factor_1,
+            factor_2=factor_2)
+        return limbs
+    
+    @staticmethod
+    def _signed_combine(
+            *,
+            value_1: SignedLimbs,
+            value_2: SignedLimbs,
+            factor_1: int,
+            factor_2: int) -> SignedLimbs:
+        """Compute factor_1 * value_1 + factor_2 * value_2 on signed values.
+        
+        Args:
+            value_1: First value as (sign, magnitude limbs)
+            value_2: Second value as (sign, magnitude limbs)
+            factor_1: Single-word signed factor of value_1
+            factor_2: Single-word signed factor of value_2
+            
+        Returns:
+            Combination as (sign, magnitude limbs)
+        """
+        return LimbArithmetic._signed_add(
+            value_1=(
+                value_1[0] * (1 if factor_1 >= 0 else -1),
+                LimbArithmetic.multiply(
+                    limbs_1=value_1[1], limbs_2=[abs(factor_1)])),
+            value_2=(
+                value_2[0] * (1 if factor_2 >= 0 else -1),
+                LimbArithmetic.multiply(
+                    limbs_1=value_2[1], limbs_2=[abs(factor_2)])))
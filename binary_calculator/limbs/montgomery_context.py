@@ -0,0 +1,232 @@
+"""Montgomery context class for modular arithmetic with a fixed modulus."""
+
+import typing as p_typ
+from ..comparator.binary_comparator import BinaryComparator
+from ..normalizer.binary_normalizer import BinaryNormalizer
+from .binary_packer import LIMB_BITS, LIMB_MASK
+from .limb_arithmetic import LimbArithmetic
+
+Limbs = p_typ.List[int]
+
+
+class MontgomeryContext:
+    """Montgomery multiplication modulo a fixed odd modulus.
+    
+    With n limbs in the modulus m and R = 2 ** (64 * n), a residue x is
+    kept as x * R mod m (its Montgomery form). The Montgomery product of
+    two such residues, a * b / R mod m, replaces the division by m with
+    divisions by R, which are limb shifts. The product is computed with
+    the coarsely integrated operand scanning (CIOS) method: every limb of
+    the multiplier adds one row of the product and immediately cancels the
+    lowest limb with a multiple of m, so the running value never exceeds
+    n + 2 limbs.
+    
+    The constants -m^-1 mod 2 ** 64, R mod m and R ** 2 mod m are computed
+    once per context, so a context should be reused for every operation
+    against the same modulus.
+    
+    Example:
+        >>> context = MontgomeryContext(modulus=[23])
+        >>> context.pow(base=[5], exponent=[3])
+        [10]
+    """
+    
+    def __init__(self, *, modulus: p_typ.Sequence[int]) -> None:
+        """Initialize the context and precompute the Montgomery constants.
+        
+        Args:
+            modulus: Modulus as limbs, least significant limb first
+            
+        Raises:
+            ValueError: If modulus is zero or even
+        """
+        modulus = BinaryNormalizer.remove_leading_zero_limbs(
+            limbs=list(modulus))
+        if not modulus or not modulus[0] & 1:
+            raise ValueError(
+                "Montgomery reduction requires an odd modulus, got "
+                f"{'zero' if not modulus else 'an even number'}")
+        
+        self._modulus = modulus
+        self._size = len(modulus)
+        
+        # Inverse of the lowest limb mod 2 ** 64 by Newton iteration
+        inverse = modulus[0]
+        for _ in range(5):
+            inverse = (inverse * (2 - modulus[0] * inverse)) & LIMB_MASK
+        self._modulus_inverse = -inverse & LIMB_MASK
+        
+        _, one = LimbArithmetic.divide(
+            limbs_1=[0] * self._size + [1],
+            limbs_2=modulus)
+        _, r_squared = LimbArithmetic.divide(
+            limbs_1=[0] * (2 * self._size) + [1],
+            limbs_2=modulus)
+        self._one = self._pad(limbs=one)
+        self._r_squared = self._pad(limbs=r_squared)
+    
+    @property
+    def modulus(self) -> Limbs:
+        """Get the modulus.
+        
+        Returns:
+            Modulus as trimmed limb list
+        """
+        return list(self._modulus)
+    
+    def reduce(self, *, limbs: p_typ.Sequence[int]) -> Limbs:
+        """Reduce a number modulo the modulus.
+        
+        Args:
+            limbs: Number to reduce
+            
+        Returns:
+            limbs mod modulus as trimmed limb list
+        """
+        limbs = BinaryNormalizer.remove_leading_zero_limbs(limbs=list(limbs))
+        if BinaryComparator.compare_limbs(
+                limbs_1=limbs, limbs_2=self._modulus) < 0:
+            return limbs
+        _, remainder = LimbArithmetic.divide(
+            limbs_1=limbs,
+            limbs_2=self._modulus)
+        return remainder
+    
+    def to_montgomery(self, *, limbs: p_typ.Sequence[int]) -> Limbs:
+        """Convert a number into Montgomery form (x * R mod m).
+        
+        Args:
+            limbs: Number to convert (reduced first if not below m)
+            
+        Returns:
+            Montgomery form as trimmed limb list
+        """
+        return BinaryNormalizer.remove_leading_zero_limbs(
+            limbs=self._multiply_padded(
+                limbs_1=self._pad(limbs=self.reduce(limbs=limbs)),
+                limbs_2=self._r_squared))
+    
+    def from_montgomery(self, *, limbs: p_typ.Sequence[int]) -> Limbs:
+        """Convert a number out of Montgomery form (x / R mod m).
+        
+        Args:
+            limbs: Montgomery form below the modulus
+            
+        Returns:
+            Number as trimmed limb list
+        """
+        one = [0] * self._size
+        one[0] = 1
+        return BinaryNormalizer.remove_leading_zero_limbs(
+            limbs=self._multiply_padded(
+                limbs_1=self._pad(limbs=limbs),
+                limbs_2=one))
+    
+    def multiply(
+            self,
+            *,
+            limbs_1: p_typ.Sequence[int],
+            limbs_2: p_typ.Sequence[int]) -> Limbs:
+        """Compute the Montgomery product a * b / R mod m.
+        
+        Args:
+            limbs_1: First factor in Montgomery form, below the modulus
+            limbs_2: Second factor in Montgomery form, below the modulus
+            
+        Returns:
+            Montgomery product as trimmed limb list
+        """
+        return BinaryNormalizer.remove_leading_zero_limbs(
+            limbs=self._multiply_padded(
+                limbs_1=self._pad(limbs=limbs_1),
+                limbs_2=self._pad(limbs=limbs_2)))
+    
+    def pow(
+            self,
+            *,
+            base: p_typ.Sequence[int],
+            exponent: p_typ.Sequence[int]) -> Limbs:
+        """Compute base ** exponent mod m.
+        
+        Uses sliding-window exponentiation (see LimbArithmetic.power) with
+        every product and square in Montgomery form.
+        
+        Args:
+            base: Base as limbs (reduced first if not below m)
+            exponent: Exponent as limbs
+            
+        Returns:
+            Result as trimmed limb list (in the normal domain)
+        """
+        result = LimbArithmetic.power(
+            base=self._pad(limbs=self.to_montgomery(limbs=base)),
+            exponent=exponent,
+            one=self._one,
+            multiply=lambda limbs_1, limbs_2: self._multiply_padded(
+                limbs_1=limbs_1, limbs_2=limbs_2),
+            square=lambda limbs: self._multiply_padded(
+                limbs_1=limbs, limbs_2=limbs))
+        return self.from_montgomery(limbs=result)
+    
+    def _multiply_padded(
+            self,
+            *,
+            limbs_1: Limbs,
+            limbs_2: Limbs) -> Limbs:
+        """Compute a CIOS Montgomery product of two n-limb lists.
+        
+        Args:
+            limbs_1: First factor, exactly n limbs, below the modulus
+            limbs_2: Second factor, exactly n limbs, below the modulus
+            
+        Returns:
+            Montgomery product, exactly n limbs, below the modulus
+        """
+        modulus = self._modulus
+        size = self._size
+        inverse = self._modulus_inverse
+        result = [0] * (size + 2)
+        
+        for limb_2 in limbs_2:
+            # Add one row: result += limbs_1 * limb_2
+            carry = 0
+            for j in range(size):
+                total = result[j] + limbs_1[j] * limb_2 + carry
+                result[j] = total & LIMB_MASK
+                carry = total >> LIMB_BITS
+            total = result[size] + carry
+            result[size] = total & LIMB_MASK
+            result[size + 1] = total >> LIMB_BITS
+            
+            # Cancel the lowest limb and shift down by one limb
+            factor = (result[0] * inverse) & LIMB_MASK
+            carry = (result[0] + factor * modulus[0]) >> LIMB_BITS
+            for j in range(1, size):
+                total = result[j] + factor * modulus[j] + carry
+                result[j - 1] = total & LIMB_MASK
+                carry = total >> LIMB_BITS
+            total = result[size] + carry
+            result[size - 1] = total & LIMB_MASK
+            result[size] = result[size + 1] + (total >> LIMB_BITS)
+        
+        # The result is below 2 * m; one subtraction finishes the reduction
+        result.pop()
+        if BinaryComparator.compare_limbs(
+                limbs_1=result, limbs_2=modulus) >= 0:
+            result, _ = LimbArithmetic.subtract_with_borrow(
+                limbs_1=result,
+                limbs_2=modulus)
+        return self._pad(limbs=result)
+    
+    def _pad(self, *, limbs: p_typ.Sequence[int]) -> Limbs:
+        """Pad or truncate a limb list to exactly n limbs.
+        
+        Args:
+            limbs: Limbs of a number below 2 ** (64 * n)
+            
+        Returns:
+            List of n limbs
+        """
+        padded = list(limbs[:self._size])
+        padded.extend([0] * (self._size - len(padded)))
+        return padded
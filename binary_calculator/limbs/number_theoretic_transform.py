@@ -0,0 +1,271 @@
+"""Number-theoretic transform class for multiplying very large limb lists."""
+
+import typing as p_typ
+from ..normalizer.binary_normalizer import BinaryNormalizer
+from .binary_packer import LIMB_BITS, LIMB_MASK
+
+Limbs = p_typ.List[int]
+
+
+class NumberTheoreticTransform:
+    """Multi-prime number-theoretic transform (NTT) multiplication.
+    
+    The limbs of both operands are used directly as coefficients of two
+    polynomials. Their cyclic convolution (the product polynomial) is
+    computed modulo three 63-bit primes of the form c * 2 ** 40 + 1, where
+    a convolution is a pointwise product between two forward transforms
+    and one inverse transform. The exact coefficients are reassembled with
+    the Chinese remainder theorem (Garner's method) and the carries between
+    neighbouring coefficients are propagated into 64-bit limbs.
+    
+    A coefficient of the convolution is below min(n_1, n_2) * 2 ** 128,
+    which stays under the product of the three primes (about 2 ** 189) for
+    any operand size, so a product costs O(n log n) word operations.
+    """
+    
+    # (prime, quadratic non-residue) pairs; 2 ** 40 divides prime - 1
+    PRIMES = (
+        (9223353345157103617, 5),
+        (9223346748087336961, 7),
+        (9223344549064081409, 3))
+    MAX_TRANSFORM_BITS = 40
+    
+    @staticmethod
+    def multiply(
+            *,
+            limbs_1: p_typ.Sequence[int],
+            limbs_2: p_typ.Sequence[int]) -> Limbs:
+        """Multiply two limb lists through the number-theoretic transform.
+        
+        Args:
+            limbs_1: Multiplicand
+            limbs_2: Multiplier
+            
+        Returns:
+            Product as trimmed limb list
+            
+        Raises:
+            ValueError: If the product exceeds the maximum transform length
+        """
+        if not limbs_1 or not limbs_2:
+            return []
+        
+        size = NumberTheoreticTransform._transform_size(
+            length=len(limbs_1) + len(limbs_2) - 1)
+        residues = []
+        for prime, generator in NumberTheoreticTransform.PRIMES:
+            spectrum_1 = NumberTheoreticTransform._forward(
+                limbs=limbs_1, size=size, prime=prime, generator=generator)
+            spectrum_2 = NumberTheoreticTransform._forward(
+                limbs=limbs_2, size=size, prime=prime, generator=generator)
+            residues.append(NumberTheoreticTransform._inverse(
+                spectrum=[
+                    x * y % prime for x, y in zip(spectrum_1, spectrum_2)],
+                prime=prime,
+                generator=generator))
+        
+        return NumberTheoreticTransform._reconstruct(
+            residues=residues,
+            length=len(limbs_1) + len(limbs_2))
+    
+    @staticmethod
+    def square(*, limbs: p_typ.Sequence[int]) -> Limbs:
+        """Square a limb list through the number-theoretic transform.
+        
+        Only one forward transform per prime is needed, since both factors
+        have the same spectrum.
+        
+        Args:
+            limbs: Number to square
+            
+        Returns:
+            Square as trimmed limb list
+            
+        Raises:
+            ValueError: If the square exceeds the maximum transform length
+        """
+        if not limbs:
+            return []
+        
+        size = NumberTheoreticTransform._transform_size(
+            length=2 * len(limbs) - 1)
+        residues = []
+        for prime, generator in NumberTheoreticTransform.PRIMES:
+            spectrum = NumberTheoreticTransform._forward(
+                limbs=limbs, size=size, prime=prime, generator=generator)
+            residues.append(NumberTheoreticTransform._inverse(
+                spectrum=[x * x % prime for x in spectrum],
+                prime=prime,
+                generator=generator))
+        
+        return NumberTheoreticTransform._reconstruct(
+            residues=residues,
+            length=2 * len(limbs))
+    
+    @staticmethod
+    def _transform_size(*, length: int) -> int:
+        """Get the power-of-two transform size for a convolution length.
+        
+        Args:
+            length: Number of coefficients of the product polynomial
+            
+        Returns:
+            Smallest power of two >= length
+            
+        Raises:
+            ValueError: If the size exceeds 2 ** MAX_TRANSFORM_BITS
+        """
+        size = 1 << max(length - 1, 1).bit_length()
+        if size > 1 << NumberTheoreticTransform.MAX_TRANSFORM_BITS:
+            raise ValueError(
+                f"Operands too large for the number-theoretic transform "
+                f"({length} product limbs)")
+        return size
+    
+    @staticmethod
+    def _forward(
+            *,
+            limbs: p_typ.Sequence[int],
+            size: int,
+            prime: int,
+            generator: int) -> Limbs:
+        """Transform zero-padded limbs into the evaluation domain.
+        
+        Args:
+            limbs: Polynomial coefficients
+            size: Power-of-two transform size
+            prime: NTT prime
+            generator: Quadratic non-residue modulo prime
+            
+        Returns:
+            Transformed values modulo prime
+        """
+        values = [limb % prime for limb in limbs]
+        values.extend([0] * (size - len(values)))
+        root = pow(generator, (prime - 1) // size, prime)
+        NumberTheoreticTransform._transform(
+            values=values, root=root, prime=prime)
+        return values
+    
+    @staticmethod
+    def _inverse(
+            *,
+            spectrum: Limbs,
+            prime: int,
+            generator: int) -> Limbs:
+        """Transform values back into polynomial coefficients.
+        
+        Args:
+            spectrum: Values in the evaluation domain (modified in place)
+            prime: NTT prime
+            generator: Quadratic non-residue modulo prime
+            
+        Returns:
+            Polynomial coefficients modulo prime
+        """
+        size = len(spectrum)
+        root = pow(generator, (prime - 1) // size, prime)
+        NumberTheoreticTransform._transform(
+            values=spectrum,
+            root=pow(root, prime - 2, prime),
+            prime=prime)
+        scale = pow(size, prime - 2, prime)
+        return [value * scale % prime for value in spectrum]
+    
+    @staticmethod
+    def _transform(*, values: Limbs, root: int, prime: int) -> None:
+        """Apply an in-place iterative radix-2 transform.
+        
+        Each stage combines pairs (u, v * w) into (u + v * w, u - v * w).
+        When a stage has more blocks than butterflies per block, all pairs
+        sharing a twiddle factor are processed through one strided slice,
+        so every stage runs O(n) work in few interpreter-level iterations.
+        
+        Args:
+            values: Values to transform, length is a power of two
+            root: Primitive root of unity of order len(values)
+            prime: NTT prime
+        """
+        size = len(values)
+        
+        # Bit-reversal permutation
+        j = 0
+        for i in range(1, size):
+            bit = size >> 1
+            while j & bit:
+                j ^= bit
+                bit >>= 1
+            j |= bit
+            if i < j:
+                values[i], values[j] = values[j], values[i]
+        
+        length = 2
+        while length <= size:
+            half = length >> 1
+            step = pow(root, size // length, prime)
+            twiddles = [1] * half
+            for i in range(1, half):
+                twiddles[i] = twiddles[i - 1] * step % prime
+            
+            if half < size // length:
+                # Many short blocks: one strided slice per twiddle
+                for i, twiddle in enumerate(twiddles):
+                    low = values[i::length]
+                    high = [
+                        value * twiddle % prime
+                        for value in values[i + half::length]]
+                    values[i::length] = [
+                        (u + v) % prime for u, v in zip(low, high)]
+                    values[i + half::length] = [
+                        (u - v) % prime for u, v in zip(low, high)]
+            else:
+                # Few long blocks: one contiguous slice per block
+                for start in range(0, size, length):
+                    middle = start + half
+                    low = values[start:middle]
+                    high = [
+                        value * twiddle % prime
+                        for value, twiddle in zip(
+                            values[middle:start + length], twiddles)]
+                    values[start:middle] = [
+                        (u + v) % prime for u, v in zip(low, high)]
+                    values[middle:start + length] = [
+                        (u - v) % prime for u, v in zip(low, high)]
+            length <<= 1
+    
+    @staticmethod
+    def _reconstruct(
+            *,
+            residues: p_typ.List[Limbs],
+            length: int) -> Limbs:
+        """Combine residues with the CRT and propagate carries into limbs.
+        
+        Args:
+            residues: Convolution coefficients modulo each prime
+            length: Number of limbs of the product
+            
+        Returns:
+            Product as trimmed limb list
+        """
+        (prime_1, _), (prime_2, _), (prime_3, _) = (
+            NumberTheoreticTransform.PRIMES)
+        inverse_1 = pow(prime_1, prime_2 - 2, prime_2)
+        inverse_12 = pow(prime_1 * prime_2 % prime_3, prime_3 - 2, prime_3)
+        prime_12 = prime_1 * prime_2
+        
+        result = []
+        carry = 0
+        for r_1, r_2, r_3 in zip(*residues):
+            if len(result) == length:
+                break
+            # Garner: x = r_1 + p_1 * t_2 + p_1 * p_2 * t_3
+            t_2 = (r_2 - r_1) * inverse_1 % prime_2
+            partial = r_1 + prime_1 * t_2
+            t_3 = (r_3 - partial) * inverse_12 % prime_3
+            total = partial + prime_12 * t_3 + carry
+            result.append(total & LIMB_MASK)
+            carry = total >> LIMB_BITS
+        while carry:
+            result.append(carry & LIMB_MASK)
+            carry >>= LIMB_BITS
+        return BinaryNormalizer.remove_leading_zero_limbs(limbs=result)
@@ -7,7 +7,9 @@ class BinaryNormalizer:
     """Normalizer for binary string utility operations.
     
     This class provides utility methods for normalizing binary strings,
-    such as padding to equal length and removing leading zeros.
+    such as padding to equal length and removing leading zeros. The same
+    normalizations are provided for limb lists (64-bit words, least
+    significant limb first) used by the packed storage backend.
     """
     
     @staticmethod
@@ -57,4 +59,27 @@ class BinaryNormalizer:
         """
         result = binary_str.lstrip('0')
         return result if result else '0'
-
+    
+    @staticmethod
+    def remove_leading_zero_limbs(
+            *,
+            limbs: p_typ.List[int]) -> p_typ.List[int]:
+        """Remove high zero limbs from a limb list.
+        
+        The list is trimmed in place and returned, so kernels can
+        normalize their results without copying. Zero is the empty list.
+        
+        Args:
+            limbs: Limb list potentially with high zero limbs
+            
+        Returns:
+            The same list without high zero limbs
+            
+        Example:
+            >>> normalizer = BinaryNormalizer()
+            >>> normalizer.remove_leading_zero_limbs(limbs=[5, 0, 0])
+            [5]
+        """
+        while limbs and not limbs[-1]:
+            limbs.pop()
+        return limbs
@@ -0,0 +1,3 @@
+"""Benchmarks comparing the algorithm tiers of the binary calculator."""
+
+__all__ = []
@@ -0,0 +1,105 @@
+"""Benchmark: Division Algorithms
+
+Times every division algorithm of ArithmeticCalculator on packed operands
+with a dividend twice as long as the divisor, for divisor sizes from 1K to
+1M bits. Quadratic algorithms are skipped above their size limit so the
+full run finishes in minutes.
+
+Run:
+    python examples/benchmarks/benchmark_division.py
+    python examples/benchmarks/benchmark_division.py --max-bits 65536
+"""
+
+import sys
+import time
+import argparse as p_argp
+import pathlib as p_pthl
+import random as p_rnd
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(p_pthl.Path(__file__).parent.parent.parent))
+
+from binary_calculator import ArithmeticCalculator, BinaryNumber
+
+# Largest divisor size (in bits) timed for each algorithm
+SIZE_LIMITS = {
+    'long': 4096,
+    'schoolbook': 65536,
+    'burnikel_ziegler': 1 << 20,
+    'newton': 1 << 20,
+}
+
+
+def time_division(
+        *,
+        calculator: ArithmeticCalculator,
+        dividend: BinaryNumber,
+        divisor: BinaryNumber,
+        algorithm: str,
+        repeat: int) -> float:
+    """Get the best wall-clock time of one division over several runs.
+    
+    Args:
+        calculator: Calculator to benchmark
+        dividend: Dividend
+        divisor: Divisor
+        algorithm: One of ArithmeticCalculator.DIVIDE_ALGORITHMS
+        repeat: Number of runs
+        
+    Returns:
+        Fastest run time in seconds
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        calculator.divide(
+            operand_1=dividend,
+            operand_2=divisor,
+            algorithm=algorithm)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    """Print a timing table for all division algorithms."""
+    parser = p_argp.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--min-bits', type=int, default=1024)
+    parser.add_argument('--max-bits', type=int, default=1 << 20)
+    parser.add_argument('--repeat', type=int, default=1)
+    args = parser.parse_args()
+    
+    calculator = ArithmeticCalculator()
+    algorithms = ArithmeticCalculator.DIVIDE_ALGORITHMS
+    rng = p_rnd.Random(0)
+    
+    print("Division Benchmark (seconds, dividend = 2 x divisor bits)")
+    print("=" * 78)
+    print(f"{'bits':>9}" + ''.join(f"{name:>17}" for name in algorithms))
+    
+    bits = args.min_bits
+    while bits <= args.max_bits:
+        divisor = BinaryNumber.from_int(
+            decimal_num=rng.getrandbits(bits) | (1 << (bits - 1)),
+            packed=True)
+        dividend = BinaryNumber.from_int(
+            decimal_num=rng.getrandbits(2 * bits),
+            packed=True)
+        
+        row = [f"{bits:>9}"]
+        for algorithm in algorithms:
+            if bits > SIZE_LIMITS[algorithm]:
+                row.append(f"{'-':>17}")
+                continue
+            seconds = time_division(
+                calculator=calculator,
+                dividend=dividend,
+                divisor=divisor,
+                algorithm=algorithm,
+                repeat=args.repeat)
+            row.append(f"{seconds:>17.4f}")
+        print(''.join(row))
+        bits *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,654 @@
+"""Unit tests for ArithmeticCalculator class."""
+
+import unittest as p_ut
+import math as p_math
+import random as p_rnd
+from binary_calculator import (
+    ArithmeticCalculator,
+    BinaryNumber,
+    ConstantMultiplier,
+    MontgomeryContext)
+
+
+class TestArithmeticCalculator(p_ut.TestCase):
+    """Test suite for ArithmeticCalculator class."""
+    
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        self.calculator = ArithmeticCalculator()
+        self.reference = ArithmeticCalculator(mode='reference')
+        self.rng = p_rnd.Random(42)
+    
+    def _number(self, *, value: int) -> BinaryNumber:
+        """Create a string-backed BinaryNumber from an integer."""
+        return BinaryNumber.from_int(decimal_num=value)
+    
+    def _random_int(self, *, bits: int) -> int:
+        """Draw a random integer below 2 ** bits (getrandbits(0) needs 3.9)."""
+        return self.rng.getrandbits(bits) if bits else 0
+    
+    def test_01_addition(self) -> None:
+        """Test addition of small values in both modes."""
+        for calculator in [self.calculator, self.reference]:
+            result = calculator.add(
+                operand_1=BinaryNumber(binary_str='1010'),
+                operand_2=BinaryNumber(binary_str='0101'))
+            self.assertEqual(result.value, '1111')
+            result = calculator.add(
+                operand_1=BinaryNumber(binary_str='0'),
+                operand_2=BinaryNumber(binary_str='000'))
+            self.assertEqual(result.value, '0')
+    
+    def test_02_chunked_addition_matches_reference(self) -> None:
+        """Test chunked addition against the reference mode."""
+        chunk = ArithmeticCalculator.CHUNK_BITS
+        for bits in [1, chunk - 1, chunk, chunk + 1, 2 * chunk, 1000]:
+            a = self.rng.getrandbits(bits)
+            b = self.rng.getrandbits(max(1, bits // 3))
+            operand_1 = self._number(value=a)
+            operand_2 = self._number(value=b)
+            chunked = self.calculator.add(
+                operand_1=operand_1, operand_2=operand_2)
+            reference = self.calculator.add(
+                operand_1=operand_1, operand_2=operand_2, mode='reference')
+            self.assertEqual(chunked.value, reference.value)
+            self.assertEqual(chunked.to_int(), a + b)
+    
+    def test_03_chunked_addition_carry_chain(self) -> None:
+        """Test carries rippling across every chunk boundary."""
+        for bits in [59, 60, 61, 120, 121, 500]:
+            result = self.calculator.add(
+                operand_1=BinaryNumber(binary_str='1' * bits),
+                operand_2=BinaryNumber(binary_str='1'))
+            self.assertEqual(result.value, '1' + '0' * bits)
+    
+    def test_04_invalid_mode(self) -> None:
+        """Test that unknown modes are rejected."""
+        with self.assertRaises(ValueError):
+            ArithmeticCalculator(mode='fast')
+        with self.assertRaises(ValueError):
+            self.calculator.add(
+                operand_1=BinaryNumber(binary_str='1'),
+                operand_2=BinaryNumber(binary_str='1'),
+                mode='fast')
+    
+    def test_05_subtraction(self) -> None:
+        """Test subtraction of small values in both modes."""
+        for calculator in [self.calculator, self.reference]:
+            result = calculator.subtract(
+                operand_1=BinaryNumber(binary_str='1111'),
+                operand_2=BinaryNumber(binary_str='0101'))
+            self.assertEqual(result.value, '1010')
+            result = calculator.subtract(
+                operand_1=BinaryNumber(binary_str='0101'),
+                operand_2=BinaryNumber(binary_str='101'))
+            self.assertEqual(result.value, '0')
+    
+    def test_06_chunked_subtraction_matches_reference(self) -> None:
+        """Test chunked subtraction against the reference mode."""
+        chunk = ArithmeticCalculator.CHUNK_BITS
+        for bits in [1, chunk - 1, chunk, chunk + 1, 2 * chunk, 1000]:
+            a = self.rng.getrandbits(bits) | (1 << (bits - 1))
+            b = self.rng.getrandbits(bits) % (a + 1)
+            operand_1 = self._number(value=a)
+            operand_2 = self._number(value=b)
+            chunked = self.calculator.subtract(
+                operand_1=operand_1, operand_2=operand_2)
+            reference = self.calculator.subtract(
+                operand_1=operand_1, operand_2=operand_2, mode='reference')
+            self.assertEqual(chunked.value, reference.value)
+            self.assertEqual(chunked.to_int(), a - b)
+    
+    def test_07_chunked_subtraction_negative(self) -> None:
+        """Test that the final borrow detects negative results."""
+        cases = [
+            ('0', '1'),
+            ('1' * 120, '1' + '0' * 120),
+            ('0001' + '0' * 100, '1' + '0' * 99 + '1')]
+        for binary_1, binary_2 in cases:
+            for mode in ArithmeticCalculator.MODES:
+                with self.assertRaises(ValueError):
+                    self.calculator.subtract(
+                        operand_1=BinaryNumber(binary_str=binary_1),
+                        operand_2=BinaryNumber(binary_str=binary_2),
+                        mode=mode)
+    
+    def test_08_division_uses_subtraction(self) -> None:
+        """Test long division on values spanning several chunks."""
+        a = self.rng.getrandbits(400)
+        b = self.rng.getrandbits(130) | 1
+        result = self.calculator.divide(
+            operand_1=self._number(value=a),
+            operand_2=self._number(value=b))
+        self.assertEqual(result.to_int(), a // b)
+    
+    def test_09_multiplication_algorithms_agree(self) -> None:
+        """Test every multiplication algorithm on the same operands."""
+        for bits_1, bits_2 in [(1, 1), (100, 37), (700, 650), (1500, 200)]:
+            a = self.rng.getrandbits(bits_1) | 1
+            b = self.rng.getrandbits(bits_2) | 1
+            for algorithm in ArithmeticCalculator.MULTIPLY_ALGORITHMS:
+                result = self.calculator.multiply(
+                    operand_1=self._number(value=a),
+                    operand_2=self._number(value=b),
+                    algorithm=algorithm)
+                self.assertFalse(result.is_packed)
+                self.assertEqual(
+                    result.to_int(),
+                    a * b,
+                    msg=f"Failed for {algorithm} ({bits_1}x{bits_2})")
+    
+    def test_10_karatsuba_threshold(self) -> None:
+        """Test Karatsuba selection above a configurable threshold."""
+        calculator = ArithmeticCalculator(karatsuba_threshold=128)
+        a = self.rng.getrandbits(3000)
+        b = self.rng.getrandbits(2900)
+        for packed in [False, True]:
+            result = calculator.multiply(
+                operand_1=BinaryNumber.from_int(decimal_num=a, packed=packed),
+                operand_2=BinaryNumber.from_int(decimal_num=b, packed=packed))
+            self.assertEqual(result.is_packed, packed)
+            self.assertEqual(result.to_int(), a * b)
+        with self.assertRaises(ValueError):
+            ArithmeticCalculator(karatsuba_threshold=0)
+        with self.assertRaises(ValueError):
+            calculator.multiply(
+                operand_1=BinaryNumber(binary_str='1'),
+                operand_2=BinaryNumber(binary_str='1'),
+                algorithm='fft')
+    
+    def test_11_multiplication_by_zero(self) -> None:
+        """Test products with zero operands."""
+        for algorithm in ArithmeticCalculator.MULTIPLY_ALGORITHMS:
+            result = self.calculator.multiply(
+                operand_1=BinaryNumber(binary_str='0'),
+                operand_2=BinaryNumber(binary_str='1011'),
+                algorithm=algorithm)
+            self.assertEqual(result.value, '0')
+    
+    def test_12_toom3_threshold(self) -> None:
+        """Test Toom-3 selection and its recursion into lower tiers."""
+        calculator = ArithmeticCalculator(
+            karatsuba_threshold=128,
+            toom3_threshold=512)
+        for bits_1, bits_2 in [(6000, 6000), (9000, 2000), (5000, 700)]:
+            a = self.rng.getrandbits(bits_1)
+            b = self.rng.getrandbits(bits_2)
+            result = calculator.multiply(
+                operand_1=BinaryNumber.from_int(decimal_num=a, packed=True),
+                operand_2=BinaryNumber.from_int(decimal_num=b, packed=True))
+            self.assertEqual(result.to_int(), a * b)
+        # Negative evaluation points: all-ones parts make p(-1) negative
+        a = (1 << 4000) - 1
+        b = (1 << 3000) + 1
+        result = calculator.multiply(
+            operand_1=self._number(value=a),
+            operand_2=self._number(value=b),
+            algorithm='toom3')
+        self.assertEqual(result.to_int(), a * b)
+    
+    def test_13_ntt_threshold(self) -> None:
+        """Test NTT selection for large and unbalanced operands."""
+        calculator = ArithmeticCalculator(ntt_threshold=1024)
+        for bits_1, bits_2 in [(20000, 20000), (30000, 1100)]:
+            a = self.rng.getrandbits(bits_1)
+            b = self.rng.getrandbits(bits_2) | (1 << (bits_2 - 1))
+            result = calculator.multiply(
+                operand_1=BinaryNumber.from_int(decimal_num=a, packed=True),
+                operand_2=BinaryNumber.from_int(decimal_num=b, packed=True))
+            self.assertEqual(result.to_int(), a * b)
+        # Carries across every coefficient: all limbs at 2 ** 64 - 1
+        a = (1 << 6400) - 1
+        result = self.calculator.multiply(
+            operand_1=self._number(value=a),
+            operand_2=self._number(value=a),
+            algorithm='ntt')
+        self.assertEqual(result.to_int(), a * a)
+    
+    def test_14_square_all_tiers(self) -> None:
+        """Test square() against plain multiplication for every tier."""
+        calculator = ArithmeticCalculator(
+            karatsuba_threshold=128,
+            toom3_threshold=512,
+            ntt_threshold=4096)
+        for bits in [1, 64, 200, 1000, 3000]:
+            a = self.rng.getrandbits(bits) | (1 << (bits - 1))
+            for algorithm in ArithmeticCalculator.MULTIPLY_ALGORITHMS:
+                result = calculator.square(
+                    operand=self._number(value=a),
+                    algorithm=algorithm)
+                self.assertEqual(
+                    result.to_int(),
+                    a * a,
+                    msg=f"Failed for {algorithm} ({bits} bits)")
+            result = calculator.square(
+                operand=BinaryNumber.from_int(decimal_num=a, packed=True))
+            self.assertTrue(result.is_packed)
+            self.assertEqual(result.to_int(), a * a)
+        self.assertEqual(
+            calculator.square(operand=BinaryNumber(binary_str='000')).value,
+            '0')
+    
+    def test_15_multiply_detects_squares(self) -> None:
+        """Test that multiply() routes equal operands to square()."""
+        a = self.rng.getrandbits(3000)
+        operand = self._number(value=a)
+        result = self.calculator.multiply(operand_1=operand, operand_2=operand)
+        self.assertEqual(result.to_int(), a * a)
+        result = self.calculator.multiply(
+            operand_1=operand,
+            operand_2=BinaryNumber(binary_str='0' + operand.value))
+        self.assertEqual(result.to_int(), a * a)
+    
+    def test_16_division_algorithms_agree(self) -> None:
+        """Test every division algorithm on the same operands."""
+        calculator = ArithmeticCalculator(newton_threshold=256)
+        for bits_1, bits_2 in [(10, 3), (300, 65), (2000, 300), (900, 900)]:
+            a = self.rng.getrandbits(bits_1) | (1 << (bits_1 - 1))
+            b = self.rng.getrandbits(bits_2) | (1 << (bits_2 - 1))
+            for algorithm in ArithmeticCalculator.DIVIDE_ALGORITHMS:
+                result = calculator.divide(
+                    operand_1=self._number(value=a),
+                    operand_2=self._number(value=b),
+                    algorithm=algorithm)
+                self.assertEqual(
+                    result.to_int(),
+                    a // b,
+                    msg=f"Failed for {algorithm} ({bits_1}/{bits_2})")
+    
+    def test_17_newton_division(self) -> None:
+        """Test Newton division around its correction boundaries."""
+        calculator = ArithmeticCalculator(newton_threshold=128)
+        b = (1 << 1000) - 1
+        for a in [b * b, b * b - 1, b * (b + 1), (1 << 3000) - 1, b - 1]:
+            result = calculator.divide(
+                operand_1=BinaryNumber.from_int(decimal_num=a, packed=True),
+                operand_2=BinaryNumber.from_int(decimal_num=b, packed=True))
+            self.assertTrue(result.is_packed)
+            self.assertEqual(result.to_int(), a // b)
+        with self.assertRaises(ZeroDivisionError):
+            calculator.divide(
+                operand_1=BinaryNumber(binary_str='1'),
+                operand_2=BinaryNumber(binary_str='000'),
+                algorithm='newton')
+        with self.assertRaises(ValueError):
+            calculator.divide(
+                operand_1=BinaryNumber(binary_str='1'),
+                operand_2=BinaryNumber(binary_str='1'),
+                algorithm='fast')
+    
+    def test_18_burnikel_ziegler_division(self) -> None:
+        """Test Burnikel-Ziegler division against Python integers."""
+        calculator = ArithmeticCalculator(karatsuba_threshold=128)
+        b = (1 << 1000) - 1
+        cases = [
+            (b * b, b), (b * b - 1, b), ((1 << 3000) - 1, b), (b - 1, b),
+            ((1 << 5000) + 1, 1 << 999)]
+        for _ in range(20):
+            bits_2 = self.rng.randint(128, 2000)
+            cases.append((
+                self.rng.getrandbits(self.rng.randint(bits_2, 6000)),
+                self.rng.getrandbits(bits_2) | (1 << (bits_2 - 1))))
+        for a, b in cases:
+            result = calculator.divide(
+                operand_1=BinaryNumber.from_int(decimal_num=a, packed=True),
+                operand_2=BinaryNumber.from_int(decimal_num=b, packed=True))
+            self.assertTrue(result.is_packed)
+            self.assertEqual(result.to_int(), a // b)
+        self.assertEqual(
+            calculator._select_divide_algorithm(
+                size=128, packed=True, algorithm=None),
+            'burnikel_ziegler')
+        with self.assertRaises(ZeroDivisionError):
+            calculator.divide(
+                operand_1=BinaryNumber(binary_str='1'),
+                operand_2=BinaryNumber(binary_str='0'),
+                algorithm='burnikel_ziegler')
+    
+    def test_19_divmod(self) -> None:
+        """Test divmod() and modulo() with every division algorithm."""
+        calculator = ArithmeticCalculator(
+            karatsuba_threshold=128,
+            newton_threshold=256)
+        cases = [(0, 5), (4, 5), (5, 5), (1000, 7), ((1 << 700) + 3, 1 << 300)]
+        for _ in range(10):
+            cases.append((
+                self.rng.getrandbits(1200),
+                self.rng.getrandbits(self.rng.randint(1, 600)) | 1))
+        for algorithm in ArithmeticCalculator.DIVIDE_ALGORITHMS:
+            for a, b in cases:
+                for packed in [False, True]:
+                    operand_1 = BinaryNumber.from_int(
+                        decimal_num=a, packed=packed)
+                    operand_2 = BinaryNumber.from_int(
+                        decimal_num=b, packed=packed)
+                    quotient, remainder = calculator.divmod(
+                        operand_1=operand_1,
+                        operand_2=operand_2,
+                        algorithm=algorithm)
+                    self.assertEqual(
+                        (quotient.to_int(), remainder.to_int()),
+                        divmod(a, b),
+                        msg=f"Failed for {algorithm}")
+                    self.assertEqual(remainder.is_packed, packed)
+                    self.assertEqual(
+                        calculator.modulo(
+                            operand_1=operand_1,
+                            operand_2=operand_2,
+                            algorithm=algorithm).to_int(),
+                        a % b)
+        with self.assertRaises(ZeroDivisionError):
+            calculator.divmod(
+                operand_1=BinaryNumber(binary_str='1'),
+                operand_2=BinaryNumber(binary_str='0'))
+    
+    def test_20_pow_mod(self) -> None:
+        """Test pow_mod() for odd, even and trivial moduli."""
+        cases = [(5, 3, 23), (7, 0, 10), (0, 5, 9), (3, 100, 1), (2, 10, 1024)]
+        for _ in range(10):
+            cases.append((
+                self.rng.getrandbits(300),
+                self.rng.getrandbits(64),
+                self.rng.getrandbits(self.rng.randint(2, 200)) | 2))
+        for base, exponent, modulus in cases:
+            for packed in [False, True]:
+                result = self.calculator.pow_mod(
+                    base=BinaryNumber.from_int(
+                        decimal_num=base, packed=packed),
+                    exponent=self._number(value=exponent),
+                    modulus=self._number(value=modulus))
+                self.assertEqual(result.to_int(), pow(base, exponent, modulus))
+                self.assertEqual(result.is_packed, packed)
+        
+        modulus = self._number(value=(1 << 127) - 1)
+        context = MontgomeryContext(modulus=modulus.limbs)
+        for base in [2, 3, 12345]:
+            result = self.calculator.pow_mod(
+                base=self._number(value=base),
+                exponent=self._number(value=(1 << 127) - 2),
+                modulus=modulus,
+                context=context)
+            self.assertEqual(result.value, '1')
+        with self.assertRaises(ValueError):
+            self.calculator.pow_mod(
+                base=self._number(value=2),
+                exponent=self._number(value=2),
+                modulus=self._number(value=7),
+                context=context)
+        with self.assertRaises(ZeroDivisionError):
+            self.calculator.pow_mod(
+                base=self._number(value=2),
+                exponent=self._number(value=2),
+                modulus=self._number(value=0))
+    
+    def test_21_power(self) -> None:
+        """Test power() against Python integers across window sizes."""
+        cases = [(0, 0), (0, 5), (7, 0), (1, 1 << 200), (2, 20), (3, 13)]
+        for exponent_bits in [5, 10, 14]:
+            cases.append((
+                self.rng.getrandbits(20),
+                self.rng.getrandbits(exponent_bits)))
+        for base, exponent in cases:
+            for packed in [False, True]:
+                result = self.calculator.power(
+                    operand_1=BinaryNumber.from_int(
+                        decimal_num=base, packed=packed),
+                    operand_2=self._number(value=exponent))
+                self.assertEqual(result.to_int(), base ** exponent)
+                self.assertEqual(result.is_packed, packed)
+    
+    def test_22_gcd_and_lcm(self) -> None:
+        """Test gcd() and lcm() on both sides of the Lehmer threshold."""
+        cases = [(0, 0), (0, 12), (12, 0), (1, 1), (48, 18), (4096, 1500)]
+        for bits in [20, 127, 128, 300, 2000]:
+            common = self.rng.getrandbits(bits // 2) | 1
+            cases.append((
+                self.rng.getrandbits(bits) * common,
+                self.rng.getrandbits(bits) * common << 3))
+        for a, b in cases:
+            for packed in [False, True]:
+                operand_1 = BinaryNumber.from_int(
+                    decimal_num=a, packed=packed)
+                operand_2 = self._number(value=b)
+                result = self.calculator.gcd(
+                    operand_1=operand_1, operand_2=operand_2)
+                self.assertEqual(result.to_int(), p_math.gcd(a, b))
+                self.assertEqual(result.is_packed, packed)
+                result = self.calculator.lcm(
+                    operand_1=operand_1, operand_2=operand_2)
+                self.assertEqual(
+                    result.to_int(), a * b // p_math.gcd(a, b) if a else 0)
+    
+    def test_23_extended_gcd(self) -> None:
+        """Test the unsigned Bezout form returned by extended_gcd()."""
+        cases = [(240, 46), (46, 240), (7, 7), (1, 5), (5, 1), (9, 0)]
+        for bits in [60, 200, 1000]:
+            cases.append((
+                self.rng.getrandbits(bits) | 1,
+                self.rng.getrandbits(bits) | 1))
+        # Multi-limb operand_1 below operand_2 (the Lehmer step must not
+        # run before the operands are swapped)
+        cases.append((0x3959cea9c6b690423a79fcbce8a4b9da, int(
+            '131405221ca80e5e7d3b003e6d9320daf70661d563b6fd96eb337634'
+            'd608958fdc29c959a0fe5c72e2bab346053d6d4c22aca9c3e174315e'
+            'd24a8592cb5304aebcab271b58c90cb3bd1e2f90be27ed9c83f20605'
+            '74d94ad20178c3694b74e78e85ac7f0eba0590ea6eb00e0a920f13a7'
+            '84f01cf87e50e9a0fd5e74b050', 16)))
+        for _ in range(50):
+            cases.append((
+                self.rng.getrandbits(self.rng.randint(1, 200)) | (1 << 64),
+                self.rng.getrandbits(997) | (1 << 996)))
+        for a, b in cases:
+            divisor, x, y = self.calculator.extended_gcd(
+                operand_1=self._number(value=a),
+                operand_2=self._number(value=b))
+            self.assertEqual(divisor.to_int(), p_math.gcd(a, b))
+            self.assertEqual(
+                a * x.to_int() - b * y.to_int(), divisor.to_int())
+            if b:
+                self.assertTrue(1 <= x.to_int() <= b // divisor.to_int())
+        with self.assertRaises(ValueError):
+            self.calculator.extended_gcd(
+                operand_1=self._number(value=0),
+                operand_2=self._number(value=3))
+    
+    def test_24_isqrt(self) -> None:
+        """Test isqrt() around perfect squares and on large operands."""
+        values = [0, 1, 2, 3, 4, 99, 100, 2 ** 64 - 1, 2 ** 64, 2 ** 128]
+        for bits in [100, 1000, 5000]:
+            root = self.rng.getrandbits(bits)
+            values.extend([root * root - 1, root * root, root * root + 2 * root])
+        for value in values:
+            for packed in [False, True]:
+                result = self.calculator.isqrt(
+                    operand=BinaryNumber.from_int(
+                        decimal_num=value, packed=packed))
+                floor_root = result.to_int()
+                self.assertLessEqual(floor_root * floor_root, value)
+                self.assertLess(value, (floor_root + 1) * (floor_root + 1))
+                self.assertEqual(result.is_packed, packed)
+    
+    def test_25_floor_and_ceil_log2(self) -> None:
+        """Test floor_log2() and ceil_log2() on both backends."""
+        for value in [1, 2, 3, 4, 5, 1023, 1024, 1025, 2 ** 64, 2 ** 64 + 1]:
+            for packed in [False, True]:
+                operand = BinaryNumber.from_int(
+                    decimal_num=value, packed=packed)
+                self.assertEqual(
+                    self.calculator.floor_log2(operand=operand).to_int(),
+                    value.bit_length() - 1)
+                self.assertEqual(
+                    self.calculator.ceil_log2(operand=operand).to_int(),
+                    (value - 1).bit_length())
+        self.assertEqual(
+            self.calculator.ceil_log2(
+                operand=BinaryNumber(binary_str='0001000')).to_int(), 3)
+        for packed in [False, True]:
+            with self.assertRaises(ValueError):
+                self.calculator.floor_log2(
+                    operand=BinaryNumber.from_int(
+                        decimal_num=0, packed=packed))
+            with self.assertRaises(ValueError):
+                self.calculator.ceil_log2(operand=BinaryNumber(binary_str='00'))
+    
+    def test_26_prepared_divisor(self) -> None:
+        """Test PreparedDivisor against Python integers and divmod()."""
+        small = ArithmeticCalculator(karatsuba_threshold=128)
+        for divisor_bits in [1, 64, 65, 130, 300, 700]:
+            divisor = self.rng.getrandbits(divisor_bits) | (
+                1 << (divisor_bits - 1))
+            for calculator in [self.calculator, small]:
+                for packed in [False, True]:
+                    prepared = calculator.prepare_divisor(
+                        divisor=BinaryNumber.from_int(
+                            decimal_num=divisor, packed=packed))
+                    self.assertTrue(prepared.matches(
+                        operand=self._number(value=divisor)))
+                    self.assertFalse(prepared.matches(
+                        operand=self._number(value=divisor + 1)))
+                    for dividend_bits in [0, divisor_bits - 1, divisor_bits,
+                                          2 * divisor_bits + 3,
+                                          5 * divisor_bits + 70]:
+                        dividend = self._random_int(bits=dividend_bits)
+                        quotient, remainder = prepared.divmod(
+                            dividend=BinaryNumber.from_int(
+                                decimal_num=dividend, packed=packed))
+                        self.assertEqual(
+                            (quotient.to_int(), remainder.to_int()),
+                            divmod(dividend, divisor))
+                        self.assertEqual(quotient.is_packed, packed)
+        prepared = self.calculator.prepare_divisor(
+            divisor=BinaryNumber(binary_str='0101'))
+        self.assertEqual(
+            prepared.divide(dividend=BinaryNumber(binary_str='11110')).value,
+            '110')
+        self.assertEqual(
+            prepared.modulo(dividend=BinaryNumber(binary_str='11110')).value,
+            '0')
+        for packed in [False, True]:
+            with self.assertRaises(ZeroDivisionError):
+                self.calculator.prepare_divisor(
+                    divisor=BinaryNumber.from_int(
+                        decimal_num=0, packed=packed))
+    
+    def test_27_constant_multiplier(self) -> None:
+        """Test compiled constant multipliers and their NAF digits."""
+        constants = [0, 1, 2, 3, 7, 1000, (1 << 64) - 1, (1 << 200) + 1,
+                     (1 << 300) - (1 << 150), self.rng.getrandbits(256)]
+        for constant in constants:
+            multiplier = self.calculator.compile_multiplier(
+                multiplier=self._number(value=constant))
+            self.assertEqual(
+                sum(sign << position
+                    for position, sign in multiplier.digits), constant)
+            positions = [position for position, _ in multiplier.digits]
+            self.assertTrue(all(
+                high - low >= 2 for high, low in zip(positions, positions[1:])))
+            for bits in [0, 3, 64, 500]:
+                value = self._random_int(bits=bits)
+                for packed in [False, True]:
+                    result = multiplier(
+                        BinaryNumber.from_int(decimal_num=value, packed=packed))
+                    self.assertEqual(result.to_int(), value * constant)
+                    self.assertEqual(result.is_packed, packed)
+        self.assertTrue(self.calculator.compile_multiplier(
+            multiplier=self._number(value=(1 << 200) + 1)).is_chain)
+        self.assertFalse(self.calculator.compile_multiplier(
+            multiplier=self._number(value=1000)).is_chain)
+        
+        # Typical sparse strides compile to a chain, taken on large operands
+        for stride in [129, (1 << 20) + 1, (1 << 40) - 1, 1 << 33,
+                       (1 << 64) + 1, (1 << 100) - 1]:
+            multiplier = ConstantMultiplier(
+                multiplier=self._number(value=stride))
+            self.assertTrue(multiplier.is_chain, msg=f"Failed for {stride}")
+            self.assertTrue(multiplier.uses_chain(
+                size=ConstantMultiplier.CHAIN_LIMBS))
+            value = self.rng.getrandbits(
+                ConstantMultiplier.CHAIN_LIMBS * 64)
+            self.assertEqual(
+                multiplier(BinaryNumber.from_int(
+                    decimal_num=value, packed=True)).to_int(),
+                value * stride)
+        self.assertFalse(ConstantMultiplier(
+            multiplier=self._number(value=129)).uses_chain(size=1))
+        self.assertEqual(
+            repr(ConstantMultiplier(multiplier=self._number(value=1000))),
+            'ConstantMultiplier(x<<10 - x<<5 + x<<3)')
+    
+    def test_28_multiply_add(self) -> None:
+        """Test multiply_add() against Python integers on both backends."""
+        small = ArithmeticCalculator(karatsuba_threshold=128)
+        for bits_1, bits_2, bits_3 in [(0, 5, 7), (5, 0, 0), (64, 64, 200),
+                                       (300, 300, 10), (10, 10, 700),
+                                       (500, 450, 900)]:
+            a = self._random_int(bits=bits_1)
+            b = self._random_int(bits=bits_2)
+            c = self._random_int(bits=bits_3)
+            for calculator in [self.calculator, small]:
+                for packed in [False, True]:
+                    result = calculator.multiply_add(
+                        operand_1=self._number(value=a),
+                        operand_2=self._number(value=b),
+                        operand_3=BinaryNumber.from_int(
+                            decimal_num=c, packed=packed))
+                    self.assertEqual(result.to_int(), a * b + c)
+                    self.assertEqual(result.is_packed, packed)
+        all_ones = (1 << 128) - 1
+        result = self.calculator.multiply_add(
+            operand_1=self._number(value=all_ones),
+            operand_2=self._number(value=all_ones),
+            operand_3=self._number(value=(1 << 256) - 1))
+        self.assertEqual(
+            result.to_int(), all_ones * all_ones + (1 << 256) - 1)
+    
+    def test_29_sum_many(self) -> None:
+        """Test sum_many() on lists, generators and carry-heavy inputs."""
+        values = [self._random_int(bits=self.rng.choice([0, 10, 64, 300]))
+                  for _ in range(200)]
+        values += [(1 << 64) - 1] * 1000 + [(1 << 640) - 1] * 3
+        for packed in [False, True]:
+            result = self.calculator.sum_many(operands=(
+                BinaryNumber.from_int(decimal_num=value, packed=packed)
+                for value in values))
+            self.assertEqual(result.to_int(), sum(values))
+            self.assertEqual(result.is_packed, packed)
+        mixed = self.calculator.sum_many(operands=[
+            BinaryNumber(binary_str='0011'),
+            BinaryNumber.from_int(decimal_num=4, packed=True)])
+        self.assertEqual(mixed.to_int(), 7)
+        self.assertTrue(mixed.is_packed)
+        self.assertEqual(self.calculator.sum_many(operands=[]).value, '0')
+    
+    def test_30_product_many(self) -> None:
+        """Test product_many() against a Python product on both backends."""
+        small = ArithmeticCalculator(
+            karatsuba_threshold=128, toom3_threshold=512)
+        factors = [self.rng.getrandbits(self.rng.choice([1, 20, 64, 200]))
+                   | 1 for _ in range(77)]
+        expected = 1
+        for factor in factors:
+            expected *= factor
+        for calculator in [self.calculator, small]:
+            for packed in [False, True]:
+                result = calculator.product_many(operands=(
+                    BinaryNumber.from_int(decimal_num=factor, packed=packed)
+                    for factor in factors))
+                self.assertEqual(result.to_int(), expected)
+                self.assertEqual(result.is_packed, packed)
+        self.assertEqual(
+            self.calculator.product_many(operands=(
+                self._number(value=factor)
+                for factor in range(1, 301))).to_int(),
+            p_math.factorial(300))
+        self.assertEqual(self.calculator.product_many(operands=[]).value, '1')
+        zero = self.calculator.product_many(operands=[
+            self._number(value=5),
+            self._number(value=0),
+            BinaryNumber.from_int(decimal_num=3, packed=True)])
+        self.assertEqual(zero.to_int(), 0)
+        self.assertTrue(zero.is_packed)
+
+
+if __name__ == '__main__':
+    p_ut.main()
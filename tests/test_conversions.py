@@ -2,7 +2,16 @@
 
 import unittest as p_ut
 import random as p_rnd
-from binary_calculator import BinaryConverter
+import array as p_arr
+from binary_calculator import (
+    ArithmeticCalculator,
+    BinaryConverter,
+    RadixPowerCache)
+
+try:
+    import numpy as p_np
+except ImportError:
+    p_np = None
 
 
 class TestBinaryToDecimalConversion(p_ut.TestCase):
@@ -752,6 +761,257 @@ class TestConversionEdgeCases(p_ut.TestCase):
                 msg=f"Pattern conversion failed for {pattern}")
 
 
+
+class TestDecimalStringConversion(p_ut.TestCase):
+    """Tests for divide-and-conquer decimal string conversion."""
+    
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        self.converter = BinaryConverter()
+        self.rng = p_rnd.Random(20)
+    
+    def test_01_decimal_str_to_binary(self) -> None:
+        """Test decimal strings around the split sizes."""
+        for length in list(range(1, 45)) + [303, 304, 305, 1000, 4000]:
+            digits = ''.join(
+                self.rng.choice('0123456789') for _ in range(length))
+            self.assertEqual(
+                self.converter.decimal_str_to_binary(decimal_str=digits),
+                bin(int(digits))[2:],
+                msg=f"Failed for {length} digits")
+    
+    def test_02_decimal_str_beyond_int_digit_limit(self) -> None:
+        """Test strings longer than the default int() digit limit."""
+        digits = '9' * 5000
+        binary = self.converter.decimal_str_to_binary(decimal_str=digits)
+        self.assertEqual(int(binary, 2), 10 ** 5000 - 1)
+    
+    def test_03_decimal_str_sign_and_validation(self) -> None:
+        """Test signs, leading zeros and invalid strings."""
+        self.assertEqual(
+            self.converter.decimal_str_to_binary(decimal_str='-0010'),
+            '-1010')
+        self.assertEqual(
+            self.converter.decimal_str_to_binary(decimal_str='-000'), '0')
+        for invalid in ['', '-', '12a', '1.5', '+1', ' 1', '\u0661']:
+            with self.assertRaises(ValueError):
+                self.converter.decimal_str_to_binary(decimal_str=invalid)
+    
+    def test_04_binary_to_decimal_str(self) -> None:
+        """Test decimal rendering around the split sizes."""
+        values = [0, 1, 9, 10, 10 ** 19 - 1, 10 ** 19, 2 ** 64 - 1, 2 ** 64]
+        for bits in [100, 1023, 1024, 1025, 1100, 5000, 14000]:
+            values.append(self.rng.getrandbits(bits))
+            values.append(10 ** (bits // 4) - 1)
+            values.append(10 ** (bits // 4))
+        for value in values:
+            self.assertEqual(
+                self.converter.binary_to_decimal_str(
+                    binary_str=bin(value)[2:]),
+                str(value),
+                msg=f"Failed for {value.bit_length()} bits")
+    
+    def test_05_binary_to_decimal_str_sign_and_validation(self) -> None:
+        """Test signs, leading zeros, round trips and invalid strings."""
+        self.assertEqual(
+            self.converter.binary_to_decimal_str(binary_str='-0001010'),
+            '-10')
+        self.assertEqual(
+            self.converter.binary_to_decimal_str(binary_str='-0'), '0')
+        digits = '1' + '0' * 4999 + '7'
+        self.assertEqual(
+            self.converter.binary_to_decimal_str(
+                binary_str=self.converter.decimal_str_to_binary(
+                    decimal_str=digits)),
+            digits)
+        for invalid in ['', '-', '102', '0b1', ' 1']:
+            with self.assertRaises(ValueError):
+                self.converter.binary_to_decimal_str(binary_str=invalid)
+
+
+class TestRadixConversion(p_ut.TestCase):
+    """Tests for hex, octal and arbitrary-radix conversions."""
+    
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        self.converter = BinaryConverter()
+        self.rng = p_rnd.Random(22)
+    
+    def _format(self, *, value: int, radix: int) -> str:
+        """Format a non-negative integer in a radix with Python ints."""
+        digits = []
+        while value:
+            value, digit = divmod(value, radix)
+            digits.append(BinaryConverter.DIGITS[digit])
+        return ''.join(reversed(digits)) or '0'
+    
+    def test_01_hex_and_octal(self) -> None:
+        """Test hex and octal conversions against format()."""
+        for bits in [0, 1, 3, 4, 5, 63, 64, 65, 1000]:
+            value = self.rng.getrandbits(bits) if bits else 0
+            binary = bin(value)[2:]
+            self.assertEqual(
+                self.converter.binary_to_hex(binary_str=binary),
+                format(value, 'x'))
+            self.assertEqual(
+                self.converter.binary_to_octal(binary_str='000' + binary),
+                format(value, 'o'))
+            self.assertEqual(
+                self.converter.hex_to_binary(hex_str=format(value, 'X')),
+                binary)
+            self.assertEqual(
+                self.converter.octal_to_binary(
+                    octal_str='00' + format(value, 'o')),
+                binary)
+        self.assertEqual(
+            self.converter.hex_to_binary(hex_str='-fF'), '-11111111')
+        self.assertEqual(
+            self.converter.binary_to_hex(binary_str='-11111111'), '-ff')
+        for invalid in ['', '0x1f', 'g', '1 2']:
+            with self.assertRaises(ValueError):
+                self.converter.hex_to_binary(hex_str=invalid)
+        with self.assertRaises(ValueError):
+            self.converter.octal_to_binary(octal_str='8')
+    
+    def test_02_all_radices_round_trip(self) -> None:
+        """Test every radix from 2 to 36 in both directions."""
+        for radix in range(2, 37):
+            for bits in [0, 1, 64, 65, 700, 3000]:
+                value = self.rng.getrandbits(bits) if bits else 0
+                digits = self._format(value=value, radix=radix)
+                self.assertEqual(
+                    self.converter.binary_to_radix_str(
+                        binary_str=bin(value)[2:], radix=radix),
+                    digits,
+                    msg=f"Failed for radix {radix}, {bits} bits")
+                self.assertEqual(
+                    self.converter.radix_str_to_binary(
+                        digits_str=digits.upper(), radix=radix),
+                    bin(value)[2:],
+                    msg=f"Failed for radix {radix}, {bits} bits")
+        for radix in [0, 1, 37, 10.0]:
+            with self.assertRaises(ValueError):
+                self.converter.binary_to_radix_str(
+                    binary_str='1', radix=radix)
+        with self.assertRaises(ValueError):
+            self.converter.radix_str_to_binary(digits_str='z', radix=35)
+    
+    def test_03_radix_power_cache_bounds(self) -> None:
+        """Test LRU eviction of the radix power cache."""
+        cache = RadixPowerCache(
+            calculator=ArithmeticCalculator(), max_radices=2, max_limbs=64)
+        for radix in [3, 5, 7]:
+            self.assertEqual(
+                cache.power(radix=radix, level=2).to_int(),
+                radix ** (4 * RadixPowerCache.digits_per_limb(radix=radix)))
+        self.assertEqual(cache.radices(), [5, 7])
+        cache.power(radix=5, level=0)
+        self.assertEqual(cache.radices(), [7, 5])
+        cache.power(radix=3, level=6)
+        self.assertEqual(cache.radices(), [3])
+        self.assertGreater(cache.cached_limbs, 64)
+        quotient, remainder = cache.divisor(radix=3, level=1).divmod(
+            dividend=cache.power(radix=3, level=2))
+        self.assertEqual(quotient, cache.power(radix=3, level=1))
+        self.assertEqual(remainder.to_int(), 0)
+        cache.clear()
+        self.assertEqual((cache.radices(), cache.cached_limbs), ([], 0))
+        
+        # Prepared divisors count towards max_limbs as well
+        cache = RadixPowerCache(
+            calculator=ArithmeticCalculator(), max_radices=4, max_limbs=40)
+        divisor = cache.divisor(radix=3, level=3)
+        self.assertGreater(divisor.limb_count, 8)
+        self.assertEqual(
+            cache.cached_limbs, 1 + 2 + 4 + 8 + divisor.limb_count)
+        divisor = cache.divisor(radix=5, level=3)
+        self.assertEqual(cache.radices(), [5])
+        self.assertEqual(
+            cache.cached_limbs, 1 + 2 + 4 + 8 + divisor.limb_count)
+        with self.assertRaises(ValueError):
+            RadixPowerCache(calculator=ArithmeticCalculator(), max_radices=0)
+
+
+class TestBulkConversion(p_ut.TestCase):
+    """Tests for the bulk conversion methods."""
+    
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        self.converter = BinaryConverter()
+        self.rng = p_rnd.Random(23)
+        self.values = [0, 1, (1 << 64) - 1] + [
+            self.rng.getrandbits(bits) for bits in [3, 32, 63, 64] * 25]
+    
+    def test_01_sequences_match_scalar(self) -> None:
+        """Test lists, tuples and iterators against the scalar methods."""
+        values = self.values + [-1, -(1 << 64), 1 << 100]
+        binary_strs = [
+            self.converter.decimal_to_binary(decimal_num=value)
+            for value in values]
+        self.assertEqual(
+            self.converter.decimal_to_binary_many(decimal_nums=values),
+            binary_strs)
+        self.assertEqual(
+            self.converter.decimal_to_binary_many(
+                decimal_nums=tuple(values)),
+            tuple(binary_strs))
+        self.assertEqual(
+            self.converter.decimal_to_binary_many(
+                decimal_nums=iter(values)),
+            binary_strs)
+        self.assertEqual(
+            self.converter.binary_to_decimal_many(binary_strs=binary_strs),
+            values)
+        self.assertEqual(
+            self.converter.binary_to_decimal_many(
+                binary_strs=tuple(binary_strs)),
+            tuple(values))
+        self.assertEqual(
+            self.converter.binary_to_decimal_many(binary_strs=[]), [])
+        with self.assertRaises(ValueError):
+            self.converter.binary_to_decimal_many(binary_strs=['1', '102'])
+    
+    def test_02_array_objects(self) -> None:
+        """Test unsigned and signed array objects."""
+        unsigned = p_arr.array('Q', self.values)
+        binary_strs = self.converter.decimal_to_binary_many(
+            decimal_nums=unsigned)
+        self.assertEqual(binary_strs, [bin(value)[2:] for value in unsigned])
+        self.assertEqual(
+            p_arr.array('Q', self.converter.binary_to_decimal_many(
+                binary_strs=binary_strs)),
+            unsigned)
+        signed = p_arr.array('q', [0, -5, 7, -(1 << 63)])
+        self.assertEqual(
+            self.converter.decimal_to_binary_many(decimal_nums=signed),
+            ['0', '-101', '111', '-1' + '0' * 63])
+    
+    @p_ut.skipUnless(p_np is not None, "NumPy is not installed")
+    def test_03_numpy_arrays(self) -> None:
+        """Test NumPy arrays keep their shape and use uint64 if possible."""
+        numbers = p_np.array(
+            self.values[:100], dtype=p_np.uint64).reshape(4, 25)
+        binary_strs = self.converter.decimal_to_binary_many(
+            decimal_nums=numbers)
+        self.assertEqual(binary_strs.shape, (4, 25))
+        self.assertEqual(
+            binary_strs.ravel().tolist(),
+            [bin(value)[2:] for value in self.values[:100]])
+        result = self.converter.binary_to_decimal_many(
+            binary_strs=binary_strs)
+        self.assertEqual(result.dtype, p_np.uint64)
+        self.assertTrue((result == numbers).all())
+        
+        wide = self.converter.binary_to_decimal_many(
+            binary_strs=p_np.array(['1' * 65, '-1']))
+        self.assertEqual(wide.dtype, object)
+        self.assertEqual(wide.tolist(), [(1 << 65) - 1, -1])
+        self.assertEqual(
+            self.converter.decimal_to_binary_many(
+                decimal_nums=p_np.array([-5, 3], dtype=p_np.int8)).tolist(),
+            ['-101', '11'])
+
+
 if __name__ == '__main__':
     p_ut.main()
 
@@ -1,7 +1,13 @@
 """Unit tests for InstructionExecutor class."""
 
 import unittest as p_ut
-from binary_calculator import BinaryInstruction, InstructionExecutor
+import io as p_io
+import contextlib as p_ctx
+from binary_calculator import (
+    BinaryInstruction,
+    BinaryNumber,
+    BinaryNumberArray,
+    InstructionExecutor)
 
 
 class TestInstructionExecutor(p_ut.TestCase):
@@ -179,6 +185,213 @@ class TestInstructionExecutor(p_ut.TestCase):
             self.assertIn("-", msg)
             # Should mention what to use instead
             self.assertIn("calculate()", msg)
+    
+    def test_13_modulo_and_divmod(self) -> None:
+        """Test '%' and '/%' instructions, including printed output."""
+        for packed in [False, True]:
+            operand_1 = BinaryNumber.from_int(decimal_num=1000, packed=packed)
+            operand_2 = BinaryNumber.from_int(decimal_num=7, packed=packed)
+            remainder = self.executor.calculate(
+                instruction=BinaryInstruction(
+                    operand_1=operand_1,
+                    operand_2=operand_2,
+                    operation='%'))
+            self.assertEqual(remainder.to_int(), 1000 % 7)
+            quotient, remainder = self.executor.calculate(
+                instruction=BinaryInstruction(
+                    operand_1=operand_1,
+                    operand_2=operand_2,
+                    operation='/%'))
+            self.assertEqual(quotient.to_int(), 1000 // 7)
+            self.assertEqual(remainder.to_int(), 1000 % 7)
+        
+        output = p_io.StringIO()
+        with p_ctx.redirect_stdout(output):
+            self.executor.calculate(
+                instruction=BinaryInstruction(
+                    operand_1=BinaryNumber(binary_str='1011'),
+                    operand_2=BinaryNumber(binary_str='11'),
+                    operation='/%'),
+                print_result=True)
+        self.assertEqual(
+            output.getvalue().splitlines(),
+            ['   1011', '/%   11', '-------', '     11', '     10', '======='])
+    
+    def test_14_power(self) -> None:
+        """Test '**' instructions for string and packed operands."""
+        for packed in [False, True]:
+            result = self.executor.calculate(
+                instruction=BinaryInstruction(
+                    operand_1=BinaryNumber.from_int(
+                        decimal_num=2, packed=packed),
+                    operand_2=BinaryNumber.from_int(decimal_num=20),
+                    operation='**'))
+            self.assertEqual(result.to_int(), 1048576)
+            self.assertEqual(result.is_packed, packed)
+    
+    def test_15_prepared_divisor(self) -> None:
+        """Test division instructions with a prepared divisor."""
+        divisor = BinaryNumber.from_int(decimal_num=(1 << 130) + 12345)
+        prepared = self.executor.prepare_divisor(divisor=divisor)
+        for dividend in [0, 12345, 1 << 129, 3 ** 200]:
+            operand_1 = BinaryNumber.from_int(decimal_num=dividend)
+            for symbol in ['/', '%', '/%']:
+                instruction = BinaryInstruction(
+                    operand_1=operand_1,
+                    operand_2=divisor,
+                    operation=symbol)
+                self.assertEqual(
+                    self.executor.calculate(
+                        instruction=instruction,
+                        prepared_divisor=prepared),
+                    self.executor.calculate(instruction=instruction))
+        with self.assertRaises(ValueError):
+            self.executor.calculate(
+                instruction=BinaryInstruction(
+                    operand_1=divisor,
+                    operand_2=BinaryNumber(binary_str='11'),
+                    operation='/'),
+                prepared_divisor=prepared)
+        with self.assertRaises(ValueError):
+            self.executor.calculate(
+                instruction=BinaryInstruction(
+                    operand_1=divisor,
+                    operand_2=divisor,
+                    operation='*'),
+                prepared_divisor=prepared)
+    
+    def test_16_calculate_batch(self) -> None:
+        """Test batches with recurring multipliers and divisors."""
+        stride = BinaryNumber.from_int(decimal_num=(1 << 128) - 1)
+        divisor = BinaryNumber.from_int(decimal_num=3 ** 50, packed=True)
+        instructions = []
+        for value in [0, 5, 1 << 70, 3 ** 90]:
+            operand = BinaryNumber.from_int(decimal_num=value)
+            instructions.append(BinaryInstruction(
+                operand_1=operand, operand_2=stride, operation='*'))
+            instructions.append(BinaryInstruction(
+                operand_1=operand, operand_2=divisor, operation='/%'))
+            instructions.append(BinaryInstruction(
+                operand_1=operand, operand_2=divisor, operation='%'))
+            instructions.append(BinaryInstruction(
+                operand_1=operand, operand_2=operand, operation='+'))
+        results = self.executor.calculate_batch(instructions=instructions)
+        self.assertEqual(
+            results,
+            [self.executor.calculate(instruction=instruction)
+             for instruction in instructions])
+        self.assertFalse(results[0].is_packed)
+        self.assertTrue(results[2].is_packed)
+        multiplier = self.executor.compile_multiplier(multiplier=stride)
+        with self.assertRaises(ValueError):
+            self.executor.calculate(
+                instruction=BinaryInstruction(
+                    operand_1=stride,
+                    operand_2=BinaryNumber(binary_str='11'),
+                    operation='*'),
+                constant_multiplier=multiplier)
+        with self.assertRaises(ZeroDivisionError):
+            self.executor.calculate_batch(instructions=[
+                BinaryInstruction(
+                    operand_1=stride,
+                    operand_2=BinaryNumber(binary_str='0'),
+                    operation='/')] * 2)
+    
+    def test_17_multiply_add(self) -> None:
+        """Test three-operand '*+' instructions and their validation."""
+        instruction = BinaryInstruction(
+            operand_1=BinaryNumber(binary_str='11'),
+            operand_2=BinaryNumber(binary_str='100'),
+            operand_3=BinaryNumber(binary_str='1000'),
+            operation='*+')
+        output = p_io.StringIO()
+        with p_ctx.redirect_stdout(output):
+            result = self.executor.calculate(
+                instruction=instruction, print_result=True)
+        self.assertEqual(result.value, '10100')
+        self.assertEqual(
+            output.getvalue().splitlines(),
+            ['     11', '*   100', '+  1000', '--------', '   10100',
+             '========'])
+        with self.assertRaises(ValueError):
+            BinaryInstruction(
+                operand_1=BinaryNumber(binary_str='11'),
+                operand_2=BinaryNumber(binary_str='100'),
+                operation='*+')
+        with self.assertRaises(ValueError):
+            BinaryInstruction(
+                operand_1=BinaryNumber(binary_str='11'),
+                operand_2=BinaryNumber(binary_str='100'),
+                operand_3=BinaryNumber(binary_str='1'),
+                operation='*')
+        with self.assertRaises(TypeError):
+            BinaryInstruction(
+                operand_1=BinaryNumber(binary_str='11'),
+                operand_2=BinaryNumber(binary_str='100'),
+                operand_3='1',
+                operation='*+')
+        
+        # The setter checks operand_3 against the current operation
+        with self.assertRaises(ValueError):
+            instruction.operand_3 = None
+        self.assertEqual(instruction.operand_3.value, '1000')
+        addition = BinaryInstruction(
+            operand_1=BinaryNumber(binary_str='11'),
+            operand_2=BinaryNumber(binary_str='100'),
+            operation='+')
+        with self.assertRaises(ValueError):
+            addition.operand_3 = BinaryNumber(binary_str='1')
+        self.assertIsNone(addition.operand_3)
+        
+        # set_operation() switches into and out of '*+' in one step
+        addition.set_operation(
+            operation='*+', operand_3=BinaryNumber(binary_str='1'))
+        self.assertEqual(addition.operation.symbol, '*+')
+        self.assertEqual(addition.operand_3.value, '1')
+        self.assertEqual(
+            self.executor.calculate(instruction=addition).value, '1101')
+        addition.set_operation(operation='-')
+        self.assertEqual(addition.operation.symbol, '-')
+        self.assertIsNone(addition.operand_3)
+        with self.assertRaises(ValueError):
+            addition.set_operation(operation='*+')
+        with self.assertRaises(ValueError):
+            addition.set_operation(
+                operation='+', operand_3=BinaryNumber(binary_str='1'))
+        self.assertEqual(addition.operation.symbol, '-')
+    
+    def test_18_calculate_array(self) -> None:
+        """Test element-wise calculations over BinaryNumberArray."""
+        values = [3 ** power for power in range(60)]
+        numbers = BinaryNumberArray.from_ints(decimal_nums=values)
+        divisor = BinaryNumber.from_int(decimal_num=2 ** 70 + 11)
+        
+        remainders = self.executor.calculate_array(
+            operands_1=numbers, operation='%', operands_2=divisor)
+        self.assertIsInstance(remainders, BinaryNumberArray)
+        self.assertEqual(
+            remainders.to_ints(), [value % (2 ** 70 + 11) for value in values])
+        
+        quotients, remainders = self.executor.calculate_array(
+            operands_1=numbers, operation='/%', operands_2=numbers[::-1])
+        self.assertEqual(
+            quotients.to_ints(),
+            [a // b for a, b in zip(values, reversed(values))])
+        self.assertEqual(
+            remainders.to_ints(),
+            [a % b for a, b in zip(values, reversed(values))])
+        
+        products = self.executor.calculate_array(
+            operands_1=numbers[:10], operation='*', operands_2=numbers[10:20])
+        self.assertEqual(
+            products.to_ints(),
+            [a * b for a, b in zip(values[:10], values[10:20])])
+        with self.assertRaises(ValueError):
+            self.executor.calculate_array(
+                operands_1=numbers, operation='+', operands_2=numbers[1:])
+        with self.assertRaises(ValueError):
+            self.executor.calculate_array(
+                operands_1=numbers, operation='<', operands_2=divisor)
 
 
 if __name__ == '__main__':
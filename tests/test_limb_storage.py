@@ -0,0 +1,457 @@
+"""Unit tests for the packed limb storage backend of BinaryNumber."""
+
+import unittest as p_ut
+import math as p_math
+import random as p_rnd
+import mmap as p_mmap
+import pickle as p_pickle
+import copy as p_copy
+from binary_calculator import (
+    ArithmeticCalculator,
+    BinaryComparator,
+    BinaryInstruction,
+    BinaryNormalizer,
+    BinaryNumber,
+    BinaryNumberArray,
+    BinaryPacker,
+    InstructionExecutor,
+    LimbArithmetic,
+    MontgomeryContext)
+
+
+class TestBinaryPacker(p_ut.TestCase):
+    """Test suite for BinaryPacker pack/unpack round trips."""
+    
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        self.packer = BinaryPacker()
+    
+    def test_01_pack_limb_boundaries(self) -> None:
+        """Test packing around the 64-bit limb boundary."""
+        self.assertEqual(list(self.packer.pack(binary_str='0')), [])
+        self.assertEqual(list(self.packer.pack(binary_str='1' * 64)),
+                         [2 ** 64 - 1])
+        self.assertEqual(list(self.packer.pack(binary_str='1' + '0' * 64)),
+                         [0, 1])
+        self.assertEqual(list(self.packer.pack(binary_str='000101')), [5])
+    
+    def test_02_round_trip_random(self) -> None:
+        """Test that unpack(pack(x)) restores random binary strings."""
+        rng = p_rnd.Random(1)
+        for bits in [1, 63, 64, 65, 127, 128, 129, 1000]:
+            value = rng.getrandbits(bits) | (1 << (bits - 1))
+            binary_str = bin(value)[2:]
+            limbs = self.packer.pack(binary_str=binary_str)
+            self.assertEqual(
+                self.packer.unpack(limbs=limbs),
+                binary_str,
+                msg=f"Failed for {bits} bits")
+            self.assertEqual(self.packer.bit_length(limbs=limbs), bits)
+    
+    def test_03_unpack_width(self) -> None:
+        """Test that unpack pads to the requested width."""
+        self.assertEqual(self.packer.unpack(limbs=[]), '0')
+        self.assertEqual(self.packer.unpack(limbs=[], width=3), '000')
+        self.assertEqual(self.packer.unpack(limbs=[5], width=5), '00101')
+    
+    def test_04_bytes_round_trip(self) -> None:
+        """Test from_bytes/to_bytes against int.from_bytes/int.to_bytes."""
+        rng = p_rnd.Random(24)
+        for size in [0, 1, 7, 8, 9, 16, 17, 100]:
+            value = rng.getrandbits(size * 8) if size else 0
+            for byteorder in ['big', 'little']:
+                data = value.to_bytes(size, byteorder)
+                for buffer in [data, bytearray(data), memoryview(data)]:
+                    limbs = self.packer.from_bytes(
+                        buffer=buffer, byteorder=byteorder)
+                    self.assertEqual(
+                        self.packer.unpack(limbs=limbs), bin(value)[2:],
+                        msg=f"Failed for {size} bytes, {byteorder}")
+                self.assertEqual(
+                    self.packer.to_bytes(
+                        limbs=limbs,
+                        byteorder=byteorder,
+                        length=size + 3),
+                    value.to_bytes(size + 3, byteorder))
+        self.assertEqual(self.packer.to_bytes(limbs=[]), b'\x00')
+        self.assertEqual(self.packer.to_bytes(limbs=[258]), b'\x01\x02')
+        with self.assertRaises(ValueError):
+            self.packer.to_bytes(limbs=[258], length=1)
+        with self.assertRaises(ValueError):
+            self.packer.from_bytes(buffer=b'1', byteorder='native')
+
+
+class TestPackedBinaryNumber(p_ut.TestCase):
+    """Test suite for BinaryNumber with the packed storage backend."""
+    
+    def test_01_value_is_materialized(self) -> None:
+        """Test that packed numbers render their original string."""
+        num = BinaryNumber(binary_str='0101', packed=True)
+        self.assertTrue(num.is_packed)
+        self.assertEqual(num.value, '0101')
+        self.assertEqual(str(num), '0101')
+        self.assertEqual(num.to_int(), 5)
+        self.assertEqual(num.bit_length(), 3)
+    
+    def test_02_from_int_and_limbs(self) -> None:
+        """Test packed factory methods."""
+        num = BinaryNumber.from_int(decimal_num=2 ** 70 + 3, packed=True)
+        self.assertEqual(list(num.limbs), [3, 64])
+        self.assertEqual(BinaryNumber.from_limbs(limbs=[3, 64, 0]), num)
+        self.assertEqual(BinaryNumber.from_limbs(limbs=[]).value, '0')
+    
+    def test_03_incr_decr_copy(self) -> None:
+        """Test in-place operations keep the packed backend."""
+        num = BinaryNumber(binary_str='1' * 64, packed=True)
+        num.incr()
+        self.assertEqual(num.value, '1' + '0' * 64)
+        num.decr()
+        self.assertEqual(num.value, '1' * 64)
+        copy = num.copy()
+        self.assertTrue(copy.is_packed)
+        self.assertEqual(copy, num)
+        with self.assertRaises(ValueError):
+            BinaryNumber(binary_str='0', packed=True).decr()
+        
+        # Results drop the zero padding like the string backend does
+        for binary_str, method in [('0011', 'incr'), ('1000', 'decr'),
+                                   ('0' * 70 + '1', 'incr')]:
+            packed = BinaryNumber(binary_str=binary_str, packed=True)
+            plain = BinaryNumber(binary_str=binary_str)
+            getattr(packed, method)()
+            getattr(plain, method)()
+            self.assertEqual(packed.value, plain.value)
+    
+    def test_04_comparisons_mixed_backends(self) -> None:
+        """Test comparisons between packed and string numbers."""
+        packed = BinaryNumber(binary_str='1' + '0' * 64, packed=True)
+        plain = BinaryNumber(binary_str='0' + '1' * 64)
+        self.assertTrue(packed > plain)
+        self.assertTrue(plain < packed)
+        self.assertEqual(plain.to_packed(), plain)
+        self.assertNotEqual(packed, plain)
+    
+    def test_05_bytes_and_buffers(self) -> None:
+        """Test byte and buffer interop, including an mmap source."""
+        value = 2 ** 100 + 2 ** 64 + 5
+        with p_mmap.mmap(-1, 64) as log:
+            log[8:24] = value.to_bytes(16, 'little')
+            num = BinaryNumber.from_bytes(
+                buffer=memoryview(log)[8:24], byteorder='little')
+            self.assertTrue(num.is_packed)
+            self.assertEqual(num.to_int(), value)
+        plain = BinaryNumber.from_bytes(
+            buffer=value.to_bytes(20, 'big'), packed=False)
+        self.assertFalse(plain.is_packed)
+        self.assertEqual(plain, num)
+        self.assertEqual(num.to_bytes(), value.to_bytes(13, 'big'))
+        self.assertEqual(
+            plain.to_bytes(byteorder='little', length=16),
+            value.to_bytes(16, 'little'))
+        
+        view = num.to_memoryview()
+        self.assertTrue(view.readonly)
+        self.assertEqual(view.format, 'Q')
+        self.assertEqual(view.tolist(), [5, 2 ** 36 + 1])
+        num.incr()
+        self.assertEqual(view.tolist(), [5, 2 ** 36 + 1])
+        self.assertEqual(num.__buffer__(0).tolist(), [6, 2 ** 36 + 1])
+        
+        readonly = BinaryPacker.readonly_view(buffer=num.limbs)
+        self.assertTrue(readonly.readonly)
+        self.assertEqual(readonly.tolist(), [6, 2 ** 36 + 1])
+        with self.assertRaises(TypeError):
+            readonly[0] = 7
+
+
+class TestLimbHelpers(p_ut.TestCase):
+    """Test suite for limb helpers of the comparator and normalizer."""
+    
+    def test_01_compare_limbs(self) -> None:
+        """Test compare_limbs ignores high zero limbs."""
+        comparator = BinaryComparator()
+        self.assertEqual(
+            comparator.compare_limbs(limbs_1=[5, 0], limbs_2=[5]), 0)
+        self.assertEqual(
+            comparator.compare_limbs(limbs_1=[0, 1], limbs_2=[7]), 1)
+        self.assertEqual(
+            comparator.compare_limbs(limbs_1=[7, 1], limbs_2=[8, 1]), -1)
+    
+    def test_02_normalize_limbs(self) -> None:
+        """Test limb normalization helpers."""
+        normalizer = BinaryNormalizer()
+        self.assertEqual(
+            normalizer.remove_leading_zero_limbs(limbs=[5, 0, 0]), [5])
+    
+    def test_03_divide_exact(self) -> None:
+        """Test exact division by small odd constants."""
+        rng = p_rnd.Random(11)
+        for divisor in [1, 3, 5, 9, 2 ** 63 + 1]:
+            quotient = rng.getrandbits(700)
+            limbs = BinaryNumber.from_int(
+                decimal_num=quotient * divisor, packed=True).limbs
+            result = LimbArithmetic.divide_exact(
+                limbs=limbs, divisor=divisor)
+            self.assertEqual(
+                BinaryNumber.from_limbs(limbs=result).to_int(), quotient)
+        with self.assertRaises(ValueError):
+            LimbArithmetic.divide_exact(limbs=[4], divisor=2)
+    
+    def test_04_montgomery_context(self) -> None:
+        """Test Montgomery products and powers against Python integers."""
+        rng = p_rnd.Random(12)
+        for bits in [5, 64, 65, 200, 640]:
+            modulus = rng.getrandbits(bits) | 1 | (1 << (bits - 1))
+            context = MontgomeryContext(
+                modulus=BinaryNumber.from_int(
+                    decimal_num=modulus, packed=True).limbs)
+            # Montgomery products satisfy product * R = a * b (mod modulus)
+            r_shift = 64 * len(context.modulus)
+            for _ in range(5):
+                a = rng.randrange(modulus)
+                b = rng.randrange(modulus)
+                limbs_1 = BinaryNumber.from_int(
+                    decimal_num=a, packed=True).limbs
+                limbs_2 = BinaryNumber.from_int(
+                    decimal_num=b, packed=True).limbs
+                product = context.multiply(limbs_1=limbs_1, limbs_2=limbs_2)
+                product_int = BinaryNumber.from_limbs(limbs=product).to_int()
+                self.assertLess(product_int, modulus)
+                self.assertEqual(
+                    (product_int << r_shift) % modulus, a * b % modulus)
+                self.assertEqual(
+                    context.from_montgomery(
+                        limbs=context.to_montgomery(limbs=limbs_1)),
+                    list(limbs_1))
+                power = context.pow(base=limbs_1, exponent=limbs_2)
+                self.assertEqual(
+                    BinaryNumber.from_limbs(limbs=power).to_int(),
+                    pow(a, b, modulus))
+        for modulus in [[], [4]]:
+            with self.assertRaises(ValueError):
+                MontgomeryContext(modulus=modulus)
+    
+    def test_05_gcd_kernels(self) -> None:
+        """Test Stein, Lehmer and extended GCD kernels agree."""
+        rng = p_rnd.Random(13)
+        for bits in [1, 64, 65, 500, 1500]:
+            common = rng.getrandbits(bits // 3 + 1)
+            a = rng.getrandbits(bits) * common
+            b = rng.getrandbits(bits) * common
+            limbs_1 = BinaryNumber.from_int(decimal_num=a, packed=True).limbs
+            limbs_2 = BinaryNumber.from_int(decimal_num=b, packed=True).limbs
+            expected = p_math.gcd(a, b)
+            for result in [
+                    LimbArithmetic.gcd_binary(
+                        limbs_1=limbs_1, limbs_2=limbs_2),
+                    LimbArithmetic.gcd_lehmer(
+                        limbs_1=limbs_1, limbs_2=limbs_2, threshold=2)]:
+                self.assertEqual(
+                    BinaryNumber.from_limbs(limbs=result).to_int(), expected)
+            divisor, (sign_x, x), (sign_y, y) = LimbArithmetic.extended_gcd(
+                limbs_1=limbs_1, limbs_2=limbs_2)
+            self.assertEqual(
+                a * sign_x * BinaryNumber.from_limbs(limbs=x).to_int()
+                + b * sign_y * BinaryNumber.from_limbs(limbs=y).to_int(),
+                BinaryNumber.from_limbs(limbs=divisor).to_int())
+    
+    def test_06_truncated_products(self) -> None:
+        """Test multiply_low and multiply_high error bounds."""
+        rng = p_rnd.Random(14)
+        for limbs_count_1, limbs_count_2 in [(1, 1), (3, 2), (5, 5), (9, 4)]:
+            a = rng.getrandbits(64 * limbs_count_1)
+            b = rng.getrandbits(64 * limbs_count_2)
+            limbs_1 = BinaryNumber.from_int(decimal_num=a, packed=True).limbs
+            limbs_2 = BinaryNumber.from_int(decimal_num=b, packed=True).limbs
+            for size in range(limbs_count_1 + limbs_count_2 + 1):
+                low = LimbArithmetic.multiply_low(
+                    limbs_1=limbs_1, limbs_2=limbs_2, size=size)
+                self.assertEqual(
+                    BinaryNumber.from_limbs(limbs=low).to_int(),
+                    a * b % (1 << (64 * size)))
+                high = LimbArithmetic.multiply_high(
+                    limbs_1=limbs_1, limbs_2=limbs_2, size=size)
+                expected = a * b >> (64 * size)
+                self.assertIn(
+                    BinaryNumber.from_limbs(limbs=high).to_int(),
+                    [expected, expected - 1])
+    
+    def test_07_multiply_add_kernel(self) -> None:
+        """Test the fused multiply-add kernel with long carry chains."""
+        rng = p_rnd.Random(15)
+        cases = [(0, 0, 0), (0, 3, 1 << 100), ((1 << 64) - 1, 1, 1),
+                 ((1 << 192) - 1, (1 << 128) - 1, (1 << 500) - 1)]
+        for _ in range(20):
+            cases.append((
+                rng.getrandbits(rng.randrange(400)),
+                rng.getrandbits(rng.randrange(400)),
+                rng.getrandbits(rng.randrange(900))))
+        for a, b, c in cases:
+            limbs = LimbArithmetic.multiply_add(
+                limbs_1=BinaryNumber.from_int(decimal_num=a, packed=True).limbs,
+                limbs_2=BinaryNumber.from_int(decimal_num=b, packed=True).limbs,
+                limbs_3=BinaryNumber.from_int(decimal_num=c, packed=True).limbs)
+            self.assertEqual(
+                BinaryNumber.from_limbs(limbs=limbs).to_int(), a * b + c)
+
+
+class TestPackedArithmetic(p_ut.TestCase):
+    """Test suite for calculator and executor paths on packed operands."""
+    
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        self.calculator = ArithmeticCalculator()
+        self.rng = p_rnd.Random(7)
+    
+    def _random_pair(self, *, bits_1: int, bits_2: int) -> tuple:
+        """Create a random pair of positive integers."""
+        return (
+            self.rng.getrandbits(bits_1) | 1,
+            self.rng.getrandbits(bits_2) | 1)
+    
+    def test_01_add_subtract(self) -> None:
+        """Test packed addition and subtraction against int arithmetic."""
+        for bits in [8, 64, 65, 200, 1000]:
+            a, b = self._random_pair(bits_1=bits, bits_2=bits // 2 + 1)
+            num_a = BinaryNumber.from_int(decimal_num=a, packed=True)
+            num_b = BinaryNumber.from_int(decimal_num=b, packed=True)
+            total = self.calculator.add(operand_1=num_a, operand_2=num_b)
+            self.assertTrue(total.is_packed)
+            self.assertEqual(total.to_int(), a + b)
+            diff = self.calculator.subtract(operand_1=num_a, operand_2=num_b)
+            self.assertEqual(diff.to_int(), a - b)
+        with self.assertRaises(ValueError):
+            self.calculator.subtract(
+                operand_1=BinaryNumber(binary_str='1', packed=True),
+                operand_2=BinaryNumber(binary_str='10', packed=True))
+    
+    def test_02_multiply_divide(self) -> None:
+        """Test packed multiplication and division against int arithmetic."""
+        for bits_1, bits_2 in [(64, 64), (300, 70), (500, 130), (129, 128)]:
+            a, b = self._random_pair(bits_1=bits_1, bits_2=bits_2)
+            num_a = BinaryNumber.from_int(decimal_num=a, packed=True)
+            num_b = BinaryNumber.from_int(decimal_num=b)
+            product = self.calculator.multiply(
+                operand_1=num_a, operand_2=num_b)
+            self.assertEqual(product.to_int(), a * b)
+            quotient = self.calculator.divide(
+                operand_1=num_a, operand_2=num_b)
+            self.assertTrue(quotient.is_packed)
+            self.assertEqual(quotient.to_int(), a // b)
+        with self.assertRaises(ZeroDivisionError):
+            self.calculator.divide(
+                operand_1=BinaryNumber(binary_str='1', packed=True),
+                operand_2=BinaryNumber(binary_str='0', packed=True))
+    
+    def test_03_executor_packed(self) -> None:
+        """Test that the executor handles packed operands."""
+        executor = InstructionExecutor()
+        operand_1 = BinaryNumber(binary_str='1' * 70, packed=True)
+        operand_2 = BinaryNumber(binary_str='1', packed=True)
+        result = executor.calculate(instruction=BinaryInstruction(
+            operand_1=operand_1, operand_2=operand_2, operation='+'))
+        self.assertEqual(result.value, '1' + '0' * 70)
+        self.assertTrue(executor.compare(instruction=BinaryInstruction(
+            operand_1=operand_2, operand_2=operand_1, operation='<')))
+        self.assertFalse(executor.compare(instruction=BinaryInstruction(
+            operand_1=operand_2, operand_2=operand_1, operation='==')))
+
+
+
+class TestBinaryNumberArray(p_ut.TestCase):
+    """Test suite for the BinaryNumberArray columnar container."""
+    
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        rng = p_rnd.Random(25)
+        self.values_1 = [
+            rng.getrandbits(bits) if bits else 0
+            for bits in [0, 1, 63, 64, 65, 200] * 20]
+        self.values_2 = [
+            rng.getrandbits(bits) if bits else 0
+            for bits in [64, 0, 200, 1, 65, 63] * 20]
+        self.array_1 = BinaryNumberArray.from_ints(decimal_nums=self.values_1)
+        self.array_2 = BinaryNumberArray.from_ints(decimal_nums=self.values_2)
+    
+    def test_01_storage_and_views(self) -> None:
+        """Test construction, indexing, iteration and zero-copy slices."""
+        self.assertEqual(len(self.array_1), 120)
+        self.assertEqual(self.array_1.to_ints(), self.values_1)
+        self.assertEqual(
+            [number.to_int() for number in self.array_1], self.values_1)
+        self.assertEqual(self.array_1[-1].to_int(), self.values_1[-1])
+        with self.assertRaises(IndexError):
+            self.array_1[120]
+        
+        part = self.array_1[100:3:-7]
+        self.assertEqual(part.to_ints(), self.values_1[100:3:-7])
+        self.assertIs(part._data.obj, self.array_1._data.obj)
+        self.assertEqual(part.copy().to_ints(), self.values_1[100:3:-7])
+        
+        view = self.array_1[4]
+        self.assertTrue(view.is_packed)
+        for clone in [p_pickle.loads(p_pickle.dumps(view)),
+                      p_copy.deepcopy(view), p_copy.copy(view)]:
+            self.assertTrue(clone.is_packed)
+            self.assertEqual(clone.to_int(), self.values_1[4])
+        self.assertEqual(view, BinaryNumber.from_int(
+            decimal_num=self.values_1[4]))
+        view.incr()
+        self.assertEqual(self.array_1[4].to_int(), self.values_1[4])
+        
+        for clone in [p_pickle.loads(p_pickle.dumps(part)),
+                      p_copy.deepcopy(part), p_copy.copy(part)]:
+            self.assertEqual(clone.to_ints(), self.values_1[100:3:-7])
+            self.assertTrue(clone._data.readonly)
+            self.assertEqual(len(clone._data), sum(clone._lengths))
+        
+        numbers = BinaryNumberArray(numbers=[
+            BinaryNumber(binary_str='0011'),
+            BinaryNumber(binary_str='1' * 70, packed=True)])
+        self.assertEqual(numbers.to_ints(), [3, 2 ** 70 - 1])
+        with self.assertRaises(ValueError):
+            BinaryNumberArray.from_ints(decimal_nums=[1, -1])
+    
+    def test_02_element_wise_add_subtract(self) -> None:
+        """Test add/subtract against arrays and scalars."""
+        sums = self.array_1.add(other=self.array_2)
+        self.assertEqual(
+            sums.to_ints(),
+            [a + b for a, b in zip(self.values_1, self.values_2)])
+        self.assertEqual(
+            sums.subtract(other=self.array_2).to_ints(), self.values_1)
+        
+        scalar = BinaryNumber.from_int(decimal_num=2 ** 64 - 1)
+        self.assertEqual(
+            self.array_1.add(other=scalar).to_ints(),
+            [a + 2 ** 64 - 1 for a in self.values_1])
+        with self.assertRaises(ValueError):
+            self.array_1.subtract(other=scalar)
+        with self.assertRaises(ValueError):
+            self.array_1.add(other=self.array_2[1:])
+        with self.assertRaises(TypeError):
+            self.array_1.add(other='1')
+    
+    def test_03_element_wise_compare(self) -> None:
+        """Test compare against arrays and scalars for every operation."""
+        scalar = 2 ** 64 + 5
+        for operation, check in [
+                ('<', lambda a, b: a < b), ('<=', lambda a, b: a <= b),
+                ('>', lambda a, b: a > b), ('>=', lambda a, b: a >= b),
+                ('==', lambda a, b: a == b), ('!=', lambda a, b: a != b)]:
+            self.assertEqual(
+                self.array_1.compare(
+                    other=self.array_2, operation=operation),
+                [check(a, b) for a, b in zip(self.values_1, self.values_2)],
+                msg=f"Failed for {operation}")
+            self.assertEqual(
+                self.array_1.compare(
+                    other=BinaryNumber.from_int(decimal_num=scalar),
+                    operation=operation),
+                [check(a, scalar) for a in self.values_1],
+                msg=f"Failed for {operation}")
+        with self.assertRaises(ValueError):
+            self.array_1.compare(other=self.array_2, operation='+')
+
+if __name__ == '__main__':
+    p_ut.main()